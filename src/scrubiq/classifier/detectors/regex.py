@@ -17,12 +17,18 @@ class Pattern:
     confidence_base: float
     validator: Optional[Callable[[str], bool]] = None
     test_patterns: list[str] = field(default_factory=list)
+    # Cheap search that must hit for `regex` to match anywhere in the text;
+    # patterns sharing one prefilter reuse its result within a detect() call
+    prefilter: Optional[re.Pattern] = None
 
 
 # =============================================================================
 # Validators
 # =============================================================================
 
+_NON_DIGIT = re.compile(r"\D")
+_NON_ASCII_DIGIT = re.compile(r"[^0-9]")
+
 
 def validate_ssn(value: str) -> bool:
     """
@@ -33,7 +39,7 @@ def validate_ssn(value: str) -> bool:
     - Group number (middle 2): cannot be 00
     - Serial number (last 4): cannot be 0000
     """
-    digits = re.sub(r"[^\d]", "", value)
+    digits = _NON_DIGIT.sub("", value)
     if len(digits) != 9:
         return False
 
@@ -56,24 +62,26 @@ def validate_ssn(value: str) -> bool:
     return True
 
 
+# Digit sum of 2*d for each digit d (always a single digit: 0,2,4,6,8,1,3,5,7,9)
+_LUHN_DOUBLE = str.maketrans("0123456789", "0246813579")
+
+
 def luhn_check(value: str) -> bool:
     """
     Luhn algorithm for credit card validation.
 
     Returns True if the number passes the Luhn checksum.
     """
-    digits = [int(d) for d in re.sub(r"[^\d]", "", value)]
+    digits = _NON_ASCII_DIGIT.sub("", value)
 
     if len(digits) < 13 or len(digits) > 19:
         return False
 
-    # Luhn algorithm
-    odd_digits = digits[-1::-2]
-    even_digits = digits[-2::-2]
-
-    checksum = sum(odd_digits)
-    for d in even_digits:
-        checksum += sum(divmod(d * 2, 10))
+    # Every second digit from the right is doubled; translate() does that
+    # (and the carry) for the whole slice. The digit sum is then the ASCII
+    # byte sum minus ord("0") per digit, all in C
+    summed = digits[-1::-2] + digits[-2::-2].translate(_LUHN_DOUBLE)
+    checksum = sum(summed.encode("ascii")) - 48 * len(summed)
 
     return checksum % 10 == 0
 
@@ -82,21 +90,25 @@ def luhn_check(value: str) -> bool:
 # Pattern Definitions
 # =============================================================================
 
+# Every digit-based pattern needs at least one digit
+_HAS_DIGIT = re.compile(r"\d")
+
 SSN_PATTERN = Pattern(
     name="us_ssn",
     entity_type=EntityType.SSN,
+    # The lookaheads encode every validate_ssn rule, so matches need no
+    # validator call. ASCII digits keep them exact (validate_ssn int()s digits)
     regex=re.compile(
         r"\b"
-        r"(?!000|666|9\d{2})"  # Area cannot be 000, 666, 900-999
-        r"([0-8]\d{2}|7([0-6]\d|7[012]))"  # Valid area numbers
+        r"(?!000|666|9[0-9]{2})"  # Area cannot be 000, 666, 900-999
+        r"([0-8][0-9]{2}|7([0-6][0-9]|7[012]))"  # Valid area numbers
         r"[-\s]?"
-        r"(?!00)\d{2}"  # Group cannot be 00
+        r"(?!00)[0-9]{2}"  # Group cannot be 00
         r"[-\s]?"
-        r"(?!0000)\d{4}"  # Serial cannot be 0000
+        r"(?!0000)[0-9]{4}"  # Serial cannot be 0000
         r"\b"
     ),
     confidence_base=0.75,
-    validator=validate_ssn,
     test_patterns=[
         "123-45-6789",
         "000-00-0000",
@@ -109,6 +121,7 @@ SSN_PATTERN = Pattern(
         "123-12-1234",
         "987-65-4321",
     ],
+    prefilter=_HAS_DIGIT,
 )
 
 CREDIT_CARD_PATTERN = Pattern(
@@ -134,12 +147,15 @@ CREDIT_CARD_PATTERN = Pattern(
         "5555555555554444",  # MC test
         "378282246310005",  # Amex test
     ],
+    prefilter=_HAS_DIGIT,
 )
 
 EMAIL_PATTERN = Pattern(
     name="email",
     entity_type=EntityType.EMAIL,
-    regex=re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+    # \b fencing matters: without it the local-part run backtracks from every
+    # position inside long alphanumeric tokens (~70x slower on hex-like text)
+    regex=re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
     confidence_base=0.90,
     test_patterns=[
         "test@example.com",
@@ -151,6 +167,7 @@ EMAIL_PATTERN = Pattern(
         "foo@bar.test",
         "example@example.com",
     ],
+    prefilter=re.compile("@"),
 )
 
 PHONE_PATTERN = Pattern(
@@ -173,6 +190,7 @@ PHONE_PATTERN = Pattern(
         "123-456-7890",
         "000-000-0000",
     ],
+    prefilter=_HAS_DIGIT,
 )
 
 # Medical Record Number (MRN) pattern
@@ -195,6 +213,7 @@ MRN_PATTERN = Pattern(
         "MRN-11111111",
         "MRN00000000",
     ],
+    prefilter=re.compile(r"mrn|m\.r\.n", re.IGNORECASE),
 )
 
 # Health Plan ID pattern
@@ -216,6 +235,7 @@ HEALTH_PLAN_PATTERN = Pattern(
         "HP1111111111",
         "HP1234567890",
     ],
+    prefilter=re.compile(r"hp|health", re.IGNORECASE),
 )
 
 # All patterns to check
@@ -264,10 +284,22 @@ class RegexDetector:
             List of Match objects for each detection.
         """
         matches = []
+        prefilter_hits: dict[re.Pattern, bool] = {}
 
         for pattern in self.patterns:
+            # Skip the full scan when the pattern's required text is absent
+            if pattern.prefilter is not None:
+                hit = prefilter_hits.get(pattern.prefilter)
+                if hit is None:
+                    hit = prefilter_hits[pattern.prefilter] = (
+                        pattern.prefilter.search(text) is not None
+                    )
+                if not hit:
+                    continue
+
             for m in pattern.regex.finditer(text):
                 value = m.group()
+                start, end = m.span()
 
                 # Run validator if present
                 if pattern.validator and not pattern.validator(value):
@@ -276,21 +308,20 @@ class RegexDetector:
                 # Check if this looks like test/example data
                 is_test = self._is_test_data(value, pattern.test_patterns)
 
-                # Get surrounding context (50 chars each side)
-                ctx_start = max(0, m.start() - 50)
-                ctx_end = min(len(text), m.end() + 50)
-                context = text[ctx_start:ctx_end]
+                # Get surrounding context (50 chars each side; slicing clamps the end)
+                context = text[max(0, start - 50) : end + 50]
 
                 matches.append(
                     Match(
                         entity_type=pattern.entity_type,
                         value=value,
-                        start=m.start(),
-                        end=m.end(),
+                        start=start,
+                        end=end,
                         confidence=pattern.confidence_base,
                         detector="regex",
                         context=context,
                         is_test_data=is_test,
+                        validated=pattern.validator is not None,
                     )
                 )
 
@@ -10,6 +10,26 @@ class ExtractionError(Exception):
     pass
 
 
+def get_extension(path: Path) -> str:
+    """
+    Get the lowercase extension used to route a file to an extractor.
+
+    Hidden files like .env, .gitignore have no suffix, so the whole
+    name is used as the "extension".
+    """
+    return get_name_extension(path.name)
+
+
+def get_name_extension(name: str) -> str:
+    """Same as get_extension, from a bare file name (no Path needed)."""
+    head, dot, ext = name.rpartition(".")
+    if not dot:
+        return ""
+    if not head:
+        return name.lower()
+    return "." + ext.lower()
+
+
 class Extractor(ABC):
     """Base class for text extractors."""
 
@@ -37,10 +57,4 @@ class Extractor(ABC):
 
     def can_handle(self, path: Path) -> bool:
         """Check if this extractor can handle the file."""
-        suffix = path.suffix.lower()
-
-        # Handle hidden files like .env, .gitignore (no suffix, name starts with dot)
-        if not suffix and path.name.startswith("."):
-            suffix = path.name.lower()  # Use whole name as "extension"
-
-        return suffix in self.extensions
+        return get_extension(path) in self.extensions
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-from .base import Extractor, ExtractionError
+from .base import Extractor, ExtractionError, get_extension
 from .text import TextExtractor
 from .docx import DocxExtractor
 from .xlsx import XlsxExtractor
@@ -43,17 +43,24 @@ class ExtractorRegistry:
             EmlExtractor(),
         ]
 
+        # Extension -> extractor; earlier extractors win on overlap
+        self._by_extension: dict[str, Extractor] = {}
+        for extractor in self.extractors:
+            for ext in extractor.extensions:
+                self._by_extension.setdefault(ext, extractor)
+
     def get_extractor(self, path: Path) -> Optional[Extractor]:
         """Find extractor for file type."""
-        for extractor in self.extractors:
-            if extractor.can_handle(path):
-                return extractor
-        return None
+        return self._by_extension.get(get_extension(path))
 
     def can_extract(self, path: Path) -> bool:
         """Check if we can extract text from this file."""
         return self.get_extractor(path) is not None
 
+    def supports_extension(self, ext: str) -> bool:
+        """Check if an extension (as from get_name_extension) is supported."""
+        return ext in self._by_extension
+
     def extract(self, path: Path) -> str:
         """
         Extract text from file.
@@ -75,7 +82,4 @@ class ExtractorRegistry:
     @property
     def supported_extensions(self) -> list[str]:
         """All supported file extensions."""
-        extensions = []
-        for extractor in self.extractors:
-            extensions.extend(extractor.extensions)
-        return sorted(set(extensions))
+        return sorted(self._by_extension)
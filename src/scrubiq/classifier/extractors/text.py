@@ -63,20 +63,19 @@ class TextExtractor(Extractor):
     def extract(self, path: Path) -> str:
         """Extract text with encoding fallback."""
         try:
-            # Try UTF-8 first (most common)
-            try:
-                return path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                pass
-
-            # Try UTF-8 with BOM
-            try:
-                return path.read_text(encoding="utf-8-sig")
-            except UnicodeDecodeError:
-                pass
+            # Read once and try each encoding on the bytes in memory
+            data = path.read_bytes()
+        except Exception as e:
+            raise ExtractionError(f"Failed to read {path}: {e}")
 
+        try:
+            # UTF-8 (most common); utf-8-sig also strips a leading BOM
+            text = data.decode("utf-8-sig")
+        except UnicodeDecodeError:
             # Fall back to latin-1 (never fails, but may mangle non-latin chars)
-            return path.read_text(encoding="latin-1")
+            text = data.decode("latin-1")
 
-        except Exception as e:
-            raise ExtractionError(f"Failed to read {path}: {e}")
+        # Match read_text()'s universal newlines
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
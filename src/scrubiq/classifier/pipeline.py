@@ -80,6 +80,8 @@ class ClassifierPipeline:
         presidio_threshold: float = 0.5,
         tpfp_model_path: Optional[Union[str, Path]] = None,
         tpfp_threshold: float = 0.5,
+        tpfp_backend: str = "torch",
+        tpfp_low_memory: bool = False,
     ):
         """
         Initialize classification pipeline.
@@ -89,6 +91,9 @@ class ClassifierPipeline:
             presidio_threshold: Minimum confidence for Presidio matches.
             tpfp_model_path: Path to trained TP/FP classifier model.
             tpfp_threshold: Confidence threshold for TP/FP filter.
+            tpfp_backend: TP/FP inference backend ("torch" or "onnx").
+            tpfp_low_memory: Load the TP/FP model for one of many worker
+                processes (see TPFPClassifier.load).
         """
         # Layer 1: Regex (always available)
         self.regex_detector = RegexDetector()
@@ -107,11 +112,30 @@ class ClassifierPipeline:
         self.tpfp_threshold = tpfp_threshold
         if tpfp_model_path and HAS_TPFP:
             try:
-                self.tpfp_classifier = TPFPClassifier.load(tpfp_model_path)
+                self.tpfp_classifier = TPFPClassifier.load(
+                    tpfp_model_path, backend=tpfp_backend, low_memory=tpfp_low_memory
+                )
             except Exception:
                 # Model load failed
                 pass
 
+    def save_caches(self) -> None:
+        """
+        Persist warm caches next to their models for later sessions.
+
+        Writes the TP/FP classifier's embedding cache into the model
+        directory it was loaded from, only when this session encoded
+        something new. A read-only model directory just means the next
+        session starts cold. The cache file is not encrypted (see
+        TPFPClassifier.save_embedding_cache).
+        """
+        tpfp = self.tpfp_classifier
+        if tpfp and tpfp.model_path and tpfp.unsaved_embeddings:
+            try:
+                tpfp.save_embedding_cache()
+            except OSError:
+                pass
+
     @property
     def has_presidio(self) -> bool:
         """Check if Presidio is active."""
@@ -167,14 +191,20 @@ class ClassifierPipeline:
         """
         Apply TP/FP classifier to filter false positives.
 
-        Updates match.is_test_data based on model prediction.
+        Updates match.is_test_data based on model prediction. Matches that
+        passed a checksum validator (match.validated) are kept without
+        running the model.
         """
         if not matches or not self.tpfp_classifier:
             return matches
 
+        uncertain = [m for m in matches if not m.validated]
+        if not uncertain:
+            return matches
+
         # Format contexts for batch prediction
         contexts = []
-        for match in matches:
+        for match in uncertain:
             # Format: replace value with [TOKEN]
             formatted = self.tpfp_classifier.format_match_context(
                 context=match.context,
@@ -187,7 +217,7 @@ class ClassifierPipeline:
         results = self.tpfp_classifier.predict_batch(contexts)
 
         # Update matches
-        for match, result in zip(matches, results):
+        for match, result in zip(uncertain, results):
             if result.is_false_positive and result.confidence >= self.tpfp_threshold:
                 # Mark as test data (will be filtered from real_matches)
                 match.is_test_data = True
@@ -38,6 +38,14 @@ def cli():
 )
 @click.option("--dry-run", is_flag=True, help="Show what labels would be applied without applying")
 @click.option("--quiet", "-q", is_flag=True, help="Minimal output")
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Files to scan in parallel (with Presidio, each worker loads its own NER model)",
+)
 def scan(
     path: str,
     output: str,
@@ -48,6 +56,7 @@ def scan(
     apply_labels: bool,
     dry_run: bool,
     quiet: bool,
+    workers: int,
 ):
     """Scan for sensitive data.
 
@@ -70,6 +79,8 @@ def scan(
         scrubiq scan ./documents --apply-labels --dry-run
 
         scrubiq scan ./documents --no-presidio  # Skip NER (faster)
+
+        scrubiq scan ./documents --workers 4  # Scan four files at a time
     """
     path_obj = Path(path).resolve()
 
@@ -101,12 +112,11 @@ def scan(
             console.print("\nContinuing scan without labeling...")
             apply_labels = False
 
-    scanner = Scanner(enable_presidio=presidio)
+    scanner = Scanner(enable_presidio=presidio, workers=workers)
     ui = ScanUI(quiet=quiet)
 
-    # Count files first
-    files = list(scanner._iter_files(path_obj))
-    total = len(files)
+    # Count files first (pathname-only walk; the scan walks again as it goes)
+    total = scanner.count_files(str(path_obj))
 
     if total == 0:
         print_warning("No scannable files found.")
@@ -115,9 +125,9 @@ def scan(
     if not quiet:
         print_info(f"Found {total} files to scan in {path_obj}")
         # Show Presidio status
-        if presidio and scanner.classifier.has_presidio:
+        if presidio and scanner.has_presidio:
             console.print("[dim]  NER: Presidio enabled (names, addresses)[/dim]")
-        elif presidio and not scanner.classifier.has_presidio:
+        elif presidio and not scanner.has_presidio:
             console.print(
                 "[dim]  NER: Presidio not available (install with: pip install scrubiq\\[nlp])[/dim]"
             )
@@ -243,7 +253,7 @@ def scan(
         else:
             # JSON format
             output_path = Path(output) if output else Path(f"scrubiq-results-{result.scan_id}.json")
-            output_path.write_text(json.dumps(result.to_dict(), indent=2))
+            output_path.write_text(result.to_json(), encoding="utf-8")
             print_success(f"Results saved to: {output_path}")
 
     # Show files with sensitive data
@@ -431,7 +441,13 @@ def report(scan_id: str, output: str, open_report: bool):
 
         scrubiq report abc123 --output report.html
     """
-    from ..scanner.results import ScanResult, FileResult, Match, EntityType, LabelRecommendation
+    from ..scanner.results import (
+        ENTITY_TYPE_BY_VALUE,
+        FileResult,
+        LabelRecommendation,
+        Match,
+        ScanResult,
+    )
     from datetime import datetime
 
     db = FindingsDatabase()
@@ -453,8 +469,7 @@ def report(scan_id: str, output: str, open_report: bool):
         source_type=scan.get("source_type", "filesystem"),
     )
 
-    # Get all files and findings
-    files_data = db.get_files(scan_id=scan_id)
+    # Get all findings, grouped by file
     findings_by_file: dict[str, list[dict]] = {}
 
     for finding in db.get_findings(scan_id=scan_id, decrypt=True):
@@ -464,14 +479,13 @@ def report(scan_id: str, output: str, open_report: bool):
         findings_by_file[file_path].append(finding)
 
     # Build FileResult objects
-    for file_data in files_data:
+    for file_data in db.get_files_iter(scan_id=scan_id):
         file_path = Path(file_data["file_path"])
 
         matches = []
         for f in findings_by_file.get(str(file_path), []):
-            try:
-                entity_type = EntityType(f["entity_type"])
-            except ValueError:
+            entity_type = ENTITY_TYPE_BY_VALUE.get(f["entity_type"])
+            if entity_type is None:
                 continue
 
             matches.append(
@@ -601,13 +615,32 @@ def review(scan_id: str, threshold: float, limit: int, show_stats: bool):
 
 @cli.command()
 @click.option("--nemotron", "-n", default=5000, help="Max examples from Nemotron-PII dataset")
+@click.option(
+    "--nemotron-path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Nemotron-PII JSONL export to read directly (skips the datasets library)",
+)
 @click.option("--fp-per-type", "-f", default=100, help="False positive examples per entity type")
 @click.option("--output", "-o", type=click.Path(), help="Output path for trained model")
 @click.option("--data-only", is_flag=True, help="Only prepare data, don't train")
 @click.option(
     "--iterations", "-i", default=20, help="Training iterations (more = better but slower)"
 )
-def train(nemotron: int, fp_per_type: int, output: str, data_only: bool, iterations: int):
+@click.option(
+    "--precision",
+    type=click.Choice(["fp32", "fp16"]),
+    default="fp32",
+    help="fp16 = mixed-precision training on CUDA GPUs",
+)
+def train(
+    nemotron: int,
+    nemotron_path: str,
+    fp_per_type: int,
+    output: str,
+    data_only: bool,
+    iterations: int,
+    precision: str,
+):
     """Train the TP/FP classifier to reduce false positives.
     
     This trains a model to distinguish real PII from test data,
@@ -631,9 +664,11 @@ def train(nemotron: int, fp_per_type: int, output: str, data_only: bool, iterati
         
         scrubiq train --nemotron 10000 --iterations 30
         
-        scrubiq train --data-only  # Just prepare dataset
+        scrubiq train --nemotron-path ./nemotron_pii.jsonl
+        
+        scrubiq train --data-only  # Just write <output>/training_data.jsonl
     """
-    from ..training.data import prepare_training_dataset
+    from ..training.data import prepare_training_dataset, write_training_dataset
     from ..training.model import TPFPClassifier, is_available
 
     # Check dependencies
@@ -643,15 +678,36 @@ def train(nemotron: int, fp_per_type: int, output: str, data_only: bool, iterati
         console.print("  pip install setfit datasets sentence-transformers")
         raise SystemExit(1)
 
+    if output:
+        output_path = Path(output)
+    else:
+        # Default location
+        from ..storage.database import get_data_dir
+
+        output_path = get_data_dir() / "models" / "tpfp-v1"
+
     # Prepare data
     console.print("[bold]Preparing training data...[/bold]\n")
 
     try:
-        examples = prepare_training_dataset(
-            nemotron_examples=nemotron,
-            fp_per_type=fp_per_type,
-            include_user_feedback=True,
-        )
+        if data_only:
+            # Stream straight to disk; nothing needs to stay in memory
+            data_path = output_path / "training_data.jsonl"
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            count = write_training_dataset(
+                str(data_path),
+                nemotron_examples=nemotron,
+                fp_per_type=fp_per_type,
+                include_user_feedback=True,
+                nemotron_path=nemotron_path,
+            )
+        else:
+            examples = prepare_training_dataset(
+                nemotron_examples=nemotron,
+                fp_per_type=fp_per_type,
+                include_user_feedback=True,
+                nemotron_path=nemotron_path,
+            )
     except ImportError as e:
         print_error(f"Failed to load data: {e}")
         console.print("\nMake sure to download Nemotron-PII first:")
@@ -664,7 +720,7 @@ def train(nemotron: int, fp_per_type: int, output: str, data_only: bool, iterati
         raise SystemExit(1)
 
     if data_only:
-        print_success("Data preparation complete.")
+        print_success(f"Wrote {count} examples to: {data_path}")
         return
 
     # Train model
@@ -677,20 +733,13 @@ def train(nemotron: int, fp_per_type: int, output: str, data_only: bool, iterati
             examples,
             num_iterations=iterations,
             show_progress=True,
+            precision=precision,
         )
     except Exception as e:
         print_error(f"Training failed: {e}")
         raise SystemExit(1)
 
     # Save model
-    if output:
-        output_path = Path(output)
-    else:
-        # Default location
-        from ..storage.database import get_data_dir
-
-        output_path = get_data_dir() / "models" / "tpfp-v1"
-
     classifier.save(output_path)
     print_success(f"Model saved to: {output_path}")
 
@@ -3,6 +3,7 @@
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
@@ -21,8 +22,8 @@ class ScanStats:
     with_matches: int = 0
     errors: int = 0
     current_file: str = ""
-    entity_counts: dict = field(default_factory=dict)
-    recent_matches: list = field(default_factory=list)
+    entity_counts: Counter = field(default_factory=Counter)
+    recent_matches: deque = field(default_factory=lambda: deque(maxlen=3))
 
 
 class ScanUI:
@@ -82,18 +83,15 @@ class ScanUI:
             self.stats.with_matches += 1
 
             # Count entities
-            for match in result.real_matches:
-                key = match.entity_type.value
-                self.stats.entity_counts[key] = self.stats.entity_counts.get(key, 0) + 1
+            self.stats.entity_counts.update(m.entity_type.value for m in result.real_matches)
 
-            # Track recent matches (last 3)
+            # Track recent matches (deque keeps the last 3)
             self.stats.recent_matches.append(
                 {
                     "file": result.path.name,
                     "types": [m.entity_type.value for m in result.real_matches[:3]],
                 }
             )
-            self.stats.recent_matches = self.stats.recent_matches[-3:]
 
         if self.live:
             self.live.update(self._render())
@@ -123,7 +121,7 @@ class ScanUI:
 
         # Entity breakdown with mini bar charts
         entity_lines = []
-        for entity, count in sorted(stats.entity_counts.items(), key=lambda x: -x[1])[:5]:
+        for entity, count in stats.entity_counts.most_common(5):
             bar_len = min(count, 15)
             entity_lines.append(f"  {entity:<18} {count:>4}  {'█' * bar_len}")
 
@@ -14,7 +14,7 @@ class Verdict(Enum):
     SKIP = "skip"  # Reviewer unsure or skipped
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewSample:
     """A single sample for human review."""
 
@@ -38,6 +38,15 @@ class ReviewSample:
     verdict: Optional[Verdict] = None
     reviewed_at: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "ReviewSample":
+        """
+        Build from a row tuple in field declaration order.
+
+        Avoids keyword-argument matching when bulk-loading samples.
+        """
+        return cls(*row)
+
     @property
     def confidence_pct(self) -> int:
         """Confidence as percentage."""
@@ -61,12 +70,14 @@ class ReviewSample:
         This is what gets written to reviews.jsonl.
         Values are anonymized - no PII in training data.
         """
+        verdict = self.verdict
+        reviewed_at = self.reviewed_at
         return {
             "entity_type": self.entity_type,
             "context": self.anonymize_context(),
             "confidence": self.confidence,
             "detector": self.detector,
-            "verdict": self.verdict.value if self.verdict else None,
+            "verdict": verdict.value if verdict else None,
             "file_type": self.file_type,
-            "timestamp": self.reviewed_at.isoformat() if self.reviewed_at else None,
+            "timestamp": reviewed_at.isoformat() if reviewed_at else None,
         }
@@ -1,5 +1,6 @@
 """Sample low-confidence matches for human review."""
 
+from bisect import bisect_left
 from typing import Iterator, Optional
 from pathlib import Path
 
@@ -80,16 +81,9 @@ class ReviewSampler:
         max_confidence: float = 0.85,
     ) -> int:
         """Count how many matches are below the confidence threshold."""
-        findings = list(
-            self.db.get_findings(
-                scan_id=scan_id,
-                min_confidence=0.0,
-                include_test_data=False,
-                decrypt=False,  # Don't need values for counting
-            )
-        )
-
-        return sum(1 for f in findings if f["confidence"] < max_confidence)
+        # Sorted confidences only - bisect finds the cut-off in C
+        confidences = self.db.get_confidences(scan_id, include_test_data=False)
+        return bisect_left(confidences, max_confidence)
 
     def get_scan_summary(self, scan_id: str) -> Optional[dict]:
         """Get scan info for display."""
@@ -1,12 +1,17 @@
 """Storage for review verdicts - feeds into training pipeline."""
 
 import json
+import mmap
 import os
+import struct
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import BinaryIO, Iterator, Optional
 
 from .models import ReviewSample, Verdict
 
+# Index entries are the little-endian end offset of each JSONL record
+_OFFSET = struct.Struct("<Q")
+
 
 def get_reviews_path() -> Path:
     """Get path to reviews JSONL file."""
@@ -20,6 +25,24 @@ def get_reviews_path() -> Path:
     return reviews_dir / "reviews.jsonl"
 
 
+def _empty_stats() -> dict:
+    # offset: bytes of the JSONL file the counters and index cover
+    return {"total": 0, "tp": 0, "fp": 0, "by_entity": {}, "offset": 0}
+
+
+def _count_record(stats: dict, record: dict) -> None:
+    """Add one record to running stats counters."""
+    stats["total"] += 1
+    verdict = record.get("verdict")
+    if verdict == "TP":
+        stats["tp"] += 1
+    elif verdict == "FP":
+        stats["fp"] += 1
+
+    entity = record.get("entity_type", "unknown")
+    stats["by_entity"][entity] = stats["by_entity"].get(entity, 0) + 1
+
+
 class ReviewStorage:
     """
     Store review verdicts for training pipeline.
@@ -27,6 +50,15 @@ class ReviewStorage:
     Verdicts are anonymized (no PII) and stored in JSONL format.
     Each line is a training example.
 
+    Two sidecar files are kept next to the JSONL:
+        reviews.idx         8-byte end offset of each record (for load_range)
+        reviews.stats.json  running verdict counters (for get_stats) and
+                            the JSONL byte size they cover
+
+    Sidecars behind the JSONL (a crash mid-save, or an append by an older
+    scrubiq) are caught up on the next read; ones that don't add up are
+    rebuilt from the JSONL.
+
     Usage:
         storage = ReviewStorage()
         storage.save_verdict(sample)
@@ -34,10 +66,46 @@ class ReviewStorage:
         # Later, for training
         for example in storage.load_all():
             train(example)
+
+    For long review sessions, use it as a context manager so the file
+    is opened once and writes are buffered until exit:
+
+        with storage:
+            for sample in samples:
+                storage.save_verdict(sample)
     """
 
     def __init__(self, path: Optional[Path] = None):
         self.path = path or get_reviews_path()
+        self.index_path = self.path.with_suffix(".idx")
+        self.stats_path = self.path.with_suffix(".stats.json")
+        self._fh: Optional[BinaryIO] = None
+        self._idx_fh: Optional[BinaryIO] = None
+        self._stats: Optional[dict] = None
+
+    def open(self) -> None:
+        """Open persistent append handles for batched writes."""
+        if self._fh is None:
+            self._stats = self._sync()
+            self._fh = open(self.path, "ab", buffering=1 << 16)
+            self._idx_fh = open(self.index_path, "ab")
+
+    def flush(self) -> None:
+        """Flush buffered verdicts and counters to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+            self._idx_fh.flush()
+            self._write_stats(self._stats)
+
+    def close(self) -> None:
+        """Flush and close the persistent handles, if open."""
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._idx_fh.close()
+            self._fh = None
+            self._idx_fh = None
+            self._stats = None
 
     def save_verdict(self, sample: ReviewSample) -> None:
         """
@@ -54,13 +122,34 @@ class ReviewStorage:
 
         # Get anonymized training data
         record = sample.to_training_dict()
+        line = (json.dumps(record) + "\n").encode("utf-8")
+
+        # Persistent handles when used as a context manager
+        if self._fh is not None:
+            self._fh.write(line)
+            end = self._fh.tell()
+            self._idx_fh.write(_OFFSET.pack(end))
+            _count_record(self._stats, record)
+            self._stats["offset"] = end
+            return
+
+        stats = self._sync()
 
         # Append to JSONL
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        with open(self.path, "ab") as f:
+            f.write(line)
+            end = f.tell()
+
+        with open(self.index_path, "ab") as f:
+            f.write(_OFFSET.pack(end))
+
+        _count_record(stats, record)
+        stats["offset"] = end
+        self._write_stats(stats)
 
     def load_all(self) -> Iterator[dict]:
         """Load all saved verdicts for training."""
+        self.flush()
         if not self.path.exists():
             return
 
@@ -70,37 +159,160 @@ class ReviewStorage:
                 if line:
                     yield json.loads(line)
 
+    def load_range(self, start: int, end: Optional[int] = None) -> Iterator[dict]:
+        """
+        Load verdicts start..end (exclusive) by seeking via the offset index.
+
+        Lets training consumers read a slice without parsing the records
+        before it.
+        """
+        self.flush()
+        if not self.path.exists():
+            return
+        self._sync()
+
+        count = self.index_path.stat().st_size // _OFFSET.size
+        end = count if end is None else min(end, count)
+        start = max(start, 0)
+        if start >= end:
+            return
+
+        # Offset of the record before `start` marks where `start` begins
+        first = max(start - 1, 0)
+        with open(self.index_path, "rb") as f:
+            f.seek(first * _OFFSET.size)
+            raw = f.read((end - first) * _OFFSET.size)
+        offsets = [offset for (offset,) in _OFFSET.iter_unpack(raw)]
+        if start == 0:
+            offsets.insert(0, 0)
+
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for lo, hi in zip(offsets, offsets[1:]):
+                    yield json.loads(mm[lo:hi])
+
     def get_stats(self) -> dict:
         """Get statistics about saved verdicts."""
-        total = 0
-        tp = 0
-        fp = 0
-        by_entity = {}
-
-        for record in self.load_all():
-            total += 1
-            verdict = record.get("verdict")
-            if verdict == "TP":
-                tp += 1
-            elif verdict == "FP":
-                fp += 1
-
-            entity = record.get("entity_type", "unknown")
-            by_entity[entity] = by_entity.get(entity, 0) + 1
+        self.flush()
+        stats = self._sync()
+        total = stats["total"]
+        tp = stats["tp"]
 
         return {
             "total": total,
             "true_positives": tp,
-            "false_positives": fp,
+            "false_positives": stats["fp"],
             "accuracy": tp / total if total > 0 else 0.0,
-            "by_entity_type": by_entity,
+            "by_entity_type": stats["by_entity"],
         }
 
     def clear(self) -> int:
         """Clear all stored verdicts. Returns count deleted."""
+        self.close()
         if not self.path.exists():
             return 0
 
-        count = sum(1 for _ in self.load_all())
+        # Count lines in raw 1 MB chunks rather than parsing each record
+        count = 0
+        with open(self.path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                count += chunk.count(b"\n")
+
         self.path.unlink()
+        self.index_path.unlink(missing_ok=True)
+        self.stats_path.unlink(missing_ok=True)
         return count
+
+    def _sync(self) -> dict:
+        """
+        Return counters covering the whole JSONL, catching the sidecars up.
+
+        Complete records past the covered offset are indexed and counted.
+        A file shorter than the covered offset (truncated or replaced), an
+        index that ends somewhere else, or a missing or pre-offset stats
+        sidecar gets both sidecars rebuilt.
+        """
+        if self._stats is not None:
+            return self._stats
+        if not self.path.exists():
+            return _empty_stats()
+
+        size = self.path.stat().st_size
+        stats = self._load_stats_sidecar()
+        covered = stats.get("offset") if stats else None
+        if covered is None or covered > size or self._index_end() != covered:
+            return self._rebuild_sidecars()
+        if covered == size:
+            return stats
+
+        offsets, end = self._scan_records(covered, stats)
+        if offsets:
+            with open(self.index_path, "ab") as f:
+                f.write(offsets)
+        stats["offset"] = end
+        self._write_stats(stats)
+        return stats
+
+    def _load_stats_sidecar(self) -> Optional[dict]:
+        """The stats sidecar as written, or None if missing or unreadable."""
+        try:
+            return json.loads(self.stats_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _index_end(self) -> Optional[int]:
+        """End offset of the last indexed record (None if the index is unusable)."""
+        try:
+            size = self.index_path.stat().st_size
+        except OSError:
+            return None
+        if size % _OFFSET.size:
+            return None  # Torn write
+        if size == 0:
+            return 0
+        with open(self.index_path, "rb") as f:
+            f.seek(size - _OFFSET.size)
+            (end,) = _OFFSET.unpack(f.read(_OFFSET.size))
+        return end
+
+    def _scan_records(self, start: int, stats: dict) -> tuple[bytearray, int]:
+        """
+        Index and count complete JSONL records from byte `start` on.
+
+        Returns:
+            (packed end offsets, offset just past the last complete line)
+        """
+        offsets = bytearray()
+        end = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial write - picked up once it completes
+                end += len(line)
+                if line.strip():
+                    offsets += _OFFSET.pack(end)
+                    _count_record(stats, json.loads(line))
+        return offsets, end
+
+    def _write_stats(self, stats: dict) -> None:
+        """Atomically replace the stats sidecar."""
+        tmp_path = self.stats_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(stats), encoding="utf-8")
+        os.replace(tmp_path, self.stats_path)
+
+    def _rebuild_sidecars(self) -> dict:
+        """Regenerate the offset index and counters from the JSONL file."""
+        stats = _empty_stats()
+        offsets, stats["offset"] = self._scan_records(0, stats)
+
+        self.index_path.write_bytes(bytes(offsets))
+        self._write_stats(stats)
+        return stats
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -64,6 +64,16 @@ class ReviewTUI:
 
         console.print()
 
+        with self.storage:
+            self._review_loop()
+
+        # Show summary
+        console.print(self._render_summary())
+
+        return self._get_stats()
+
+    def _review_loop(self) -> None:
+        """Prompt for verdicts until samples run out or the user quits."""
         while self.current_index < len(self.samples):
             sample = self.current_sample
 
@@ -95,11 +105,6 @@ class ReviewTUI:
             self.current_index += 1
             console.print()  # Blank line between samples
 
-        # Show summary
-        console.print(self._render_summary())
-
-        return self._get_stats()
-
     def _render_sample(self, sample: ReviewSample) -> Panel:
         """Render a sample for review."""
         # Progress line
@@ -141,12 +146,16 @@ class ReviewTUI:
 
     def _highlight_value(self, context: str, value: str) -> str:
         """Highlight the matched value in context."""
-        if not value or value not in context:
+        if not value:
+            return context
+
+        # Single scan: split around the first occurrence
+        before, sep, after = context.partition(value)
+        if not sep:
             return context
 
-        # Replace value with highlighted version
         highlighted = f"[bold red on white] {value} [/bold red on white]"
-        return context.replace(value, highlighted)
+        return before + highlighted + after
 
     def _prompt_verdict(self) -> Verdict | str:
         """Get verdict from user."""
@@ -4,9 +4,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+import json
 import uuid
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class EntityType(Enum):
     """Types of sensitive data we detect."""
@@ -36,6 +44,10 @@ class EntityType(Enum):
     PRIVATE_KEY = "private_key"
 
 
+# Reverse lookup for deserializing; avoids EntityType(value) call overhead
+ENTITY_TYPE_BY_VALUE: dict[str, EntityType] = {e.value: e for e in EntityType}
+
+
 class Confidence(Enum):
     """Confidence levels for matches."""
 
@@ -65,7 +77,7 @@ class LabelRecommendation(Enum):
     HIGHLY_CONFIDENTIAL = "highly_confidential"
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """A single detected sensitive data match."""
 
@@ -77,6 +89,7 @@ class Match:
     detector: str  # Which detector found it ("regex", "presidio", "setfit")
     context: str = ""  # Surrounding text for review
     is_test_data: bool = False  # Detected as test/example data
+    validated: bool = False  # Passed a checksum validator (e.g. Luhn)
     model_version: Optional[str] = None  # For trained model traceability
 
     @property
@@ -91,7 +104,15 @@ class Match:
         return self.value[:2] + "*" * (len(self.value) - 4) + self.value[-2:]
 
 
-@dataclass
+class FileSummary(NamedTuple):
+    """Per-file aggregates computed in one pass over matches."""
+
+    has_sensitive_data: bool
+    real_match_count: int
+    match_dicts: list[dict]
+
+
+@dataclass(slots=True)
 class FileResult:
     """Results for a single scanned file."""
 
@@ -105,9 +126,14 @@ class FileResult:
     error: Optional[str] = None  # If extraction/scan failed
     scan_time_ms: int = 0
 
+    # real_matches cache, valid while `matches` is the same list at the same length
+    _real: Optional[list[Match]] = field(default=None, init=False, repr=False, compare=False)
+    _real_source: Optional[list[Match]] = field(default=None, init=False, repr=False, compare=False)
+    _real_len: int = field(default=0, init=False, repr=False, compare=False)
+
     @property
     def has_sensitive_data(self) -> bool:
-        return len(self.matches) > 0 and not all(m.is_test_data for m in self.matches)
+        return bool(self.real_matches)
 
     @property
     def highest_confidence(self) -> float:
@@ -121,11 +147,45 @@ class FileResult:
 
     @property
     def real_matches(self) -> list[Match]:
-        """Matches excluding test data."""
-        return [m for m in self.matches if not m.is_test_data]
+        """
+        Matches excluding test data.
+
+        Cached until `matches` is replaced or changes length; treat the
+        returned list as read-only.
+        """
+        matches = self.matches
+        if self._real_source is not matches or self._real_len != len(matches):
+            self._real = [m for m in matches if not m.is_test_data]
+            self._real_source = matches
+            self._real_len = len(matches)
+        return self._real
+
+    def _summarize(self) -> FileSummary:
+        """Compute the summary properties and export dicts in one pass."""
+        real_count = 0
+        match_dicts = []
+        from_score = Confidence.from_score
+
+        for m in self.matches:
+            confidence = m.confidence
+            if not m.is_test_data:
+                real_count += 1
+            match_dicts.append(
+                {
+                    "entity_type": m.entity_type.value,
+                    "value": m.redacted_value,
+                    "confidence": confidence,
+                    "confidence_level": from_score(confidence).value,
+                    "detector": m.detector,
+                    "is_test_data": m.is_test_data,
+                    "model_version": m.model_version,
+                }
+            )
 
+        return FileSummary(real_count > 0, real_count, match_dicts)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanResult:
     """Complete results from a scan operation."""
 
@@ -161,41 +221,48 @@ class ScanResult:
 
     def to_dict(self) -> dict:
         """Serialize for JSON export."""
-        return {
-            "scan_id": self.scan_id,
-            "started_at": self.started_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "source_path": self.source_path,
-            "source_type": self.source_type,
-            "summary": {
-                "total_files": self.total_files,
-                "files_with_matches": self.files_with_matches,
-                "files_errored": self.files_errored,
-                "total_matches": self.total_matches,
-            },
-            "files": [
+        files = []
+        files_with_matches = 0
+        files_errored = 0
+        total_matches = 0
+
+        # One pass per file feeds both the summary and the file entries
+        for f in self.files:
+            summary = f._summarize()
+            files_with_matches += summary.has_sensitive_data
+            files_errored += bool(f.error)
+            total_matches += summary.real_match_count
+            files.append(
                 {
                     "path": str(f.path),
                     "size_bytes": f.size_bytes,
                     "modified": f.modified.isoformat(),
-                    "has_sensitive_data": f.has_sensitive_data,
+                    "has_sensitive_data": summary.has_sensitive_data,
                     "label_recommendation": (
                         f.label_recommendation.value if f.label_recommendation else None
                     ),
                     "error": f.error,
-                    "matches": [
-                        {
-                            "entity_type": m.entity_type.value,
-                            "value": m.redacted_value,
-                            "confidence": m.confidence,
-                            "confidence_level": m.confidence_level.value,
-                            "detector": m.detector,
-                            "is_test_data": m.is_test_data,
-                            "model_version": m.model_version,
-                        }
-                        for m in f.matches
-                    ],
+                    "matches": summary.match_dicts,
                 }
-                for f in self.files
-            ],
+            )
+
+        return {
+            "scan_id": self.scan_id,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "source_path": self.source_path,
+            "source_type": self.source_type,
+            "summary": {
+                "total_files": len(self.files),
+                "files_with_matches": files_with_matches,
+                "files_errored": files_errored,
+                "total_matches": total_matches,
+            },
+            "files": files,
         }
+
+    def to_json(self) -> str:
+        """Serialize to indented JSON, using orjson when available."""
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self.to_dict(), indent=2)
@@ -1,13 +1,25 @@
 """Main scanner - finds sensitive data in files."""
 
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
 from datetime import datetime
-from typing import Iterator, Optional, Callable
+from typing import Iterable, Iterator, Optional, Callable
 import os
+import re
+import time
 
 from .results import ScanResult, FileResult
 from ..classifier.extractors.registry import ExtractorRegistry
-from ..classifier.extractors.base import ExtractionError
+from ..classifier.extractors.base import ExtractionError, get_name_extension
+from ..classifier.detectors.presidio import HAS_PRESIDIO
 from ..classifier.pipeline import ClassifierPipeline
 
 
@@ -27,6 +39,23 @@ DEFAULT_EXCLUDE_PATTERNS = [
     "*.egg-info",
 ]
 
+# Max files in flight per worker pool (bounds memory and pickling backlog)
+MAX_PENDING_FILES = 256
+
+# Per-process scanner used by ProcessPoolExecutor workers
+_worker_scanner: Optional["Scanner"] = None
+
+
+def _init_worker(scanner_kwargs: dict) -> None:
+    """Build one Scanner per worker process so detectors load once."""
+    global _worker_scanner
+    _worker_scanner = Scanner(**scanner_kwargs)
+
+
+def _scan_file_worker(path: Path) -> "FileResult":
+    """Scan a file in a worker process."""
+    return _worker_scanner.scan_file(path)
+
 
 class Scanner:
     """
@@ -53,6 +82,9 @@ class Scanner:
     Streaming results:
         for file_result in scanner.scan_iter("./docs"):
             process(file_result)
+
+    Parallel scan (results arrive in completion order):
+        scanner = Scanner(workers=os.cpu_count())
     """
 
     def __init__(
@@ -61,6 +93,10 @@ class Scanner:
         max_file_size_mb: int = 100,
         enable_presidio: bool = True,
         presidio_threshold: float = 0.5,
+        workers: int = 1,
+        tpfp_model_path: Optional[str] = None,
+        tpfp_backend: str = "torch",
+        tpfp_low_memory: bool = False,
     ):
         """
         Initialize scanner.
@@ -70,28 +106,87 @@ class Scanner:
             max_file_size_mb: Maximum file size to scan (default 100MB).
             enable_presidio: Use Presidio NER for names/addresses (if available).
             presidio_threshold: Minimum confidence for Presidio matches.
+            workers: Files scanned concurrently. Uses worker processes when
+                Presidio is enabled (CPU-bound NER), threads otherwise.
+            tpfp_model_path: Trained TP/FP classifier to filter matches with.
+                Its embedding cache is saved back to the model directory
+                after each scan (worker processes don't save theirs).
+            tpfp_backend: Inference backend for the TP/FP model ("torch"
+                or "onnx", see TPFPClassifier.load).
+            tpfp_low_memory: Trim the TP/FP model's per-process memory.
+                Worker processes always do, since each loads its own copy.
         """
         self.extractor_registry = ExtractorRegistry()
-        self.classifier = ClassifierPipeline(
-            enable_presidio=enable_presidio,
-            presidio_threshold=presidio_threshold,
-        )
         self.max_file_size = max_file_size_mb * 1024 * 1024
         self.exclude_patterns = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
+        self._exclude_re = self._compile_exclude_patterns(self.exclude_patterns)
+        self.workers = max(1, workers)
+
+        # Rebuilds an equivalent scanner inside worker processes
+        self._worker_kwargs = {
+            "exclude_patterns": self.exclude_patterns,
+            "max_file_size_mb": max_file_size_mb,
+            "enable_presidio": enable_presidio,
+            "presidio_threshold": presidio_threshold,
+            "tpfp_model_path": tpfp_model_path,
+            "tpfp_backend": tpfp_backend,
+            "tpfp_low_memory": True,
+        }
+        self._tpfp_low_memory = tpfp_low_memory
+
+        # Parallel NER scans run in processes that each load their own
+        # Presidio model, so the parent builds its pipeline only on demand
+        self._use_processes = self.workers > 1 and enable_presidio and HAS_PRESIDIO
+        self._classifier: Optional[ClassifierPipeline] = None
+        if not self._use_processes:
+            self._classifier = self._build_classifier()
+
+    @property
+    def classifier(self) -> ClassifierPipeline:
+        """Detection pipeline for files scanned in this process."""
+        if self._classifier is None:
+            self._classifier = self._build_classifier()
+        return self._classifier
+
+    @property
+    def has_presidio(self) -> bool:
+        """Whether scans run Presidio NER (in each worker when parallel)."""
+        if self._classifier is None:
+            # Workers load Presidio themselves; each falls back to regex
+            # alone if the spaCy model can't load
+            return self._use_processes
+        return self._classifier.has_presidio
+
+    def _build_classifier(self) -> ClassifierPipeline:
+        return ClassifierPipeline(
+            enable_presidio=self._worker_kwargs["enable_presidio"],
+            presidio_threshold=self._worker_kwargs["presidio_threshold"],
+            tpfp_model_path=self._worker_kwargs["tpfp_model_path"],
+            tpfp_backend=self._worker_kwargs["tpfp_backend"],
+            tpfp_low_memory=self._tpfp_low_memory,
+        )
 
     def scan(
         self,
         path: str,
-        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        on_progress: Optional[Callable[[int, Optional[int], str], None]] = None,
         on_file: Optional[Callable[[FileResult], None]] = None,
+        precount: bool = True,
     ) -> ScanResult:
         """
         Scan a directory for sensitive data.
 
+        Files are scanned as the directory walk finds them. With an
+        on_progress callback, a pathname-only counting walk runs first so
+        progress can report a total.
+
         Args:
             path: Directory or file path to scan.
             on_progress: Callback(current, total, filename) for progress.
+                total is None when precount is off.
             on_file: Callback(FileResult) after each file completes.
+            precount: Count files up front for on_progress's total. Turn
+                off to start scanning immediately on very large trees.
 
         Returns:
             ScanResult with all findings.
@@ -99,20 +194,15 @@ class Scanner:
         path_obj = Path(path).resolve()
         result = ScanResult(source_path=str(path_obj), source_type="filesystem")
 
-        # Collect files first to know total count
-        files = list(self._iter_files(path_obj))
-        total = len(files)
-
-        for i, file_path in enumerate(files):
-            if on_progress:
-                on_progress(i + 1, total, str(file_path))
+        total = self._count_files(path_obj) if precount and on_progress else None
 
-            file_result = self.scan_file(file_path)
+        for file_result in self._scan_files(self._iter_files(path_obj), on_progress, total):
             result.add_file(file_result)
 
             if on_file:
                 on_file(file_result)
 
+        self._save_caches()
         result.complete()
         return result
 
@@ -126,7 +216,7 @@ class Scanner:
         Returns:
             FileResult with matches (if any) or error.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         # Get file metadata
         try:
@@ -152,7 +242,8 @@ class Scanner:
                 error=f"File too large ({size / 1024 / 1024:.1f} MB > {self.max_file_size / 1024 / 1024:.0f} MB limit)",
             )
 
-        # Check if we can extract this file type
+        # Check if we can extract this file type (walked files already pass;
+        # this catches single-file scans and direct calls)
         if not self.extractor_registry.can_extract(path):
             return FileResult(
                 path=path,
@@ -190,7 +281,7 @@ class Scanner:
                 size_bytes=size,
                 modified=modified,
                 matches=[],
-                scan_time_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+                scan_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
         # Detect sensitive data
@@ -206,8 +297,8 @@ class Scanner:
                 error=f"Detection failed: {type(e).__name__}: {e}",
             )
 
-        # Calculate scan time
-        scan_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        # Calculate scan time (monotonic clock, unaffected by wall-clock changes)
+        scan_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Use pipeline's label recommendation
         label = result.label_recommendation
@@ -236,8 +327,99 @@ class Scanner:
             FileResult for each scanned file.
         """
         path_obj = Path(path).resolve()
-        for file_path in self._iter_files(path_obj):
-            yield self.scan_file(file_path)
+        yield from self._scan_files(self._iter_files(path_obj))
+        self._save_caches()
+
+    def _scan_files(
+        self,
+        files: Iterable[Path],
+        on_progress: Optional[Callable[[int, Optional[int], str], None]] = None,
+        total: Optional[int] = None,
+    ) -> Iterator[FileResult]:
+        """
+        Scan files serially, or across a worker pool when workers > 1.
+
+        Parallel results are yielded in completion order, with at most
+        MAX_PENDING_FILES submitted ahead of the consumer. Submission
+        overlaps the directory walk when `files` is a generator.
+        """
+        if self.workers <= 1:
+            for i, file_path in enumerate(files):
+                if on_progress:
+                    on_progress(i + 1, total, str(file_path))
+                yield self.scan_file(file_path)
+            return
+
+        with self._create_executor() as executor:
+            scan_fn = (
+                _scan_file_worker if isinstance(executor, ProcessPoolExecutor) else self.scan_file
+            )
+            pending: dict[Future, Path] = {}
+            completed = 0
+
+            def collect(future: Future) -> FileResult:
+                nonlocal completed
+                file_result = self._future_result(future, pending.pop(future))
+                completed += 1
+                if on_progress:
+                    on_progress(completed, total, str(file_result.path))
+                return file_result
+
+            for file_path in files:
+                pending[executor.submit(scan_fn, file_path)] = file_path
+
+                if len(pending) >= MAX_PENDING_FILES:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield collect(future)
+
+            for future in as_completed(list(pending)):
+                yield collect(future)
+
+    def _create_executor(self) -> Executor:
+        """Process pool for CPU-bound NER, thread pool otherwise."""
+        if self._use_processes:
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._worker_kwargs,),
+            )
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _save_caches(self) -> None:
+        """Keep what this process's classifier learned for the next scan."""
+        if self._classifier is not None:
+            self._classifier.save_caches()
+
+    @staticmethod
+    def _future_result(future: Future, path: Path) -> FileResult:
+        """Unwrap a worker result, turning worker failures into file errors."""
+        try:
+            return future.result()
+        except Exception as e:
+            return FileResult(
+                path=path,
+                source="filesystem",
+                size_bytes=0,
+                modified=datetime.now(),
+                error=f"Scan failed: {type(e).__name__}: {e}",
+            )
+
+    def count_files(self, path: str) -> int:
+        """
+        Count the files scan() would visit, without scanning them.
+
+        Args:
+            path: Directory or file path.
+
+        Returns:
+            Number of scannable files.
+        """
+        return self._count_files(Path(path).resolve())
+
+    def _count_files(self, path: Path) -> int:
+        # Pathname-only walk: no Path objects built or held
+        return sum(1 for _ in self._walk(path))
 
     def _iter_files(self, path: Path) -> Iterator[Path]:
         """
@@ -245,40 +427,68 @@ class Scanner:
 
         Skips excluded patterns and unsupported file types.
         """
+        for file_path in self._walk(path):
+            yield Path(file_path)
+
+    def _walk(self, path: Path) -> Iterator[str]:
+        """Yield the path string of each scannable file under path."""
         # Handle single file
         if path.is_file():
-            yield path
+            yield str(path)
             return
 
         # Handle directory
         if not path.is_dir():
             return
 
-        for root, dirs, files in os.walk(path):
-            # Filter out excluded directories (modifies dirs in-place)
-            dirs[:] = [d for d in dirs if not self._should_exclude(d)]
-
-            for filename in files:
-                # Skip excluded files
-                if self._should_exclude(filename):
+        # Depth-first like os.walk, but DirEntry types come from the
+        # directory read itself, so no per-entry stat() is needed
+        supports_extension = self.extractor_registry.supports_extension
+        stack = [str(path)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry.name
+                if self._should_exclude(name):
                     continue
 
-                file_path = Path(root) / filename
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif supports_extension(get_name_extension(name)):
+                    # Only yield files we can extract
+                    yield entry.path
 
-                # Only yield files we can extract
-                if self.extractor_registry.can_extract(file_path):
-                    yield file_path
+            stack.extend(reversed(subdirs))
 
     def _should_exclude(self, name: str) -> bool:
         """Check if a file/directory should be excluded."""
-        for pattern in self.exclude_patterns:
-            if pattern.startswith("*"):
-                # Glob-style suffix match
-                if name.endswith(pattern[1:]):
-                    return True
-            elif pattern in name:
-                return True
-        return False
+        return self._exclude_re.search(name) is not None
+
+    @staticmethod
+    def _compile_exclude_patterns(patterns: list[str]) -> re.Pattern:
+        """
+        Combine exclude patterns into one regex.
+
+        "*suffix" patterns match the end of a name (glob-style);
+        anything else matches as a substring.
+        """
+        parts = [
+            re.escape(p[1:]) + r"\Z" if p.startswith("*") else re.escape(p) for p in patterns
+        ]
+        return re.compile("|".join(parts) if parts else r"(?!)")
 
     @property
     def supported_extensions(self) -> list[str]:
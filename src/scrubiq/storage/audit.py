@@ -1,12 +1,29 @@
 """Audit logging for compliance and traceability."""
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from hashlib import blake2b
+from typing import IO, Optional
 import getpass
 import json
 import os
+import tempfile
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson decodes bytes directly and raises a json.JSONDecodeError subclass
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Record a (offset, timestamp) checkpoint every INDEX_INTERVAL entries
+INDEX_INTERVAL = 1000
 
 
 class AuditAction(Enum):
@@ -41,7 +58,11 @@ class AuditAction(Enum):
     DATA_EXPORT = "data_export"
 
 
-@dataclass
+# Reverse lookup for parsing log lines; avoids AuditAction(value) call overhead
+_ACTION_BY_VALUE: dict[str, AuditAction] = {a.value: a for a in AuditAction}
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """Single audit log entry."""
 
@@ -67,6 +88,10 @@ class AuditEntry:
         }
 
     def to_json(self) -> str:
+        if HAS_ORJSON:
+            # orjson encodes dataclasses, datetimes and enums natively,
+            # matching to_dict() field for field without building it
+            return orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(self.to_dict())
 
 
@@ -81,6 +106,20 @@ class AuditLog:
         audit = AuditLog("/path/to/scrubiq-audit.jsonl")
         audit.log(AuditAction.SCAN_START, {"path": "/documents"})
         audit.log(AuditAction.FINDING_STORE, {"file": "doc.xlsx"}, record_count=5)
+        audit.close()
+
+    The file is opened once on first write and kept open, line-buffered,
+    so every entry still reaches the OS as soon as it is logged.
+
+    Two sidecar files let queries skip already-read entries:
+        <log>.idx         "offset\ttimestamp" every INDEX_INTERVAL entries
+        <log>.stats.json  get_stats() counters, the log offset they cover,
+                          and the identity of the log file they describe
+
+    Both are caught up lazily on read, so several AuditLog instances can
+    share one log file and logging stays a single append. Readers without
+    write access to the sidecars still get correct results, just without
+    the saved progress.
     """
 
     def __init__(self, log_path: str):
@@ -91,18 +130,17 @@ class AuditLog:
             log_path: Path to the audit log file (JSON lines format).
         """
         self.log_path = log_path
-        self._user = self._get_current_user()
+        self._index_path = log_path + ".idx"
+        self._stats_path = log_path + ".stats.json"
+        self._user = _get_current_user()
+        self._fh: Optional[IO[str]] = None
+
+        # False once a replaced log's stale index couldn't be removed
+        self._index_valid = True
 
         # Ensure directory exists
         os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
 
-    def _get_current_user(self) -> str:
-        """Get current OS username."""
-        try:
-            return getpass.getuser()
-        except Exception:
-            return "unknown"
-
     def log(
         self,
         action: AuditAction,
@@ -137,12 +175,31 @@ class AuditLog:
             error=error,
         )
 
-        # Append to log file
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(entry.to_json() + "\n")
+        # Append to log file (opened once, line-buffered)
+        if self._fh is None:
+            self._fh = open(self.log_path, "a", buffering=1, encoding="utf-8")
+        self._fh.write(entry.to_json() + "\n")
 
         return entry
 
+    def flush(self) -> None:
+        """Force buffered entries to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        """Close the log file handle. Logging again reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def get_entries(
         self,
         since: Optional[datetime] = None,
@@ -167,13 +224,16 @@ class AuditLog:
         if not os.path.exists(self.log_path):
             return entries
 
-        with open(self.log_path, "r", encoding="utf-8") as f:
+        offset = self._find_offset(since) if since else 0
+
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
             for line in f:
                 if not line.strip():
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     entry_time = datetime.fromisoformat(data["timestamp"])
 
                     # Apply filters
@@ -187,7 +247,7 @@ class AuditLog:
                     entries.append(
                         AuditEntry(
                             timestamp=entry_time,
-                            action=AuditAction(data["action"]),
+                            action=_ACTION_BY_VALUE[data["action"]],
                             user=data["user"],
                             details=data["details"],
                             record_count=data.get("record_count", 0),
@@ -207,42 +267,180 @@ class AuditLog:
 
     def get_stats(self) -> dict:
         """Get aggregate statistics from the audit log."""
-        stats = {
-            "total_entries": 0,
-            "by_action": {},
-            "by_user": {},
-            "errors": 0,
-            "first_entry": None,
-            "last_entry": None,
-        }
-
         if not os.path.exists(self.log_path):
-            return stats
+            return _empty_stats()
 
-        with open(self.log_path, "r", encoding="utf-8") as f:
+        return self._refresh()["stats"]
+
+    def _find_offset(self, since: datetime) -> int:
+        """Byte offset of the last checkpoint strictly before `since`."""
+        self._refresh()
+        if not self._index_valid or not os.path.exists(self._index_path):
+            return 0
+
+        offsets = []
+        timestamps = []
+        with open(self._index_path, "r", encoding="utf-8") as f:
             for line in f:
+                offset, _, timestamp = line.rstrip("\n").partition("\t")
+                try:
+                    timestamps.append(datetime.fromisoformat(timestamp))
+                except ValueError:
+                    continue
+                offsets.append(int(offset))
+
+        # Entries are appended in time order, so everything before this
+        # checkpoint is older than `since`
+        i = bisect_left(timestamps, since) - 1
+        return offsets[i] if i >= 0 else 0
+
+    def _refresh(self) -> dict:
+        """
+        Fold entries appended since the last snapshot into the sidecars.
+
+        Returns:
+            The up-to-date snapshot: {"offset", "count", "stats", "file_id"}.
+        """
+        if self._fh is not None:
+            self._fh.flush()
+
+        snapshot = self._read_snapshot()
+        stat = os.stat(self.log_path)
+        size = stat.st_size
+        file_id = self._file_id(stat)
+
+        if size < snapshot["offset"] or (
+            snapshot["offset"] and snapshot.get("file_id") != file_id
+        ):
+            # Log was truncated or replaced - start over
+            snapshot = _empty_snapshot()
+            try:
+                os.remove(self._index_path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self._index_valid = False  # Offsets point into the old file
+
+        if size == snapshot["offset"]:
+            return snapshot
+
+        offset = snapshot["offset"]
+        count = snapshot["count"]
+        stats = snapshot["stats"]
+        checkpoints = []
+
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial write in progress - pick it up next time
+
+                line_offset = offset
+                offset += len(line)
                 if not line.strip():
                     continue
 
                 try:
-                    data = json.loads(line)
-                    stats["total_entries"] += 1
+                    data = _json_loads(line)
+                except ValueError:
+                    continue
+
+                timestamp = data.get("timestamp")
+                if count % INDEX_INTERVAL == 0 and timestamp:
+                    checkpoints.append(f"{line_offset}\t{timestamp}\n")
+                count += 1
+                _count_entry(stats, data)
+
+        snapshot = {"offset": offset, "count": count, "stats": stats, "file_id": file_id}
+        try:
+            if checkpoints and self._index_valid:
+                with open(self._index_path, "a", encoding="utf-8") as f:
+                    f.writelines(checkpoints)
+            self._write_snapshot(snapshot)
+        except OSError:
+            pass  # Read-only sidecars: the in-memory snapshot is still right
+
+        return snapshot
+
+    def _write_snapshot(self, snapshot: dict) -> None:
+        """Atomically replace the stats sidecar (unique temp name per writer)."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self._stats_path) or ".",
+            prefix=os.path.basename(self._stats_path) + ".",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self._stats_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _file_id(self, stat: os.stat_result) -> list:
+        """
+        Identify the log file, so a replacement is noticed even once it has
+        grown past the old snapshot offset: inode plus a hash of the first
+        line (entries start with a timestamp, so first lines don't repeat).
+        """
+        with open(self.log_path, "rb") as f:
+            head = f.readline(4096)
+        return [stat.st_ino, blake2b(head, digest_size=8).hexdigest()]
+
+    def _read_snapshot(self) -> dict:
+        """Load the stats snapshot, or an empty one if missing or corrupt."""
+        try:
+            with open(self._stats_path, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return _empty_snapshot()
 
-                    action = data["action"]
-                    stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
 
-                    user = data["user"]
-                    stats["by_user"][user] = stats["by_user"].get(user, 0) + 1
+@lru_cache(maxsize=None)
+def _get_current_user() -> str:
+    """Get current OS username (resolved once per process)."""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "unknown"
 
-                    if not data.get("success", True):
-                        stats["errors"] += 1
 
-                    timestamp = data["timestamp"]
-                    if stats["first_entry"] is None:
-                        stats["first_entry"] = timestamp
-                    stats["last_entry"] = timestamp
+def _empty_snapshot() -> dict:
+    return {"offset": 0, "count": 0, "stats": _empty_stats(), "file_id": None}
 
-                except (json.JSONDecodeError, KeyError):
-                    continue
 
-        return stats
+def _empty_stats() -> dict:
+    return {
+        "total_entries": 0,
+        "by_action": {},
+        "by_user": {},
+        "errors": 0,
+        "first_entry": None,
+        "last_entry": None,
+    }
+
+
+def _count_entry(stats: dict, data: dict) -> None:
+    """Add one decoded log line to running stats counters."""
+    stats["total_entries"] += 1
+
+    try:
+        action = data["action"]
+        stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
+
+        user = data["user"]
+        stats["by_user"][user] = stats["by_user"].get(user, 0) + 1
+
+        if not data.get("success", True):
+            stats["errors"] += 1
+
+        timestamp = data["timestamp"]
+        if stats["first_entry"] is None:
+            stats["first_entry"] = timestamp
+        stats["last_entry"] = timestamp
+
+    except KeyError:
+        pass
@@ -1,9 +1,11 @@
 """Encryption utilities using Fernet (AES-128-CBC with HMAC)."""
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from typing import Optional
 import base64
+import binascii
 import os
+import threading
 
 # Try to import keyring, gracefully degrade if not available
 try:
@@ -17,6 +19,10 @@ except ImportError:
 SERVICE_NAME = "scrubiq"
 KEY_NAME = "findings-encryption-key"
 
+# Resolved key, cached so keyring IPC happens once per process
+_KEY_CACHE: Optional[bytes] = None
+_KEY_LOCK = threading.Lock()
+
 
 def _get_fallback_key_path() -> str:
     """Get path for fallback key file when keyring unavailable."""
@@ -41,8 +47,31 @@ def get_or_create_key() -> bytes:
     Get encryption key from OS keyring, or create if doesn't exist.
 
     Falls back to file-based storage if keyring unavailable,
-    with restrictive file permissions.
+    with restrictive file permissions. The key is cached for the
+    life of the process; see invalidate_key_cache().
     """
+    global _KEY_CACHE
+
+    key = _KEY_CACHE
+    if key is not None:
+        return key
+
+    with _KEY_LOCK:
+        if _KEY_CACHE is None:
+            _KEY_CACHE = _load_or_create_key()
+        return _KEY_CACHE
+
+
+def invalidate_key_cache() -> None:
+    """Forget the cached key so the next lookup re-reads the keyring."""
+    global _KEY_CACHE
+
+    with _KEY_LOCK:
+        _KEY_CACHE = None
+
+
+def _load_or_create_key() -> bytes:
+    """Read the key from keyring or fallback file, creating it if missing."""
     if HAS_KEYRING:
         try:
             # Try to get existing key
@@ -87,6 +116,7 @@ def delete_key() -> bool:
     Returns True if key was deleted.
     """
     deleted = False
+    invalidate_key_cache()
 
     if HAS_KEYRING:
         try:
@@ -124,34 +154,61 @@ class Encryptor:
         Args:
             key: Optional encryption key. If None, retrieves from keyring.
         """
-        self._key = key or get_or_create_key()
-        self._fernet = Fernet(self._key)
+        self._set_key(key or get_or_create_key())
+
+    def _set_key(self, key: bytes) -> None:
+        """Install a key and its Fernet instance."""
+        self._key = key
+        self._fernet = Fernet(key)
 
     def encrypt(self, plaintext: str) -> str:
         """
         Encrypt a string.
 
-        Returns base64-encoded ciphertext safe for database storage.
+        Returns the Fernet token as text. Tokens are already urlsafe
+        base64, so they are safe for database storage as-is.
         """
         if not plaintext:
             return ""
 
-        ciphertext = self._fernet.encrypt(plaintext.encode("utf-8"))
-        return base64.urlsafe_b64encode(ciphertext).decode("ascii")
+        return self._fernet.encrypt(plaintext.encode("utf-8")).decode("ascii")
 
     def decrypt(self, ciphertext: str) -> str:
         """
         Decrypt a string.
 
+        Also accepts legacy ciphertext that wrapped the Fernet token in a
+        second base64 layer.
+
         Raises InvalidToken if decryption fails (wrong key or corrupted data).
         """
         if not ciphertext:
             return ""
 
-        raw_ciphertext = base64.urlsafe_b64decode(ciphertext.encode("ascii"))
-        plaintext = self._fernet.decrypt(raw_ciphertext)
+        try:
+            plaintext = self._fernet.decrypt(ciphertext.encode("ascii"))
+        except InvalidToken:
+            plaintext = self._legacy_decrypt(ciphertext)
         return plaintext.decode("utf-8")
 
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        """Encrypt a batch of strings. Empty strings map to "" like encrypt()."""
+        encrypt = self.encrypt
+        return [encrypt(plaintext) for plaintext in plaintexts]
+
+    def decrypt_many(self, ciphertexts: list[str]) -> list[str]:
+        """Decrypt a batch of strings. Raises InvalidToken like decrypt()."""
+        decrypt = self.decrypt
+        return [decrypt(ciphertext) for ciphertext in ciphertexts]
+
+    def _legacy_decrypt(self, ciphertext: str) -> bytes:
+        """Decrypt ciphertext written with the old double base64 encoding."""
+        try:
+            token = base64.urlsafe_b64decode(ciphertext.encode("ascii"))
+        except (binascii.Error, ValueError):
+            raise InvalidToken from None
+        return self._fernet.decrypt(token)
+
     def rotate_key(self, new_key: Optional[bytes] = None) -> bytes:
         """
         Rotate to a new encryption key.
@@ -175,6 +232,6 @@ class Encryptor:
         finally:
             os.umask(old_umask)
 
-        self._key = new_key
-        self._fernet = Fernet(new_key)
+        invalidate_key_cache()
+        self._set_key(new_key)
         return new_key
@@ -2,6 +2,9 @@
 
 import sqlite3
 import os
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Iterator
 
@@ -12,6 +15,113 @@ from ..scanner.results import (
 )
 
 
+# Rows pulled per fetchmany() when streaming findings / scans and files
+FETCH_BATCH_SIZE = 1000
+STREAM_BATCH_SIZE = 500
+
+# Child table definitions; deleting a scan cascades to its files and matches
+_FILES_COLUMNS = """
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    source TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    modified TEXT NOT NULL,
+    has_sensitive_data INTEGER NOT NULL,
+    label_recommendation TEXT,
+    current_label TEXT,
+    error TEXT,
+    scan_time_ms INTEGER DEFAULT 0,
+    FOREIGN KEY (scan_id) REFERENCES scans(scan_id) ON DELETE CASCADE
+"""
+
+# (*_encrypted columns hold Fernet tokens, already urlsafe base64)
+_MATCHES_COLUMNS = """
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id INTEGER NOT NULL,
+    scan_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    value_encrypted TEXT NOT NULL,
+    value_redacted TEXT NOT NULL,
+    start_pos INTEGER NOT NULL,
+    end_pos INTEGER NOT NULL,
+    confidence REAL NOT NULL,
+    confidence_level TEXT NOT NULL,
+    detector TEXT NOT NULL,
+    context_encrypted TEXT,
+    is_test_data INTEGER NOT NULL,
+    model_version TEXT,
+    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE,
+    FOREIGN KEY (scan_id) REFERENCES scans(scan_id) ON DELETE CASCADE
+"""
+
+# Write statements, shared across store_scan calls so each is prepared once
+# and then served from the connection's statement cache
+_INSERT_SCAN = """
+    INSERT INTO scans (
+        scan_id, started_at, completed_at, source_path, source_type,
+        total_files, files_with_matches, files_errored, total_matches
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_FILE = """
+    INSERT INTO files (
+        scan_id, path, source, size_bytes, modified,
+        has_sensitive_data, label_recommendation, current_label,
+        error, scan_time_ms
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_MATCH = """
+    INSERT INTO matches (
+        file_id, scan_id, entity_type,
+        value_encrypted, value_redacted,
+        start_pos, end_pos, confidence, confidence_level,
+        detector, context_encrypted, is_test_data, model_version
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Finding columns in SELECT order. Rows are read as plain tuples and zipped
+# against _FINDING_KEYS; the two encrypted columns come last so the zip stops
+# before them and they can be picked off by position.
+_FINDING_KEYS = (
+    "id",
+    "file_id",
+    "scan_id",
+    "entity_type",
+    "value_redacted",
+    "start_pos",
+    "end_pos",
+    "confidence",
+    "confidence_level",
+    "detector",
+    "is_test_data",
+    "model_version",
+    "file_path",
+    "file_source",
+)
+
+_SELECT_FINDINGS = """
+    SELECT
+        m.id, m.file_id, m.scan_id, m.entity_type, m.value_redacted,
+        m.start_pos, m.end_pos, m.confidence, m.confidence_level,
+        m.detector, m.is_test_data, m.model_version,
+        f.path, f.source,
+        m.value_encrypted, m.context_encrypted
+    FROM matches m
+    JOIN files f ON m.file_id = f.id
+"""
+
+# Per-connection tuning applied on every connect (journal mode is set separately)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA trusted_schema=OFF",
+)
+
+
 def get_default_db_path() -> str:
     """Get default database path in user config directory."""
     if os.name == "nt":  # Windows
@@ -19,11 +129,22 @@ def get_default_db_path() -> str:
     else:  # Unix
         base = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
 
+    return _db_path_under(base)
+
+
+@lru_cache(maxsize=8)
+def _db_path_under(base: str) -> str:
+    """Create <base>/scrubiq once per base directory and return the db path."""
     db_dir = os.path.join(base, "scrubiq")
     os.makedirs(db_dir, exist_ok=True)
     return os.path.join(db_dir, "findings.db")
 
 
+def get_audit_path(db_path: str) -> str:
+    """Get the audit log path that sits next to a database file."""
+    return str(Path(db_path).with_suffix(".audit.jsonl"))
+
+
 class FindingsDatabase:
     """
     Encrypted SQLite database for scan findings.
@@ -57,25 +178,94 @@ class FindingsDatabase:
         self.encryptor = encryptor or Encryptor()
 
         # Audit log lives next to database
-        audit_path = str(Path(self.db_path).with_suffix(".audit.jsonl"))
-        self.audit = AuditLog(audit_path)
+        self.audit = AuditLog(get_audit_path(self.db_path))
 
         # Track if this is a new database
         is_new = not os.path.exists(self.db_path)
 
-        # Connect and initialize
-        self.conn = sqlite3.connect(self.db_path)
+        # Connect and initialize. Autocommit mode: writes are grouped with
+        # explicit transactions (see _transaction) instead of sqlite3's
+        # implicit ones.
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=512)
         self.conn.row_factory = sqlite3.Row
+        self.journal_mode = self._configure_connection()
         self._init_schema()
 
+        # Enforced only after _init_schema, since table rebuilds need it off
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
         # Log database open
         self.audit.log(
             AuditAction.DB_CREATE if is_new else AuditAction.DB_OPEN, {"path": self.db_path}
         )
 
+    def _configure_connection(self) -> str:
+        """
+        Switch to WAL and apply connection PRAGMAs.
+
+        WAL lets readers run alongside a writer and only fsyncs at
+        checkpoints, which makes synchronous=NORMAL safe. Filesystems
+        without shared-memory support (some network mounts) refuse WAL;
+        there the rollback journal and synchronous=FULL are kept.
+
+        Returns:
+            The journal mode in effect.
+        """
+        mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0].lower()
+        if mode == "wal":
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        return mode
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run a block of writes as one BEGIN IMMEDIATE ... COMMIT.
+
+        Takes the write lock up front (so busy_timeout applies before any
+        work is done) and rolls back if the block or the COMMIT raises.
+        With the rollback journal, COMMIT can fail with SQLITE_BUSY while
+        readers hold the file, leaving the transaction open otherwise.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except BaseException:
+            # Some errors already end the transaction on SQLite's side
+            if self.conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+
     def _init_schema(self):
         """Create database tables if they don't exist."""
-        cursor = self.conn.cursor()
+        with self._transaction() as cursor:
+            self._migrate_cascade(cursor)
+            self._create_tables(cursor)
+
+    def _migrate_cascade(self, cursor: sqlite3.Cursor):
+        """
+        Rebuild files/matches tables created before ON DELETE CASCADE.
+
+        SQLite can't alter a foreign key in place, so each table is copied
+        into a new one and swapped in (foreign_keys must be off). Dropped
+        indexes are recreated by _create_tables.
+        """
+        cursor.execute("PRAGMA foreign_key_list(matches)")
+        on_delete = {row[6] for row in cursor.fetchall()}
+        if not on_delete or on_delete == {"CASCADE"}:
+            return  # New database, or already migrated
+
+        for table, columns in (("files", _FILES_COLUMNS), ("matches", _MATCHES_COLUMNS)):
+            cursor.execute(f"CREATE TABLE {table}_new ({columns})")
+            cursor.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+            cursor.execute(f"DROP TABLE {table}")
+            cursor.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+    def _create_tables(self, cursor: sqlite3.Cursor):
+        """Issue the CREATE TABLE / CREATE INDEX statements."""
 
         # Scans table
         cursor.execute(
@@ -96,56 +286,33 @@ class FindingsDatabase:
         )
 
         # Files table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS files (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scan_id TEXT NOT NULL,
-                path TEXT NOT NULL,
-                source TEXT NOT NULL,
-                size_bytes INTEGER NOT NULL,
-                modified TEXT NOT NULL,
-                has_sensitive_data INTEGER NOT NULL,
-                label_recommendation TEXT,
-                current_label TEXT,
-                error TEXT,
-                scan_time_ms INTEGER DEFAULT 0,
-                FOREIGN KEY (scan_id) REFERENCES scans(scan_id)
-            )
-        """
-        )
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS files ({_FILES_COLUMNS})")
 
         # Matches table - sensitive fields are encrypted
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS matches (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                file_id INTEGER NOT NULL,
-                scan_id TEXT NOT NULL,
-                entity_type TEXT NOT NULL,
-                value_encrypted TEXT NOT NULL,
-                value_redacted TEXT NOT NULL,
-                start_pos INTEGER NOT NULL,
-                end_pos INTEGER NOT NULL,
-                confidence REAL NOT NULL,
-                confidence_level TEXT NOT NULL,
-                detector TEXT NOT NULL,
-                context_encrypted TEXT,
-                is_test_data INTEGER NOT NULL,
-                model_version TEXT,
-                FOREIGN KEY (file_id) REFERENCES files(id),
-                FOREIGN KEY (scan_id) REFERENCES scans(scan_id)
-            )
-        """
-        )
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS matches ({_MATCHES_COLUMNS})")
 
         # Indexes for common queries
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_scan ON files(scan_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_scan ON matches(scan_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_file ON matches(file_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_type ON matches(entity_type)")
 
-        self.conn.commit()
+        # Composite index matching get_findings filters; its scan_id prefix
+        # replaces the old single-column idx_matches_scan
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_matches_filter'"
+        )
+        has_filter_index = cursor.fetchone() is not None
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_matches_filter
+            ON matches(scan_id, entity_type, is_test_data, confidence)
+        """
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_matches_scan")
+
+        # Give the planner statistics for the new index once
+        if not has_filter_index:
+            cursor.execute("ANALYZE")
 
     def store_scan(self, scan_result: ScanResult) -> str:
         """
@@ -157,16 +324,28 @@ class FindingsDatabase:
         Returns:
             The scan_id of the stored scan.
         """
-        cursor = self.conn.cursor()
+        # One transaction (one commit) for the whole scan
+        with self._transaction() as cursor:
+            match_count = self._insert_scan(cursor, scan_result)
 
+        # Audit log
+        self.audit.log(
+            AuditAction.FINDING_STORE,
+            {
+                "source_path": scan_result.source_path,
+                "total_files": scan_result.total_files,
+            },
+            record_count=match_count,
+            scan_id=scan_result.scan_id,
+        )
+
+        return scan_result.scan_id
+
+    def _insert_scan(self, cursor: sqlite3.Cursor, scan_result: ScanResult) -> int:
+        """Insert scan, file and match rows. Returns the number of matches."""
         # Insert scan record
         cursor.execute(
-            """
-            INSERT INTO scans (
-                scan_id, started_at, completed_at, source_path, source_type,
-                total_files, files_with_matches, files_errored, total_matches
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+            _INSERT_SCAN,
             (
                 scan_result.scan_id,
                 scan_result.started_at.isoformat(),
@@ -180,19 +359,15 @@ class FindingsDatabase:
             ),
         )
 
-        # Insert file records and their matches
-        match_count = 0
-        for file_result in scan_result.files:
-            cursor.execute(
-                """
-                INSERT INTO files (
-                    scan_id, path, source, size_bytes, modified,
-                    has_sensitive_data, label_recommendation, current_label,
-                    error, scan_time_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        scan_id = scan_result.scan_id
+        files = scan_result.files
+
+        # Insert file records in one batch
+        cursor.executemany(
+            _INSERT_FILE,
+            [
                 (
-                    scan_result.scan_id,
+                    scan_id,
                     str(file_result.path),
                     file_result.source,
                     file_result.size_bytes,
@@ -206,54 +381,51 @@ class FindingsDatabase:
                     file_result.current_label,
                     file_result.error,
                     file_result.scan_time_ms,
-                ),
-            )
-
-            file_id = cursor.lastrowid
-
-            # Insert matches with encrypted sensitive fields
-            for match in file_result.matches:
-                cursor.execute(
-                    """
-                    INSERT INTO matches (
-                        file_id, scan_id, entity_type,
-                        value_encrypted, value_redacted,
-                        start_pos, end_pos, confidence, confidence_level,
-                        detector, context_encrypted, is_test_data, model_version
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        file_id,
-                        scan_result.scan_id,
-                        match.entity_type.value,
-                        self.encryptor.encrypt(match.value),
-                        match.redacted_value,
-                        match.start,
-                        match.end,
-                        match.confidence,
-                        match.confidence_level.value,
-                        match.detector,
-                        self.encryptor.encrypt(match.context) if match.context else None,
-                        1 if match.is_test_data else 0,
-                        match.model_version,
-                    ),
                 )
-                match_count += 1
-
-        self.conn.commit()
+                for file_result in files
+            ],
+        )
 
-        # Audit log
-        self.audit.log(
-            AuditAction.FINDING_STORE,
-            {
-                "source_path": scan_result.source_path,
-                "total_files": scan_result.total_files,
-            },
-            record_count=match_count,
-            scan_id=scan_result.scan_id,
+        # Recover file ids; the scan_id is new and ids increase in insert order
+        cursor.execute("SELECT id FROM files WHERE scan_id = ? ORDER BY id", (scan_id,))
+        file_ids = [row[0] for row in cursor]
+
+        # Encrypt every value and context in the scan with one batch call
+        file_matches = [
+            (file_id, match)
+            for file_id, file_result in zip(file_ids, files)
+            for match in file_result.matches
+        ]
+        n = len(file_matches)
+        sealed = self.encryptor.encrypt_many(
+            [match.value for _, match in file_matches]
+            + [match.context for _, match in file_matches]
         )
 
-        return scan_result.scan_id
+        match_rows = [
+            (
+                file_id,
+                scan_id,
+                match.entity_type.value,
+                value_encrypted,
+                match.redacted_value,
+                match.start,
+                match.end,
+                match.confidence,
+                match.confidence_level.value,
+                match.detector,
+                context_encrypted or None,
+                1 if match.is_test_data else 0,
+                match.model_version,
+            )
+            for (file_id, match), value_encrypted, context_encrypted in zip(
+                file_matches, sealed[:n], sealed[n:]
+            )
+        ]
+
+        cursor.executemany(_INSERT_MATCH, match_rows)
+
+        return len(match_rows)
 
     def get_scan(self, scan_id: str) -> Optional[dict]:
         """Get scan metadata by ID."""
@@ -274,7 +446,12 @@ class FindingsDatabase:
 
     def list_scans(self, limit: int = 100) -> list[dict]:
         """List recent scans."""
+        return list(self.list_scans_iter(limit))
+
+    def list_scans_iter(self, limit: int = 100) -> Iterator[dict]:
+        """Yield recent scans, newest first, without building a list."""
         cursor = self.conn.cursor()
+        cursor.arraysize = STREAM_BATCH_SIZE
         cursor.execute(
             """
             SELECT * FROM scans 
@@ -284,7 +461,9 @@ class FindingsDatabase:
             (limit,),
         )
 
-        return [dict(row) for row in cursor.fetchall()]
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield dict(row)
 
     def get_files(
         self,
@@ -301,7 +480,25 @@ class FindingsDatabase:
         Returns:
             List of file dictionaries.
         """
+        return list(self.get_files_iter(scan_id, only_with_matches))
+
+    def get_files_iter(
+        self,
+        scan_id: str,
+        only_with_matches: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Yield files from a scan one at a time (see get_files).
+
+        Args:
+            scan_id: The scan to retrieve files from.
+            only_with_matches: If True, only return files with sensitive data.
+
+        Yields:
+            File dictionaries, ordered by path.
+        """
         cursor = self.conn.cursor()
+        cursor.arraysize = STREAM_BATCH_SIZE
 
         query = "SELECT * FROM files WHERE scan_id = ?"
         params = [scan_id]
@@ -313,14 +510,12 @@ class FindingsDatabase:
 
         cursor.execute(query, params)
 
-        files = []
-        for row in cursor.fetchall():
-            file_dict = dict(row)
-            # Map 'path' to 'file_path' for consistency
-            file_dict["file_path"] = file_dict.pop("path")
-            files.append(file_dict)
-
-        return files
+        while rows := cursor.fetchmany():
+            for row in rows:
+                file_dict = dict(row)
+                # Map 'path' to 'file_path' for consistency
+                file_dict["file_path"] = file_dict.pop("path")
+                yield file_dict
 
     def get_findings(
         self,
@@ -345,13 +540,7 @@ class FindingsDatabase:
         """
         cursor = self.conn.cursor()
 
-        query = """
-            SELECT 
-                m.*, f.path as file_path, f.source as file_source
-            FROM matches m
-            JOIN files f ON m.file_id = f.id
-            WHERE m.confidence >= ?
-        """
+        query = _SELECT_FINDINGS + " WHERE m.confidence >= ?"
         params = [min_confidence]
 
         if scan_id:
@@ -368,21 +557,7 @@ class FindingsDatabase:
         cursor.execute(query, params)
 
         count = 0
-        for row in cursor:
-            finding = dict(row)
-
-            # Decrypt sensitive fields if requested
-            if decrypt:
-                finding["value"] = self.encryptor.decrypt(finding["value_encrypted"])
-                if finding["context_encrypted"]:
-                    finding["context"] = self.encryptor.decrypt(finding["context_encrypted"])
-                else:
-                    finding["context"] = ""
-
-            # Remove encrypted fields from output
-            del finding["value_encrypted"]
-            del finding["context_encrypted"]
-
+        for finding in self._iter_findings(cursor, decrypt):
             count += 1
             yield finding
 
@@ -401,35 +576,71 @@ class FindingsDatabase:
             scan_id=scan_id,
         )
 
+    def get_confidences(
+        self,
+        scan_id: str,
+        include_test_data: bool = False,
+    ) -> array:
+        """
+        Get match confidences for a scan as a sorted float array.
+
+        Reads only the confidence column - no joins, row dicts, or
+        decryption - so callers can count thresholds with bisect.
+
+        Args:
+            scan_id: The scan to read confidences from.
+            include_test_data: Include matches flagged as test data.
+
+        Returns:
+            array('d') of confidences in ascending order.
+        """
+        query = "SELECT confidence FROM matches WHERE scan_id = ?"
+        if not include_test_data:
+            query += " AND is_test_data = 0"
+        query += " ORDER BY confidence"
+
+        cursor = self.conn.execute(query, (scan_id,))
+        confidences = array("d", (row[0] for row in cursor))
+
+        self.audit.log(
+            AuditAction.FINDING_READ,
+            {"scan_id": scan_id, "type": "confidences"},
+            record_count=len(confidences),
+            scan_id=scan_id,
+        )
+
+        return confidences
+
     def get_findings_by_file(self, file_path: str, decrypt: bool = True) -> list[dict]:
         """Get all findings for a specific file path."""
         cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT m.*, f.path as file_path, f.source as file_source
-            FROM matches m
-            JOIN files f ON m.file_id = f.id
-            WHERE f.path = ?
-        """,
-            (file_path,),
-        )
+        cursor.execute(_SELECT_FINDINGS + " WHERE f.path = ?", (file_path,))
 
-        results = []
-        for row in cursor:
-            finding = dict(row)
+        return list(self._iter_findings(cursor, decrypt))
 
-            if decrypt:
-                finding["value"] = self.encryptor.decrypt(finding["value_encrypted"])
-                if finding["context_encrypted"]:
-                    finding["context"] = self.encryptor.decrypt(finding["context_encrypted"])
-                else:
-                    finding["context"] = ""
+    def _iter_findings(self, cursor: sqlite3.Cursor, decrypt: bool) -> Iterator[dict]:
+        """
+        Turn match rows into finding dicts, FETCH_BATCH_SIZE rows at a time.
 
-            del finding["value_encrypted"]
-            del finding["context_encrypted"]
-            results.append(finding)
+        Each block is fetched with one fetchmany() and its values and
+        contexts are decrypted with one decrypt_many() call. The cursor must
+        have run _SELECT_FINDINGS; rows are read as plain tuples.
+        """
+        cursor.row_factory = None
+        cursor.arraysize = FETCH_BATCH_SIZE
+        while rows := cursor.fetchmany():
+            # zip stops at _FINDING_KEYS, leaving the encrypted columns out
+            findings = [dict(zip(_FINDING_KEYS, row)) for row in rows]
 
-        return results
+            # Decrypt sensitive fields if requested
+            if decrypt:
+                values = self.encryptor.decrypt_many([row[-2] for row in rows])
+                contexts = self.encryptor.decrypt_many([row[-1] or "" for row in rows])
+                for finding, value, context in zip(findings, values, contexts):
+                    finding["value"] = value
+                    finding["context"] = context
+
+            yield from findings
 
     def delete_scan(self, scan_id: str) -> int:
         """
@@ -437,18 +648,14 @@ class FindingsDatabase:
 
         Returns number of matches deleted.
         """
-        cursor = self.conn.cursor()
-
-        # Count matches first
-        cursor.execute("SELECT COUNT(*) FROM matches WHERE scan_id = ?", (scan_id,))
-        match_count = cursor.fetchone()[0]
+        with self._transaction() as cursor:
+            # Matches are deleted explicitly only for the count: rowcount
+            # doesn't include rows removed by a cascade
+            cursor.execute("DELETE FROM matches WHERE scan_id = ?", (scan_id,))
+            match_count = cursor.rowcount
 
-        # Delete in order (matches -> files -> scan)
-        cursor.execute("DELETE FROM matches WHERE scan_id = ?", (scan_id,))
-        cursor.execute("DELETE FROM files WHERE scan_id = ?", (scan_id,))
-        cursor.execute("DELETE FROM scans WHERE scan_id = ?", (scan_id,))
-
-        self.conn.commit()
+            # Cascades to the scan's files
+            cursor.execute("DELETE FROM scans WHERE scan_id = ?", (scan_id,))
 
         self.audit.log(
             AuditAction.FINDING_DELETE,
@@ -465,16 +672,25 @@ class FindingsDatabase:
 
         Returns total number of matches deleted.
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM matches")
-        total_matches = cursor.fetchone()[0]
-
-        cursor.execute("DELETE FROM matches")
-        cursor.execute("DELETE FROM files")
-        cursor.execute("DELETE FROM scans")
-
-        self.conn.commit()
+        # Dropping and recreating the tables frees whole B-trees instead of
+        # deleting row by row. With foreign keys on, DROP TABLE would do an
+        # implicit row-by-row DELETE first, so they're off for the swap
+        # (the PRAGMA is a no-op inside a transaction).
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self._transaction() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM matches")
+                total_matches = cursor.fetchone()[0]
+
+                for table in ("matches", "files", "scans"):
+                    cursor.execute(f"DROP TABLE {table}")
+                self._create_tables(cursor)
+        finally:
+            self.conn.execute("PRAGMA foreign_keys=ON")
+
+        # Return the freed pages to the OS and empty the WAL
+        self.conn.execute("VACUUM")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
         self.audit.log(
             AuditAction.FINDING_DELETE,
@@ -488,29 +704,29 @@ class FindingsDatabase:
         """Get database statistics."""
         cursor = self.conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM scans")
-        scan_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM files")
-        file_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM matches")
-        match_count = cursor.fetchone()[0]
+        # Both table counts in one round trip
+        cursor.execute("SELECT (SELECT COUNT(*) FROM scans), (SELECT COUNT(*) FROM files)")
+        scan_count, file_count = cursor.fetchone()
 
-        cursor.execute("SELECT COUNT(*) FROM matches WHERE is_test_data = 0")
-        real_match_count = cursor.fetchone()[0]
-
-        # Matches by type
+        # One pass over matches; totals and per-type counts are folded in Python
         cursor.execute(
             """
-            SELECT entity_type, COUNT(*) as count 
-            FROM matches 
-            WHERE is_test_data = 0
-            GROUP BY entity_type
-            ORDER BY count DESC
+            SELECT entity_type, is_test_data, COUNT(*)
+            FROM matches
+            GROUP BY entity_type, is_test_data
         """
         )
-        by_type = {row["entity_type"]: row["count"] for row in cursor}
+        match_count = 0
+        real_counts: dict[str, int] = {}
+        for entity_type, is_test_data, count in cursor:
+            match_count += count
+            if not is_test_data:
+                real_counts[entity_type] = count
+
+        real_match_count = sum(real_counts.values())
+
+        # Matches by type, most common first
+        by_type = dict(sorted(real_counts.items(), key=lambda item: item[1], reverse=True))
 
         return {
             "scans": scan_count,
@@ -524,6 +740,14 @@ class FindingsDatabase:
     def close(self):
         """Close database connection."""
         self.audit.log(AuditAction.DB_CLOSE, {"path": self.db_path})
+        self.audit.close()
+
+        # Refresh planner statistics for tables that changed a lot
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+
         self.conn.close()
 
     def __enter__(self):
@@ -13,11 +13,25 @@ Training data format:
     }
 """
 
-from dataclasses import dataclass, asdict
+from array import array
+from dataclasses import dataclass
+from itertools import chain
 from typing import Iterator, Optional
 from enum import Enum
 import json
+import os
 import random
+import tempfile
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson decodes bytes directly; json.loads accepts bytes too
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
 
 
 class Label(Enum):
@@ -44,14 +58,26 @@ class TrainingExample:
     source: str = "unknown"
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "text": self.text,
+            "label": self.label,
+            "entity_type": self.entity_type,
+            "source": self.source,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "TrainingExample":
         return cls(**d)
 
     def to_jsonl(self) -> str:
-        return json.dumps(self.to_dict())
+        return self.to_jsonl_bytes().decode()
+
+    def to_jsonl_bytes(self) -> bytes:
+        """Encode as one UTF-8 JSON line (without the trailing newline)."""
+        if HAS_ORJSON:
+            # orjson encodes dataclasses natively, field for field
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict()).encode("utf-8")
 
     @classmethod
     def from_jsonl(cls, line: str) -> "TrainingExample":
@@ -84,9 +110,18 @@ NEMOTRON_ENTITY_MAP = {
 }
 
 
+def _load_nemotron_jsonl(path: str) -> Iterator[dict]:
+    """Yield Nemotron records from a raw JSONL export, decoding one line at a time."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
 def load_nemotron_pii(
     max_examples: Optional[int] = None,
     entity_types: Optional[list[str]] = None,
+    path: Optional[str] = None,
 ) -> Iterator[TrainingExample]:
     """
     Load Nemotron-PII dataset and convert to training format.
@@ -94,6 +129,8 @@ def load_nemotron_pii(
     Args:
         max_examples: Maximum examples to load (None = all)
         entity_types: Filter to specific entity types (None = all)
+        path: Raw JSONL export to read directly, bypassing the datasets
+            library (None = load via datasets)
 
     Yields:
         TrainingExample for each entity in the dataset
@@ -108,19 +145,30 @@ def load_nemotron_pii(
 
         for example in load_nemotron_pii(max_examples=1000):
             print(example.text, example.label)
+
+        # Or, from a JSONL export (one record per line):
+        # ds.to_json("./nemotron_pii.jsonl")
+        for example in load_nemotron_pii(path="./nemotron_pii.jsonl"):
+            ...
     """
-    try:
-        from datasets import load_dataset
-    except ImportError:
-        raise ImportError("datasets library required. Install with: pip install datasets")
+    if path is not None:
+        ds = _load_nemotron_jsonl(path)
+    else:
+        try:
+            from datasets import load_dataset
+        except ImportError:
+            raise ImportError("datasets library required. Install with: pip install datasets")
+
+        # Try loading from disk first (faster), fall back to HuggingFace
+        try:
+            from datasets import load_from_disk
 
-    # Try loading from disk first (faster), fall back to HuggingFace
-    try:
-        from datasets import load_from_disk
+            ds = load_from_disk("./nemotron_pii")["train"]
+        except (FileNotFoundError, KeyError, Exception):
+            ds = load_dataset("nvidia/Nemotron-PII", split="train")
 
-        ds = load_from_disk("./nemotron_pii")["train"]
-    except (FileNotFoundError, KeyError, Exception):
-        ds = load_dataset("nvidia/Nemotron-PII", split="train")
+    label = Label.TRUE_POSITIVE.value  # Nemotron entities are real PII
+    tokens: dict[str, str] = {}
 
     count = 0
     for record in ds:
@@ -135,26 +183,24 @@ def load_nemotron_pii(
             if entity_types and our_type not in entity_types:
                 continue
 
-            # Get entity position and value
+            # Get entity position
             start = entity.get("start", 0)
             end = entity.get("end", 0)
-            entity.get("value", text[start:end])
 
-            # Extract context (100 chars around entity)
+            # Context is up to 50 chars either side of the entity
             ctx_start = max(0, start - 50)
             ctx_end = min(len(text), end + 50)
-            context = text[ctx_start:ctx_end]
 
-            # Replace entity with token
-            token = f"[{our_type.upper()}]"
-            entity_in_context_start = start - ctx_start
-            entity_in_context_end = end - ctx_start
+            token = tokens.get(our_type)
+            if token is None:
+                token = tokens[our_type] = f"[{our_type.upper()}]"
 
-            anonymized = context[:entity_in_context_start] + token + context[entity_in_context_end:]
+            # Replace entity with token, slicing text directly in one join
+            anonymized = "".join((text[ctx_start:start], token, text[end:ctx_end]))
 
             yield TrainingExample(
                 text=anonymized,
-                label=Label.TRUE_POSITIVE.value,  # Nemotron entities are real PII
+                label=label,
                 entity_type=our_type,
                 source="nemotron",
             )
@@ -234,23 +280,30 @@ def generate_false_positives(
         TrainingExample with label=0 (false positive)
     """
     types_to_use = entity_types or list(FP_TEMPLATES.keys())
+    label = Label.FALSE_POSITIVE.value
 
     for ent_type in types_to_use:
         templates = FP_TEMPLATES.get(ent_type, [])
         if not templates:
             continue
 
-        for i in range(n_per_type):
-            template = random.choice(templates)
-
+        # Draw all picks for this type in one call
+        for template in random.choices(templates, k=n_per_type):
             yield TrainingExample(
                 text=template,
-                label=Label.FALSE_POSITIVE.value,
+                label=label,
                 entity_type=ent_type,
                 source="synthetic_fp",
             )
 
 
+# Review verdicts that become training labels (SKIP and others are dropped)
+_VERDICT_LABELS = {
+    "TP": Label.TRUE_POSITIVE.value,
+    "FP": Label.FALSE_POSITIVE.value,
+}
+
+
 def load_user_feedback(feedback_path: str = None) -> Iterator[TrainingExample]:
     """
     Load training examples from user review feedback.
@@ -280,17 +333,16 @@ def load_user_feedback(feedback_path: str = None) -> Iterator[TrainingExample]:
     if not feedback_path.exists():
         return
 
-    with open(feedback_path) as f:
+    # Binary mode skips text decoding; _json_loads takes the raw bytes
+    with open(feedback_path, "rb") as f:
         for line in f:
-            record = json.loads(line)
+            if not line.strip():
+                continue
+            record = _json_loads(line)
 
             # Convert verdict to label
-            verdict = record.get("verdict", "")
-            if verdict == "TP":
-                label = Label.TRUE_POSITIVE.value
-            elif verdict == "FP":
-                label = Label.FALSE_POSITIVE.value
-            else:
+            label = _VERDICT_LABELS.get(record.get("verdict", ""))
+            if label is None:
                 continue  # Skip unknown verdicts
 
             yield TrainingExample(
@@ -306,6 +358,7 @@ def prepare_training_dataset(
     fp_per_type: int = 100,
     include_user_feedback: bool = True,
     output_path: Optional[str] = None,
+    nemotron_path: Optional[str] = None,
 ) -> list[TrainingExample]:
     """
     Prepare complete training dataset.
@@ -320,6 +373,7 @@ def prepare_training_dataset(
         fp_per_type: FP examples per entity type
         include_user_feedback: Include user review verdicts
         output_path: Optional path to save as JSONL
+        nemotron_path: Optional Nemotron JSONL export (see load_nemotron_pii)
 
     Returns:
         List of TrainingExample
@@ -328,7 +382,7 @@ def prepare_training_dataset(
 
     # Load true positives from Nemotron
     print(f"Loading up to {nemotron_examples} examples from Nemotron-PII...")
-    for ex in load_nemotron_pii(max_examples=nemotron_examples):
+    for ex in load_nemotron_pii(max_examples=nemotron_examples, path=nemotron_path):
         examples.append(ex)
     print(f"  Loaded {len(examples)} true positives")
 
@@ -354,9 +408,9 @@ def prepare_training_dataset(
 
     # Save if path provided
     if output_path:
-        with open(output_path, "w") as f:
+        with open(output_path, "wb") as f:
             for ex in examples:
-                f.write(ex.to_jsonl() + "\n")
+                f.write(ex.to_jsonl_bytes() + b"\n")
         print(f"Saved {len(examples)} examples to {output_path}")
 
     # Summary
@@ -365,3 +419,57 @@ def prepare_training_dataset(
     print(f"\nTotal: {len(examples)} examples ({tp_count} TP, {fp_count} FP)")
 
     return examples
+
+
+def write_training_dataset(
+    output_path: str,
+    nemotron_examples: int = 5000,
+    fp_per_type: int = 100,
+    include_user_feedback: bool = True,
+    nemotron_path: Optional[str] = None,
+) -> int:
+    """
+    Stream a shuffled training dataset to JSONL without holding it in memory.
+
+    Examples are spooled to a temporary file as the loaders produce them,
+    recording the byte offset of each line. The offsets are then shuffled
+    and the lines copied to output_path in that order, so memory is bounded
+    by two 8-byte integers per example (its offset and its place in the
+    shuffled order) rather than the examples themselves.
+
+    Args:
+        output_path: Path to write the shuffled JSONL
+        nemotron_examples: Max TP examples from Nemotron (0 = skip Nemotron)
+        fp_per_type: FP examples per entity type
+        include_user_feedback: Include user review verdicts
+        nemotron_path: Optional Nemotron JSONL export (see load_nemotron_pii)
+
+    Returns:
+        Number of examples written
+    """
+    sources = []
+    if nemotron_examples:
+        sources.append(load_nemotron_pii(max_examples=nemotron_examples, path=nemotron_path))
+    sources.append(generate_false_positives(n_per_type=fp_per_type))
+    if include_user_feedback:
+        sources.append(load_user_feedback())
+
+    # Start of each line, plus the end of the last one
+    offsets = array("Q", [0])
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+
+    with tempfile.TemporaryFile(dir=out_dir) as spool:
+        for ex in chain.from_iterable(sources):
+            spool.write(ex.to_jsonl_bytes() + b"\n")
+            offsets.append(spool.tell())
+
+        order = array("Q", range(len(offsets) - 1))
+        random.shuffle(order)
+
+        with open(output_path, "wb") as out:
+            for i in order:
+                start = offsets[i]
+                spool.seek(start)
+                out.write(spool.read(offsets[i + 1] - start))
+
+    return len(order)
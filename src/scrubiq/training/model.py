@@ -5,10 +5,17 @@ This module provides:
 2. Integration with the classification pipeline
 """
 
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, ContextManager, Optional, Union
 import json
+import os
+import threading
 
 from .data import TrainingExample
 
@@ -16,6 +23,7 @@ from .data import TrainingExample
 # Check for SetFit availability
 try:
     from setfit import SetFitModel, SetFitTrainer
+    from sentence_transformers import SentenceTransformer
     from sentence_transformers.losses import CosineSimilarityLoss
 
     HAS_SETFIT = True
@@ -23,6 +31,50 @@ except ImportError:
     HAS_SETFIT = False
     SetFitModel = None
     SetFitTrainer = None
+    SentenceTransformer = None
+
+# Check for scikit-learn (SetFit's default logistic head, brings scipy)
+try:
+    from scipy.special import expit
+    from sklearn.linear_model import LogisticRegression
+
+    HAS_SKLEARN = True
+except ImportError:
+    HAS_SKLEARN = False
+    LogisticRegression = None
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# numpy (a setfit dependency) serializes the embedding cache
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+# Check for PyTorch (needed for reduced-precision inference)
+try:
+    import torch
+
+    HAS_TORCH = True
+except ImportError:
+    HAS_TORCH = False
+    torch = None
+
+# Check for ONNX Runtime (optional inference backend)
+try:
+    import onnxruntime
+
+    HAS_ONNX = True
+except ImportError:
+    HAS_ONNX = False
 
 # Check for datasets
 try:
@@ -34,9 +86,106 @@ except ImportError:
     Dataset = None
 
 
-@dataclass
+def _cpu_supports_bf16() -> bool:
+    """Check whether oneDNN can run bf16 kernels on this CPU (AVX512-BF16/AMX)."""
+    try:
+        return torch.backends.mkldnn.is_available() and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except (AttributeError, RuntimeError):
+        return False
+
+
+@lru_cache(maxsize=64)
+def _entity_token(entity_type: str) -> str:
+    """The [TOKEN] placeholder for an entity type, e.g. ssn -> [SSN]."""
+    return f"[{entity_type.upper()}]"
+
+
+@lru_cache(maxsize=1)
+def _configure_torch_threads() -> None:
+    """
+    Apply process-wide PyTorch thread settings once, before the first forward pass.
+
+    Inference is a single stream of batches, so inter-op parallelism only
+    adds thread handoffs. Intra-op threads keep PyTorch's default (physical
+    cores) unless SCRUBIQ_TORCH_THREADS overrides it.
+    """
+    threads = os.environ.get("SCRUBIQ_TORCH_THREADS")
+    if threads:
+        torch.set_num_threads(max(1, int(threads)))
+
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Only settable before any inter-op work has started
+
+
+def _dedupe_examples(examples: list[TrainingExample]) -> tuple[list[str], list[int]]:
+    """
+    Split examples into texts and labels, keeping the first of each text.
+
+    Identical texts only give SetFit's contrastive sampler zero-loss pairs.
+    """
+    first_label: dict[str, int] = {}
+    for ex in examples:
+        first_label.setdefault(ex.text, ex.label)
+    return list(first_label), list(first_label.values())
+
+
+def _binary_proba(embeddings: list, weights: Any, bias: float) -> Any:
+    """[P(class 0), P(class 1)] rows for a binary logistic head: sigmoid(E @ w + b)."""
+    positive = expit(np.asarray(embeddings) @ weights + bias)
+    return np.column_stack((1.0 - positive, positive))
+
+
+def _canonicalize(text: str) -> str:
+    """Lowercase and collapse whitespace runs, trimming the ends."""
+    return " ".join(text.lower().split())
+
+
+def _text_key(text: str) -> bytes:
+    """Fixed-size cache key for a context string."""
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class _DeferredQueue:
+    """One thread's predict_deferred() backlog of (text, future) pairs."""
+
+    __slots__ = ("items", "lock")
+
+    def __init__(self):
+        self.items: list = []
+        self.lock = threading.Lock()
+
+    def take(self) -> list:
+        """Detach and return everything queued so far."""
+        with self.lock:
+            items, self.items = self.items, []
+        return items
+
+
+class DeferredResult(Future):
+    """
+    Future for predict_deferred(); result() flushes the batch holding it.
+
+    The future remembers the queue it was added to, so resolving it from
+    any thread runs that queue early instead of waiting for it to fill up
+    (or for its owning thread to flush).
+    """
+
+    def __init__(self, classifier: "TPFPClassifier", queue: _DeferredQueue):
+        super().__init__()
+        self._classifier = classifier
+        self._queue = queue
+
+    def result(self, timeout: Optional[float] = None) -> "FilterResult":
+        if not self.done():
+            self._classifier._run_deferred(self._queue)
+        return super().result(timeout)
+
+
+@dataclass(slots=True, frozen=True)
 class FilterResult:
-    """Result of TP/FP classification."""
+    """Result of TP/FP classification (one per match, so slotted and immutable)."""
 
     is_true_positive: bool
     confidence: float
@@ -75,10 +224,45 @@ class TPFPClassifier:
     # Default base model - small but effective
     DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
+    # Inference backends for the sentence-transformer body
+    BACKENDS = ("torch", "onnx")
+
+    # Weight precisions for the PyTorch body
+    PRECISIONS = ("fp32", "fp16")
+
+    # Pooled embeddings kept by content hash; contexts are normalized to
+    # [TOKEN] form, so templates like "[SSN] found in test file" repeat a lot
+    EMBEDDING_CACHE_SIZE = 50_000
+
+    # Key the cache on _canonicalize(text), so contexts differing only in case
+    # or spacing share an entry. Exact for uncased WordPiece bodies like the
+    # default MiniLM, whose tokenizer discards both; turn off for cased models.
+    CANONICAL_CACHE_KEYS = True
+
+    # predict_deferred() runs a batch once this many texts are queued
+    DEFER_BATCH_SIZE = 32
+
+    # Embedding cache persisted next to the model, so later sessions start warm
+    EMBEDDING_CACHE_FILE = "scrubiq_emb_cache.npz"
+
+    # Model directory format recorded in scrubiq_meta.json
+    FORMAT_VERSION = "1.0.0"
+
+    # Texts per forward pass when encoding cache misses. SentenceTransformer.encode
+    # length-sorts its whole input before slicing batches (and restores order),
+    # so each batch is padded only to similar-length neighbours
+    ENCODE_BATCH_SIZE = 32
+
+    # Int8 export picked up by the ONNX backend when present in the model dir
+    # (write it with sentence_transformers.export_dynamic_quantized_onnx_model)
+    ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
     def __init__(
         self,
         model_path: Optional[str] = None,
         base_model: str = DEFAULT_MODEL,
+        backend: str = "torch",
+        precision: str = "fp32",
     ):
         """
         Initialize classifier.
@@ -86,33 +270,157 @@ class TPFPClassifier:
         Args:
             model_path: Path to trained model (None = untrained)
             base_model: Base sentence transformer for training
+            backend: Inference backend for the embedding body ("torch" or "onnx")
+            precision: PyTorch body weight precision ("fp32" or "fp16")
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {self.BACKENDS}")
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}, expected one of {self.PRECISIONS}")
+
         self.base_model = base_model
+        self.backend = backend
+        self.precision = precision
         self.model: Optional[SetFitModel] = None
         self.model_path = model_path
 
+        # (device_type, dtype) for torch.autocast once the body is reduced precision
+        self._autocast: Optional[tuple] = None
+
+        # LRU of _text_key(text) -> pooled embedding, oldest first
+        self._emb_cache: OrderedDict[bytes, Any] = OrderedDict()
+        # Scanner thread pools and cross-thread deferred flushes share the LRU
+        self._emb_lock = threading.Lock()
+        # Entries encoded since the cache was last loaded or saved
+        self._emb_unsaved = 0
+
+        # (head, (w, b) or None) for the binary logistic fast path
+        self._head_weights: Optional[tuple] = None
+
+        # Per-thread _DeferredQueue for predict_deferred()
+        self._deferred = threading.local()
+
         if model_path:
-            self.load(model_path)
+            self.load(model_path, backend=backend, precision=precision)
 
     @classmethod
-    def load(cls, path: Union[str, Path]) -> "TPFPClassifier":
-        """Load a trained model."""
+    def load(
+        cls,
+        path: Union[str, Path],
+        backend: str = "torch",
+        precision: str = "fp32",
+        low_memory: bool = False,
+    ) -> "TPFPClassifier":
+        """
+        Load a trained model.
+
+        Args:
+            path: Directory written by save()
+            backend: "onnx" runs the embedding body on ONNX Runtime (int8 when
+                the model dir has ONNX_INT8_FILE); falls back to PyTorch if
+                onnxruntime isn't installed
+            precision: "fp16" halves the PyTorch body's weights when the
+                hardware supports it (CUDA fp16, or CPU bf16); the logistic
+                head always stays fp32
+            low_memory: Trim per-process memory when one model is loaded in
+                several worker processes - the ONNX session skips its CPU
+                arena, so idle workers don't each hold a peak-sized buffer
+
+        Returns:
+            Loaded TPFPClassifier
+        """
         if not HAS_SETFIT:
             raise ImportError("setfit required. Install with: pip install setfit")
 
         path = Path(path)
-        instance = cls()
+        instance = cls(backend=backend, precision=precision)
         instance.model = SetFitModel.from_pretrained(str(path))
         instance.model_path = str(path)
 
+        if backend == "onnx":
+            instance._load_onnx_body(path, low_memory=low_memory)
+
+        # Reduced precision only applies to the PyTorch body (incl. ONNX fallback)
+        if instance.backend == "torch":
+            instance.model.model_body.eval()  # No dropout at inference
+            if precision == "fp16":
+                instance._half_precision_body()
+
         # Load metadata if exists
         meta_path = path / "scrubiq_meta.json"
         if meta_path.exists():
-            with open(meta_path) as f:
-                instance._metadata = json.load(f)
+            raw = meta_path.read_bytes()
+            instance._metadata = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            instance.base_model = instance._metadata.get("base_model", instance.base_model)
+
+        # Warm start from embeddings computed in earlier sessions
+        instance._load_embedding_cache(path)
 
         return instance
 
+    def _load_onnx_body(self, path: Path, low_memory: bool = False) -> None:
+        """
+        Swap the PyTorch embedding body for an ONNX Runtime one.
+
+        The logistic head is kept as is - it only consumes pooled
+        embeddings, so SetFitModel.predict works unchanged on top.
+        """
+        if not HAS_ONNX:
+            self.backend = "torch"
+            return
+
+        model_kwargs = {}
+        if (path / self.ONNX_INT8_FILE).exists():
+            model_kwargs["file_name"] = self.ONNX_INT8_FILE
+        if low_memory:
+            # The arena grows to the peak batch and never shrinks; with N
+            # workers that is N idle copies of the activation buffers
+            options = onnxruntime.SessionOptions()
+            options.enable_cpu_mem_arena = False
+            model_kwargs["session_options"] = options
+
+        try:
+            self.model.model_body = SentenceTransformer(
+                str(path), backend="onnx", model_kwargs=model_kwargs
+            )
+        except (ImportError, ValueError, TypeError):
+            # sentence-transformers < 3.2 or missing optimum: keep PyTorch
+            self.backend = "torch"
+
+    def _half_precision_body(self) -> None:
+        """
+        Convert the PyTorch embedding body to 16-bit weights.
+
+        CUDA gets fp16; CPUs with oneDNN bf16 support get bf16 (fp16 matmuls
+        are slow on most CPUs). Elsewhere the body stays fp32. The logistic
+        head is left in fp32 - its small logits are where half precision
+        would cost accuracy, and sentence-transformers hands it fp32 numpy
+        embeddings either way.
+        """
+        if not HAS_TORCH:
+            self.precision = "fp32"
+            return
+
+        if torch.cuda.is_available():
+            self.model.model_body = self.model.model_body.to("cuda").half()
+            self._autocast = ("cuda", torch.float16)
+        elif _cpu_supports_bf16():
+            self.model.model_body = self.model.model_body.to(torch.bfloat16)
+            self._autocast = ("cpu", torch.bfloat16)
+        else:
+            self.precision = "fp32"
+
+    def _inference(self) -> ContextManager:
+        """Context for forward passes: no autograd, autocast when reduced precision."""
+        stack = ExitStack()
+        if HAS_TORCH and self.backend == "torch":
+            _configure_torch_threads()
+            stack.enter_context(torch.inference_mode())
+            if self._autocast is not None:
+                device_type, dtype = self._autocast
+                stack.enter_context(torch.autocast(device_type, dtype=dtype))
+        return stack
+
     def save(self, path: Union[str, Path]):
         """Save trained model."""
         if self.model is None:
@@ -126,19 +434,105 @@ class TPFPClassifier:
         # Save metadata
         meta = {
             "base_model": self.base_model,
-            "version": "1.0.0",
+            "version": self.FORMAT_VERSION,
         }
-        with open(path / "scrubiq_meta.json", "w") as f:
-            json.dump(meta, f, indent=2)
+        if HAS_ORJSON:
+            data = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(meta, indent=2).encode("utf-8")
+        (path / "scrubiq_meta.json").write_bytes(data)
 
+        self.save_embedding_cache(path)
         self.model_path = str(path)
 
+    @property
+    def unsaved_embeddings(self) -> int:
+        """Embeddings encoded since the cache was last loaded or saved."""
+        return self._emb_unsaved
+
+    def save_embedding_cache(self, path: Optional[Union[str, Path]] = None) -> int:
+        """
+        Persist the embedding cache next to the model for later sessions.
+
+        An empty cache removes any existing file, so a retrained model saved
+        over an old directory never inherits the previous model's embeddings.
+
+        The file holds embeddings of match contexts (values replaced by
+        [TOKEN], surrounding text not) and is written unencrypted next to
+        the model, unlike the encrypted findings database.
+
+        Args:
+            path: Model directory (default: where the model was loaded/saved)
+
+        Returns:
+            Number of embeddings written
+        """
+        path = path or self.model_path
+        if path is None:
+            raise ValueError("No model directory. Save or load a model first.")
+
+        cache_path = Path(path) / self.EMBEDDING_CACHE_FILE
+        with self._emb_lock:
+            items = list(self._emb_cache.items())
+            self._emb_unsaved = 0
+        if not items or not HAS_NUMPY:
+            cache_path.unlink(missing_ok=True)
+            return 0
+
+        # 16-byte digests as a uint8 matrix; embeddings stacked row for row
+        keys = np.frombuffer(b"".join(key for key, _ in items), dtype=np.uint8).reshape(-1, 16)
+        embeddings = np.stack([embedding for _, embedding in items])
+
+        # Write-then-rename so a crash never leaves a truncated cache
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, tag=np.array(self._cache_tag()), keys=keys, embs=embeddings)
+        os.replace(tmp_path, cache_path)
+
+        return len(keys)
+
+    def _load_embedding_cache(self, path: Path) -> None:
+        """Fill the embedding cache from disk if it matches this model's setup."""
+        cache_path = path / self.EMBEDDING_CACHE_FILE
+        if not HAS_NUMPY or not cache_path.exists():
+            return
+
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if str(data["tag"]) != self._cache_tag():
+                    return  # Embedding space changed; start cold
+                keys = data["keys"]
+                embeddings = data["embs"]
+        except (OSError, KeyError, ValueError):
+            return  # Unreadable cache is just a cold start
+
+        cache = self._emb_cache
+        for key, embedding in zip(keys, embeddings):
+            cache[key.tobytes()] = embedding
+
+        while len(cache) > self.EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _cache_tag(self) -> str:
+        """Describe the embedding space a persisted cache was built in."""
+        return json.dumps(
+            {
+                "base_model": self.base_model,
+                "version": self.FORMAT_VERSION,
+                "backend": self.backend,
+                "precision": self.precision,
+                "canonical_keys": self.CANONICAL_CACHE_KEYS,
+            },
+            sort_keys=True,
+        )
+
     def train(
         self,
         examples: list[TrainingExample],
         num_iterations: int = 20,
         batch_size: int = 16,
         show_progress: bool = True,
+        precision: str = "fp32",
     ) -> dict:
         """
         Train the TP/FP classifier.
@@ -148,37 +542,54 @@ class TPFPClassifier:
             num_iterations: Number of contrastive pairs per example
             batch_size: Training batch size
             show_progress: Show progress bar
+            precision: "fp16" trains with automatic mixed precision when a
+                CUDA device is present (fp32 master weights); ignored on CPU
 
         Returns:
             Training metrics dict
         """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}, expected one of {self.PRECISIONS}")
         if not HAS_SETFIT:
             raise ImportError("setfit required for training. Install with: pip install setfit")
         if not HAS_DATASETS:
             raise ImportError("datasets required for training. Install with: pip install datasets")
 
-        # Convert to HuggingFace Dataset
-        texts = [ex.text for ex in examples]
-        labels = [ex.label for ex in examples]
+        # Convert to HuggingFace Dataset, one row per distinct text
+        texts, labels = _dedupe_examples(examples)
 
         dataset = Dataset.from_dict(
             {
                 "text": texts,
                 "label": labels,
             }
-        )
+        ).class_encode_column("label")
 
-        # Split train/eval (90/10)
-        split = dataset.train_test_split(test_size=0.1, seed=42)
+        # Split train/eval (90/10), keeping the TP/FP ratio in both halves
+        try:
+            split = dataset.train_test_split(test_size=0.1, stratify_by_column="label", seed=42)
+        except ValueError:
+            # Too few examples of a class to stratify
+            split = dataset.train_test_split(test_size=0.1, seed=42)
         train_ds = split["train"]
         eval_ds = split["test"]
 
+        if len(texts) < len(examples):
+            print(f"Dropped {len(examples) - len(texts)} duplicate examples")
         print(f"Training on {len(train_ds)} examples, eval on {len(eval_ds)}")
         print(f"  True positives: {sum(labels)}")
         print(f"  False positives: {len(labels) - sum(labels)}")
 
-        # Initialize model
+        # Initialize model; embeddings from any previous model are stale
         self.model = SetFitModel.from_pretrained(self.base_model)
+        with self._emb_lock:
+            self._emb_cache.clear()
+            self._emb_unsaved = 0
+
+        # Mixed precision only pays off (and is only supported) on CUDA
+        use_amp = precision == "fp16" and HAS_TORCH and torch.cuda.is_available()
+        if use_amp:
+            print("  Mixed precision: fp16 (CUDA)")
 
         # Create trainer
         trainer = SetFitTrainer(
@@ -188,6 +599,7 @@ class TPFPClassifier:
             loss_class=CosineSimilarityLoss,
             num_iterations=num_iterations,
             batch_size=batch_size,
+            use_amp=use_amp,
             show_progress_bar=show_progress,
         )
 
@@ -214,44 +626,185 @@ class TPFPClassifier:
         Returns:
             FilterResult with is_true_positive and confidence
         """
-        if self.model is None:
-            raise ValueError("No model loaded. Train or load a model first.")
-
-        # Get prediction
-        prediction = self.model.predict([text])[0]
-
-        # Get probabilities if available
-        try:
-            probs = self.model.predict_proba([text])[0]
-            confidence = max(probs)
-        except (AttributeError, NotImplementedError):
-            confidence = 1.0 if prediction in [0, 1] else 0.5
-
-        return FilterResult(
-            is_true_positive=bool(prediction == 1),
-            confidence=float(confidence),
-        )
+        return self.predict_batch([text])[0]
 
     def predict_batch(self, texts: list[str]) -> list[FilterResult]:
         """Predict multiple texts at once (faster)."""
         if self.model is None:
             raise ValueError("No model loaded. Train or load a model first.")
 
-        predictions = self.model.predict(texts)
+        # A differentiable (torch) head needs tensors; let SetFit drive it
+        if getattr(self.model, "has_differentiable_head", False):
+            with self._inference():
+                probs = self.model.predict_proba(texts)
+            classes = None  # probability columns are the label ids
+        else:
+            embeddings = self._embed(texts)
+            head = self.model.model_head
+
+            weights = self._binary_head_weights(head)
+            if weights is not None:
+                probs = _binary_proba(embeddings, *weights)
+            else:
+                try:
+                    probs = head.predict_proba(embeddings)
+                except (AttributeError, NotImplementedError):
+                    predictions = head.predict(embeddings)
+                    probs = None
+            classes = getattr(head, "classes_", None)
+
+        # One pass gives both: the argmax column is the prediction and its
+        # probability the confidence (what predict() would have computed again)
+        if probs is None:
+            is_tp = [bool(pred == 1) for pred in predictions]
+            confidences = [1.0] * len(is_tp)
+        else:
+            # One tolist() turns the whole array/tensor into native floats
+            rows = probs.tolist() if hasattr(probs, "tolist") else probs
+            n_classes = len(rows[0]) if rows else 0
+
+            # Per-column "is TP" flags, coerced to native bools once per batch
+            labels = range(n_classes) if classes is None else classes
+            positive = [bool(label == 1) for label in labels]
+            columns = range(n_classes)
+
+            is_tp = []
+            confidences = []
+            for row in rows:
+                best = max(columns, key=row.__getitem__)
+                is_tp.append(positive[best])
+                confidences.append(row[best])
+
+        return [FilterResult(tp, conf) for tp, conf in zip(is_tp, confidences)]
+
+    def _binary_head_weights(self, head: Any) -> Optional[tuple]:
+        """
+        (coef, intercept) of a binary one-vs-rest LogisticRegression head.
+
+        For that head predict_proba is just sigmoid(E @ w + b); scoring it
+        directly skips sklearn's per-call input validation. Extracted once
+        per head object, as float32 (half of sklearn's float64 storage).
+        None for any other head (handled by predict_proba).
+        """
+        cached = self._head_weights
+        if cached is not None and cached[0] is head:
+            return cached[1]
+
+        weights = None
+        if (
+            HAS_SKLEARN
+            and HAS_NUMPY
+            and isinstance(head, LogisticRegression)
+            and len(getattr(head, "classes_", ())) == 2
+            and getattr(head, "multi_class", "auto") != "multinomial"
+        ):
+            # float32 like the embeddings: float64 coef_ would make numpy upcast
+            # (copy) the whole embedding matrix on every batch
+            weights = (
+                np.ascontiguousarray(head.coef_[0], dtype=np.float32),
+                float(head.intercept_[0]),
+            )
+
+        self._head_weights = (head, weights)
+        return weights
+
+    def predict_deferred(self, text: str) -> DeferredResult:
+        """
+        Queue text for batched prediction and return a future for its result.
+
+        Texts queue per thread and run through predict_batch() once
+        DEFER_BATCH_SIZE are waiting, on flush_deferred(), or as soon as
+        any pending future's result() is requested.
+
+        Usage:
+            futures = [classifier.predict_deferred(ctx) for ctx in contexts]
+            classifier.flush_deferred()
+            results = [f.result() for f in futures]
+        """
+        queue = self._queue()
+        future = DeferredResult(self, queue)
+        with queue.lock:
+            queue.items.append((text, future))
+            full = len(queue.items) >= self.DEFER_BATCH_SIZE
+        if full:
+            self._run_deferred(queue)
+        return future
+
+    def flush_deferred(self) -> None:
+        """Run predict_batch() on this thread's queued texts and resolve their futures."""
+        self._run_deferred(self._queue())
+
+    def _run_deferred(self, queue: _DeferredQueue) -> None:
+        """Predict everything waiting in queue and resolve its futures."""
+        pending = queue.take()
+        if not pending:
+            # Already taken by another flush, which resolves the futures itself
+            return
+
+        futures = [future for _, future in pending]
+        try:
+            results = self.predict_batch([text for text, _ in pending])
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
 
+        for future, result in zip(futures, results):
+            future.set_result(result)
+
+    def _queue(self) -> _DeferredQueue:
+        """This thread's predict_deferred() queue."""
         try:
-            probs = self.model.predict_proba(texts)
-            confidences = [max(p) for p in probs]
-        except (AttributeError, NotImplementedError):
-            confidences = [1.0] * len(predictions)
-
-        return [
-            FilterResult(
-                is_true_positive=bool(pred == 1),
-                confidence=float(conf),
-            )
-            for pred, conf in zip(predictions, confidences)
-        ]
+            return self._deferred.queue
+        except AttributeError:
+            self._deferred.queue = _DeferredQueue()
+            return self._deferred.queue
+
+    def _embed(self, texts: list[str]) -> list:
+        """
+        Get pooled embeddings for texts, encoding only cache misses.
+
+        Misses are de-duplicated and handed to a single encode() call, so
+        length bucketing sees every miss at once, then stored in the LRU
+        (evicting the oldest past EMBEDDING_CACHE_SIZE).
+        """
+        cache = self._emb_cache
+        if self.CANONICAL_CACHE_KEYS:
+            keys = [_text_key(_canonicalize(text)) for text in texts]
+        else:
+            keys = [_text_key(text) for text in texts]
+
+        # Hits are copied out under the lock, so another thread evicting
+        # them afterwards can't break this batch
+        found: dict[bytes, Any] = {}
+        missing: dict[bytes, str] = {}
+        with self._emb_lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                embedding = cache.get(key)
+                if embedding is None:
+                    missing[key] = text
+                else:
+                    cache.move_to_end(key)
+                    found[key] = embedding
+
+        if missing:
+            # Encoding runs unlocked; threads racing on one miss just both encode it
+            with self._inference():
+                encoded = self.model.encode(
+                    list(missing.values()), batch_size=self.ENCODE_BATCH_SIZE
+                )
+            found.update(zip(missing, encoded))
+
+            with self._emb_lock:
+                for key in missing:
+                    cache[key] = found[key]
+                self._emb_unsaved += len(missing)
+                while len(cache) > self.EMBEDDING_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return [found[key] for key in keys]
 
     def format_match_context(
         self,
@@ -262,7 +815,9 @@ class TPFPClassifier:
         """
         Format a match's context for prediction.
 
-        Replaces the entity value with [TOKEN] to match training format.
+        Replaces every occurrence of the entity value with [TOKEN] to match
+        training format (ReviewSample.anonymize_context does the same), so
+        no copy of the raw value reaches the model.
 
         Args:
             context: Text surrounding the match
@@ -272,8 +827,9 @@ class TPFPClassifier:
         Returns:
             Formatted string ready for predict()
         """
-        token = f"[{entity_type.upper()}]"
-        return context.replace(value, token)
+        if not value:
+            return context  # replace("") would insert a token between every char
+        return context.replace(value, _entity_token(entity_type))
 
 
 def is_available() -> bool:
@@ -0,0 +1,37 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+
+from scrubiq.classifier.extractors.registry import ExtractorRegistry
+from scrubiq.classifier.extractors.text import TextExtractor
+
+# Trained TP/FP model directory for the real-model tests (skipped when unset)
+FIXTURE_MODEL_PATH = os.environ.get("SCRUBIQ_TEST_TPFP_MODEL")
+
+
+# Extractors and the registry hold no per-file state, so one instance serves every test
+@pytest.fixture(scope="session")
+def extractor():
+    """Shared plain-text extractor."""
+    return TextExtractor()
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """Shared extractor registry."""
+    return ExtractorRegistry()
+
+
+@pytest.fixture(scope="session")
+def tpfp_model():
+    """Load the TP/FP classifier once for the whole test session."""
+    if not FIXTURE_MODEL_PATH:
+        pytest.skip("Set SCRUBIQ_TEST_TPFP_MODEL to a trained model directory")
+
+    from scrubiq.training.model import TPFPClassifier, is_available
+
+    if not is_available():
+        pytest.skip("setfit not installed")
+    return TPFPClassifier.load(FIXTURE_MODEL_PATH)
@@ -0,0 +1,65 @@
+"""Tests for the scrubiq CLI commands."""
+
+import json
+
+from click.testing import CliRunner
+
+from scrubiq.cli.main import cli
+
+
+class TestScanCommand:
+    """Test the scan command's report output."""
+
+    def test_json_output_is_utf8_for_non_ascii_paths(self, tmp_path):
+        """JSON export should be UTF-8 regardless of the locale encoding."""
+        docs = tmp_path / "données"
+        docs.mkdir()
+        (docs / "résumé.txt").write_text("SSN: 078-05-1120\n")
+        output = tmp_path / "results.json"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "scan",
+                str(docs),
+                "--no-presidio",
+                "--no-store",
+                "--quiet",
+                "--format",
+                "json",
+                "--output",
+                str(output),
+            ],
+        )
+
+        assert result.exit_code == 1, result.output  # Sensitive data found
+        data = json.loads(output.read_bytes().decode("utf-8"))
+        assert data["files"][0]["path"].endswith("résumé.txt")
+
+
+class TestTrainCommand:
+    """Test the train command's data options."""
+
+    def test_data_only_writes_dataset(self, tmp_path, monkeypatch):
+        import scrubiq.training.data as data_mod
+
+        export = tmp_path / "nemotron_pii.jsonl"
+        export.write_text("")
+        model_dir = tmp_path / "tpfp-v1"
+        calls = []
+
+        def fake_write(output_path, **kwargs):
+            calls.append((output_path, kwargs))
+            return 0
+
+        monkeypatch.setattr(data_mod, "write_training_dataset", fake_write)
+
+        result = CliRunner().invoke(
+            cli,
+            ["train", "--data-only", "--nemotron-path", str(export), "--output", str(model_dir)],
+        )
+
+        assert result.exit_code == 0, result.output
+        ((output_path, kwargs),) = calls
+        assert output_path == str(model_dir / "training_data.jsonl")
+        assert kwargs["nemotron_path"] == str(export)
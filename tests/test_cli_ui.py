@@ -18,7 +18,7 @@ class TestScanStats:
         assert stats.with_matches == 0
         assert stats.errors == 0
         assert stats.entity_counts == {}
-        assert stats.recent_matches == []
+        assert list(stats.recent_matches) == []
 
     def test_with_values(self):
         stats = ScanStats(
@@ -90,6 +90,9 @@ class TestScanUI:
         assert "ssn" in ui.stats.entity_counts
         assert ui.stats.entity_counts["ssn"] == 1
 
+        ui.update(sample_file_result)
+        assert ui.stats.entity_counts["ssn"] == 2
+
     def test_update_tracks_recent_matches(self, ui, sample_file_result):
         ui.start(total=10)
         ui.update(sample_file_result)
@@ -122,6 +125,11 @@ class TestScanUI:
 
         # Should only keep last 3
         assert len(ui.stats.recent_matches) == 3
+        assert [m["file"] for m in ui.stats.recent_matches] == [
+            "file2.txt",
+            "file3.txt",
+            "file4.txt",
+        ]
 
     def test_update_tracks_errors(self, ui, tmp_path):
         ui.start(total=10)
@@ -188,8 +196,7 @@ class TestUIIntegration:
         scanner = Scanner()
         ui = ScanUI(quiet=True)
 
-        files = list(scanner._iter_files(tmp_path))
-        ui.start(total=len(files))
+        ui.start(total=scanner.count_files(str(tmp_path)))
 
         def on_file(result):
             ui.update(result)
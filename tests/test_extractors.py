@@ -1,18 +1,58 @@
 """Tests for text extractors."""
 
 import pytest
-from pathlib import Path
-
-from scrubiq.classifier.extractors.base import ExtractionError
-from scrubiq.classifier.extractors.registry import ExtractorRegistry
-from scrubiq.classifier.extractors.text import TextExtractor
+from pathlib import Path, PurePosixPath
+
+from scrubiq.classifier.extractors.base import ExtractionError, get_extension, get_name_extension
+
+# Expected values shared by the extraction assertions
+_SSN = "078-05-1120"
+_ENV_LINES = {"API_KEY=sk-secret123", "PASSWORD=hunter2"}
+
+# Built once at import rather than inside each parametrized case. Routing only
+# looks at the file name, so the lightweight pure path type is enough
+_CAN_EXTRACT = [
+    (PurePosixPath(f"test{suffix}"), expected)
+    for suffix, expected in [
+        (".txt", True),
+        (".docx", True),
+        (".xlsx", True),
+        (".pdf", True),
+        (".pptx", True),
+        (".msg", True),
+        (".rtf", True),
+        (".eml", True),
+        (".xyz", False),
+        (".exe", False),
+    ]
+]
+_UPPERCASE = [PurePosixPath(name) for name in ("test.TXT", "test.DOCX", "test.PDF")]
+_CAN_HANDLE = [
+    (PurePosixPath("test.txt"), True),
+    (PurePosixPath("TEST.TXT"), True),
+    (PurePosixPath("test.csv"), True),
+    (PurePosixPath("test.docx"), False),
+]
+
+
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory):
+    """Write the integration sample files once; tests only read them."""
+    directory = tmp_path_factory.mktemp("samples")
+    files = {}
+    for name, content in [
+        ("data.csv", "name,ssn\nJohn Smith,078-05-1120\n"),
+        ("data.json", '{"employee": {"ssn": "078-05-1120"}}'),
+        (".env", "API_KEY=sk-secret123\nPASSWORD=hunter2"),
+        ("query.sql", "SELECT * FROM users WHERE ssn = '078-05-1120';"),
+    ]:
+        path = directory / name
+        path.write_text(content)
+        files[name] = path
+    return files
 
 
 class TestTextExtractor:
-    @pytest.fixture
-    def extractor(self):
-        return TextExtractor()
-
     def test_extensions_include_common_types(self, extractor):
         exts = extractor.extensions
         assert ".txt" in exts
@@ -23,36 +63,35 @@ class TestTextExtractor:
         assert ".sql" in exts
         assert ".env" in exts
 
-    def test_can_handle_txt(self, extractor):
-        assert extractor.can_handle(Path("test.txt"))
-        assert extractor.can_handle(Path("TEST.TXT"))
-        assert extractor.can_handle(Path("test.csv"))
-
-    def test_cannot_handle_docx(self, extractor):
-        assert not extractor.can_handle(Path("test.docx"))
-
-    def test_extract_utf8(self, extractor, tmp_path):
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello, World! SSN: 078-05-1120", encoding="utf-8")
-
-        text = extractor.extract(test_file)
-        assert "Hello, World!" in text
-        assert "078-05-1120" in text
-
-    def test_extract_utf8_bom(self, extractor, tmp_path):
+    @pytest.mark.parametrize("path,expected", _CAN_HANDLE, ids=[p.name for p, _ in _CAN_HANDLE])
+    def test_can_handle(self, extractor, path, expected):
+        assert extractor.can_handle(path) is expected
+
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [
+            (b"Hello, World! SSN: 078-05-1120", f"Hello, World! SSN: {_SSN}"),
+            (b"\xef\xbb\xbfHello BOM", "Hello BOM"),
+            (b"Hello \xe9\xe8\xe0", "Hello éèà"),  # latin-1 fallback
+            (b"a\r\nb\rc\n", "a\nb\nc\n"),
+        ],
+        ids=["utf8", "utf8_bom", "latin1", "newlines"],
+    )
+    def test_extract_decodes(self, extractor, tmp_path, payload, expected):
         test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"\xef\xbb\xbfHello BOM")
+        test_file.write_bytes(payload)
 
-        text = extractor.extract(test_file)
-        assert "Hello BOM" in text
+        assert extractor.extract(test_file) == expected
 
-    def test_extract_latin1_fallback(self, extractor, tmp_path):
+    def test_extract_reads_file_once(self, extractor, tmp_path, monkeypatch):
         test_file = tmp_path / "test.txt"
-        # Write some latin-1 specific bytes
-        test_file.write_bytes(b"Hello \xe9\xe8\xe0")  # éèà in latin-1
+        test_file.write_bytes(b"Hello \xe9")
 
-        text = extractor.extract(test_file)
-        assert "Hello" in text
+        reads = []
+        read_bytes = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda p: reads.append(p) or read_bytes(p))
+        extractor.extract(test_file)
+        assert reads == [test_file]
 
     def test_extract_nonexistent_file(self, extractor, tmp_path):
         with pytest.raises(ExtractionError):
@@ -60,37 +99,17 @@ class TestTextExtractor:
 
 
 class TestExtractorRegistry:
-    @pytest.fixture
-    def registry(self):
-        return ExtractorRegistry()
-
-    def test_can_extract_txt(self, registry):
-        assert registry.can_extract(Path("test.txt"))
-
-    def test_can_extract_docx(self, registry):
-        assert registry.can_extract(Path("test.docx"))
-
-    def test_can_extract_xlsx(self, registry):
-        assert registry.can_extract(Path("test.xlsx"))
+    @pytest.mark.parametrize("path,expected", _CAN_EXTRACT, ids=[p.name for p, _ in _CAN_EXTRACT])
+    def test_can_extract(self, registry, path, expected):
+        assert registry.can_extract(path) is expected
 
-    def test_can_extract_pdf(self, registry):
-        assert registry.can_extract(Path("test.pdf"))
+    def test_supports_extension_from_name(self, registry):
+        assert registry.supports_extension(get_name_extension("Report.TXT"))
+        assert not registry.supports_extension(get_name_extension("archive.tar.xyz"))
 
-    def test_can_extract_pptx(self, registry):
-        assert registry.can_extract(Path("test.pptx"))
-
-    def test_can_extract_msg(self, registry):
-        assert registry.can_extract(Path("test.msg"))
-
-    def test_can_extract_rtf(self, registry):
-        assert registry.can_extract(Path("test.rtf"))
-
-    def test_can_extract_eml(self, registry):
-        assert registry.can_extract(Path("test.eml"))
-
-    def test_cannot_extract_unknown(self, registry):
-        assert not registry.can_extract(Path("test.xyz"))
-        assert not registry.can_extract(Path("test.exe"))
+    @pytest.mark.parametrize("name", ["a.txt", "A.Docx", "a.tar.gz", ".env", ".env.local", "noext"])
+    def test_name_extension_matches_path(self, name):
+        assert get_name_extension(name) == get_extension(PurePosixPath(name))
 
     def test_extract_unknown_raises_error(self, registry, tmp_path):
         test_file = tmp_path / "test.xyz"
@@ -105,7 +124,7 @@ class TestExtractorRegistry:
         test_file.write_text("SSN: 078-05-1120")
 
         text = registry.extract(test_file)
-        assert "078-05-1120" in text
+        assert _SSN in text
 
     def test_supported_extensions(self, registry):
         exts = registry.supported_extensions
@@ -121,45 +140,27 @@ class TestExtractorRegistry:
         # Should be sorted and unique
         assert exts == sorted(set(exts))
 
-    def test_case_insensitive_extension(self, registry):
-        assert registry.can_extract(Path("test.TXT"))
-        assert registry.can_extract(Path("test.DOCX"))
-        assert registry.can_extract(Path("test.PDF"))
+    @pytest.mark.parametrize("path", _UPPERCASE, ids=[p.name for p in _UPPERCASE])
+    def test_case_insensitive_extension(self, registry, path):
+        assert registry.can_extract(path)
 
 
 class TestExtractorIntegration:
     """Integration tests that actually create and extract from files."""
 
-    @pytest.fixture
-    def registry(self):
-        return ExtractorRegistry()
-
-    def test_extract_csv(self, registry, tmp_path):
-        csv_file = tmp_path / "data.csv"
-        csv_file.write_text("name,ssn\nJohn Smith,078-05-1120\n")
-
-        text = registry.extract(csv_file)
+    def test_extract_csv(self, registry, sample_files):
+        text = registry.extract(sample_files["data.csv"])
         assert "John Smith" in text
-        assert "078-05-1120" in text
-
-    def test_extract_json(self, registry, tmp_path):
-        json_file = tmp_path / "data.json"
-        json_file.write_text('{"employee": {"ssn": "078-05-1120"}}')
-
-        text = registry.extract(json_file)
-        assert "078-05-1120" in text
-
-    def test_extract_env(self, registry, tmp_path):
-        env_file = tmp_path / ".env"
-        env_file.write_text("API_KEY=sk-secret123\nPASSWORD=hunter2")
+        assert _SSN in text
 
-        text = registry.extract(env_file)
-        assert "sk-secret123" in text
-        assert "hunter2" in text
+    def test_extract_json(self, registry, sample_files):
+        text = registry.extract(sample_files["data.json"])
+        assert _SSN in text
 
-    def test_extract_sql(self, registry, tmp_path):
-        sql_file = tmp_path / "query.sql"
-        sql_file.write_text("SELECT * FROM users WHERE ssn = '078-05-1120';")
+    def test_extract_env(self, registry, sample_files):
+        text = registry.extract(sample_files[".env"])
+        assert _ENV_LINES <= set(text.splitlines())
 
-        text = registry.extract(sql_file)
-        assert "078-05-1120" in text
+    def test_extract_sql(self, registry, sample_files):
+        text = registry.extract(sample_files["query.sql"])
+        assert _SSN in text
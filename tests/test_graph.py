@@ -1,8 +1,14 @@
 """Tests for Microsoft Graph API client."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from scrubiq.auth import graph as _graph_mod
 from scrubiq.auth.graph import (
     GraphClient,
     DriveItem,
@@ -14,24 +20,60 @@ from scrubiq.auth.graph import (
 )
 
 
+_DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Drive item payloads as returned by the Graph API (from_api only reads them)
+_FILE_API_PAYLOAD = {
+    "id": "item123",
+    "name": "document.docx",
+    "size": 12345,
+    "lastModifiedDateTime": "2024-01-15T10:30:00Z",
+    "parentReference": {"path": "/drive/root:/Documents"},
+    "webUrl": "https://contoso.sharepoint.com/sites/HR/Documents/document.docx",
+    "file": {"mimeType": _DOCX_MIME},
+}
+_FOLDER_API_PAYLOAD = {
+    "id": "folder123",
+    "name": "HR Documents",
+    "size": 0,
+    "lastModifiedDateTime": "2024-01-15T10:30:00Z",
+    "parentReference": {"path": "/drive/root:"},
+    "webUrl": "https://contoso.sharepoint.com/sites/HR/HR%20Documents",
+    "folder": {"childCount": 5},
+}
+
+_LABELS_PATH = "/informationProtection/policy/labels"
+
+# Default in-memory Graph API; each response is re-serialized, so tests can't share state
+_ROUTES = {
+    _LABELS_PATH: (
+        200,
+        {
+            "value": [
+                {"id": "label1", "name": "Confidential", "description": "Confidential data"},
+                {"id": "label2", "name": "Public", "description": "Public data"},
+            ]
+        },
+    ),
+    "/sites": (
+        200,
+        {
+            "value": [
+                {"id": "site1", "displayName": "HR Site"},
+                {"id": "site2", "displayName": "Finance Site"},
+            ]
+        },
+    ),
+}
+_FORBIDDEN = (403, {"error": {"message": "Insufficient permissions"}})
+
+
 class TestDriveItem:
     """Tests for DriveItem dataclass."""
 
     def test_from_api_file(self):
         """Test creating DriveItem from API response (file)."""
-        data = {
-            "id": "item123",
-            "name": "document.docx",
-            "size": 12345,
-            "lastModifiedDateTime": "2024-01-15T10:30:00Z",
-            "parentReference": {"path": "/drive/root:/Documents"},
-            "webUrl": "https://contoso.sharepoint.com/sites/HR/Documents/document.docx",
-            "file": {
-                "mimeType": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            },
-        }
-
-        item = DriveItem.from_api(data, "site123", "drive456")
+        item = DriveItem.from_api(_FILE_API_PAYLOAD, "site123", "drive456")
 
         assert item.id == "item123"
         assert item.name == "document.docx"
@@ -40,24 +82,11 @@ class TestDriveItem:
         assert item.is_folder is False
         assert item.site_id == "site123"
         assert item.drive_id == "drive456"
-        assert (
-            item.mime_type
-            == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        )
+        assert item.mime_type == _DOCX_MIME
 
     def test_from_api_folder(self):
         """Test creating DriveItem from API response (folder)."""
-        data = {
-            "id": "folder123",
-            "name": "HR Documents",
-            "size": 0,
-            "lastModifiedDateTime": "2024-01-15T10:30:00Z",
-            "parentReference": {"path": "/drive/root:"},
-            "webUrl": "https://contoso.sharepoint.com/sites/HR/HR%20Documents",
-            "folder": {"childCount": 5},
-        }
-
-        item = DriveItem.from_api(data, "site123", "drive456")
+        item = DriveItem.from_api(_FOLDER_API_PAYLOAD, "site123", "drive456")
 
         assert item.id == "folder123"
         assert item.name == "HR Documents"
@@ -70,7 +99,7 @@ class TestGraphClientInit:
     @pytest.mark.skipif(not HAS_MSAL or not HAS_HTTPX, reason="MSAL or httpx not installed")
     def test_init_with_credentials(self):
         """Test client initialization."""
-        with patch("scrubiq.auth.graph.ConfidentialClientApplication"):
+        with patch.object(_graph_mod, "ConfidentialClientApplication"):
             client = GraphClient(
                 tenant_id="tenant123",
                 client_id="client456",
@@ -92,22 +121,38 @@ class TestGraphClientMocked:
 
     @pytest.fixture
     def mock_client(self):
-        """Create a client with mocked MSAL and httpx."""
-        with patch("scrubiq.auth.graph.ConfidentialClientApplication") as mock_msal:
+        """Create a client with mocked MSAL and an in-memory httpx transport."""
+        routes = dict(_ROUTES)
+        seen = []
+
+        def handle(request):
+            seen.append(request)
+            path = request.url.path.removeprefix("/v1.0")
+            status, payload = routes.get(path, (404, {"error": {"message": f"No route: {path}"}}))
+            return httpx.Response(status, json=payload)
+
+        transport = httpx.MockTransport(handle)
+        real_client = httpx.Client
+
+        with patch.object(_graph_mod, "ConfidentialClientApplication") as mock_msal:
             # Mock token acquisition
             mock_msal.return_value.acquire_token_for_client.return_value = {
                 "access_token": "mock_token_123",
                 "expires_in": 3600,
             }
 
-            with patch("scrubiq.auth.graph.httpx.Client") as mock_http:
+            with patch.object(
+                _graph_mod.httpx, "Client", lambda **kw: real_client(transport=transport, **kw)
+            ):
                 client = GraphClient(
                     tenant_id="tenant123",
                     client_id="client456",
                     client_secret="secret789",
                 )
-                client._mock_http = mock_http.return_value
+                client._routes = routes
+                client._seen = seen
                 yield client
+                client.close()
 
     def test_get_token(self, mock_client):
         """Test token acquisition."""
@@ -125,37 +170,18 @@ class TestGraphClientMocked:
 
     def test_get_sensitivity_labels(self, mock_client):
         """Test getting sensitivity labels."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = True
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "label1", "name": "Confidential", "description": "Confidential data"},
-                {"id": "label2", "name": "Public", "description": "Public data"},
-            ]
-        }
-        mock_client._mock_http.request.return_value = mock_response
-
         labels = mock_client.get_sensitivity_labels()
 
         assert len(labels) == 2
         assert labels[0]["name"] == "Confidential"
         assert labels[1]["name"] == "Public"
 
+        # The request went out authenticated
+        (request,) = mock_client._seen
+        assert request.headers["Authorization"] == "Bearer mock_token_123"
+
     def test_list_sites(self, mock_client):
         """Test listing SharePoint sites."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = True
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "site1", "displayName": "HR Site"},
-                {"id": "site2", "displayName": "Finance Site"},
-            ]
-        }
-        mock_client._mock_http.request.return_value = mock_response
-
         sites = mock_client.list_sites()
 
         assert len(sites) == 2
@@ -163,11 +189,7 @@ class TestGraphClientMocked:
 
     def test_api_error_handling(self, mock_client):
         """Test handling of API errors."""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.text = "Access denied"
-        mock_response.json.return_value = {"error": {"message": "Insufficient permissions"}}
-        mock_client._mock_http.request.return_value = mock_response
+        mock_client._routes[_LABELS_PATH] = _FORBIDDEN
 
         with pytest.raises(GraphAPIError) as exc_info:
             mock_client.get_sensitivity_labels()
@@ -1,10 +1,12 @@
 """Tests for sensitivity label application."""
 
 import pytest
+from types import MappingProxyType
 from unittest.mock import patch
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from scrubiq.labeler import labeler as _labeler_mod
 from scrubiq.labeler.labeler import (
     Labeler,
     LabelMapping,
@@ -20,6 +22,76 @@ from scrubiq.scanner.results import (
 )
 
 
+def _reset_labeler(labeler):
+    """Clear per-test state on a class-scoped labeler (keeps mock return values)."""
+    labeler._mock_client.reset_mock()
+    labeler.mapping = LabelMapping()
+    labeler._labels_cache = None
+
+
+# Read-only label payloads returned by the mocked Graph client
+_TENANT_LABELS = (
+    MappingProxyType({"id": "guid-1", "name": "Highly Confidential"}),
+    MappingProxyType({"id": "guid-2", "name": "Confidential"}),
+    MappingProxyType({"id": "guid-3", "name": "Internal"}),
+    MappingProxyType({"id": "guid-4", "name": "Public"}),
+)
+_FOLDER_LABELS = (MappingProxyType({"id": "guid-conf", "name": "Confidential"}),)
+
+# Recommendation -> label id config shared by the lookup tests
+_BASE_MAPPING = {
+    "highly_confidential": "guid-1",
+    "confidential": "guid-2",
+    "internal": "guid-3",
+}
+
+# Fixed timestamp keeps the sample deterministic across runs and workers
+_T0 = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def _build_sample_scan() -> ScanResult:
+    """Scan with one sensitive local file and one clean file."""
+    result = ScanResult(
+        scan_id="test123",
+        source_path="/test/path",
+        source_type="filesystem",
+    )
+
+    # File with sensitive data (but no SharePoint metadata)
+    file1 = FileResult(
+        path=Path("/test/document1.docx"),
+        source="filesystem",
+        size_bytes=1000,
+        modified=_T0,
+        matches=[
+            Match(
+                entity_type=EntityType.SSN,
+                value="078-05-1120",
+                start=10,
+                end=21,
+                confidence=0.92,
+                detector="regex",
+            )
+        ],
+        label_recommendation=LabelRecommendation.HIGHLY_CONFIDENTIAL,
+    )
+
+    # Clean file
+    file2 = FileResult(
+        path=Path("/test/document2.docx"),
+        source="filesystem",
+        size_bytes=500,
+        modified=_T0,
+        matches=[],
+    )
+
+    result.files = [file1, file2]
+    return result
+
+
+_SAMPLE_SCAN = _build_sample_scan()
+
+
 class TestLabelMapping:
     """Tests for LabelMapping."""
 
@@ -39,13 +111,7 @@ class TestLabelMapping:
 
     def test_from_dict(self):
         """Test loading from dictionary."""
-        mapping = LabelMapping().from_dict(
-            {
-                "highly_confidential": "guid-1",
-                "confidential": "guid-2",
-                "internal": "guid-3",
-            }
-        )
+        mapping = LabelMapping().from_dict(_BASE_MAPPING)
 
         assert mapping.get(LabelRecommendation.HIGHLY_CONFIDENTIAL) == "guid-1"
         assert mapping.get(LabelRecommendation.CONFIDENTIAL) == "guid-2"
@@ -119,8 +185,8 @@ class TestLabelSummary:
     def test_duration_calculation(self):
         """Test duration calculation."""
         summary = LabelSummary()
-        summary.started_at = datetime(2024, 1, 15, 10, 0, 0)
-        summary.completed_at = datetime(2024, 1, 15, 10, 0, 30)
+        summary.started_at = _T0
+        summary.completed_at = _T0 + timedelta(seconds=30)
 
         assert summary.duration_seconds == 30.0
 
@@ -134,16 +200,12 @@ class TestLabelSummary:
 class TestLabelerInit:
     """Tests for Labeler initialization."""
 
-    @pytest.fixture
-    def mock_labeler(self):
-        """Create labeler with mocked Graph client."""
-        with patch("scrubiq.labeler.labeler.GraphClient") as mock_graph:
-            mock_graph.return_value.get_sensitivity_labels.return_value = [
-                {"id": "guid-1", "name": "Highly Confidential"},
-                {"id": "guid-2", "name": "Confidential"},
-                {"id": "guid-3", "name": "Internal"},
-                {"id": "guid-4", "name": "Public"},
-            ]
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_labeler():
+        """Create labeler with mocked Graph client (once per class)."""
+        with patch.object(_labeler_mod, "GraphClient") as mock_graph:
+            mock_graph.return_value.get_sensitivity_labels.return_value = _TENANT_LABELS
 
             labeler = Labeler(
                 tenant_id="tenant123",
@@ -153,6 +215,10 @@ class TestLabelerInit:
             labeler._mock_client = mock_graph.return_value
             yield labeler
 
+    @pytest.fixture(autouse=True)
+    def fresh_labeler(self, mock_labeler):
+        _reset_labeler(mock_labeler)
+
     def test_get_labels(self, mock_labeler):
         """Test getting labels."""
         labels = mock_labeler.get_labels()
@@ -194,15 +260,13 @@ class TestLabelerInit:
 class TestLabelerApply:
     """Tests for Labeler.apply_from_scan."""
 
-    @pytest.fixture
-    def mock_labeler(self):
-        """Create labeler with mocked Graph client."""
-        with patch("scrubiq.labeler.labeler.GraphClient") as mock_graph:
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_labeler():
+        """Create labeler with mocked Graph client (once per class)."""
+        with patch.object(_labeler_mod, "GraphClient") as mock_graph:
             mock_client = mock_graph.return_value
-            mock_client.get_sensitivity_labels.return_value = [
-                {"id": "guid-1", "name": "Highly Confidential"},
-                {"id": "guid-2", "name": "Confidential"},
-            ]
+            mock_client.get_sensitivity_labels.return_value = _TENANT_LABELS[:2]
             mock_client.get_file_label.return_value = None
             mock_client.apply_label.return_value = {}
 
@@ -214,45 +278,14 @@ class TestLabelerApply:
             labeler._mock_client = mock_client
             yield labeler
 
+    @pytest.fixture(autouse=True)
+    def fresh_labeler(self, mock_labeler):
+        _reset_labeler(mock_labeler)
+
     @pytest.fixture
     def sample_scan_result(self):
-        """Create a sample scan result."""
-        result = ScanResult(
-            scan_id="test123",
-            source_path="/test/path",
-            source_type="filesystem",
-        )
-
-        # File with sensitive data (but no SharePoint metadata)
-        file1 = FileResult(
-            path=Path("/test/document1.docx"),
-            source="filesystem",
-            size_bytes=1000,
-            modified=datetime.now(),
-            matches=[
-                Match(
-                    entity_type=EntityType.SSN,
-                    value="078-05-1120",
-                    start=10,
-                    end=21,
-                    confidence=0.92,
-                    detector="regex",
-                )
-            ],
-            label_recommendation=LabelRecommendation.HIGHLY_CONFIDENTIAL,
-        )
-
-        # Clean file
-        file2 = FileResult(
-            path=Path("/test/document2.docx"),
-            source="filesystem",
-            size_bytes=500,
-            modified=datetime.now(),
-            matches=[],
-        )
-
-        result.files = [file1, file2]
-        return result
+        """Sample scan result (read-only, shared by every test)."""
+        return _SAMPLE_SCAN
 
     def test_apply_dry_run_default(self, mock_labeler, sample_scan_result):
         """Test that dry_run is True by default."""
@@ -305,23 +338,22 @@ class TestLabelerApply:
 class TestLabelerSharePointFolder:
     """Tests for labeling SharePoint folders."""
 
-    @pytest.fixture
-    def mock_labeler(self):
-        """Create labeler with mocked Graph client."""
-        with patch("scrubiq.labeler.labeler.GraphClient") as mock_graph:
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_labeler():
+        """Create labeler with mocked Graph client (once per class)."""
+        with patch.object(_labeler_mod, "GraphClient") as mock_graph:
             from scrubiq.auth.graph import DriveItem
 
             mock_client = mock_graph.return_value
-            mock_client.get_sensitivity_labels.return_value = [
-                {"id": "guid-conf", "name": "Confidential"},
-            ]
+            mock_client.get_sensitivity_labels.return_value = _FOLDER_LABELS
             mock_client.list_items_recursive.return_value = [
                 DriveItem(
                     id="item1",
                     name="doc1.docx",
                     path="folder/doc1.docx",
                     size=1000,
-                    modified=datetime.now(),
+                    modified=_T0,
                     is_folder=False,
                     site_id="site123",
                     drive_id="drive456",
@@ -331,7 +363,7 @@ class TestLabelerSharePointFolder:
                     name="doc2.xlsx",
                     path="folder/doc2.xlsx",
                     size=2000,
-                    modified=datetime.now(),
+                    modified=_T0,
                     is_folder=False,
                     site_id="site123",
                     drive_id="drive456",
@@ -344,6 +376,10 @@ class TestLabelerSharePointFolder:
             labeler._mock_client = mock_client
             yield labeler
 
+    @pytest.fixture(autouse=True)
+    def fresh_labeler(self, mock_labeler):
+        _reset_labeler(mock_labeler)
+
     def test_label_folder_dry_run(self, mock_labeler):
         """Test labeling folder in dry-run mode."""
         summary = mock_labeler.label_sharepoint_folder(
@@ -9,6 +9,12 @@ from scrubiq.classifier.pipeline import (
 from scrubiq.scanner.results import EntityType, LabelRecommendation
 
 
+@pytest.fixture(scope="module")
+def pipeline():
+    """Create pipeline without Presidio (faster tests); classify() keeps no state."""
+    return ClassifierPipeline(enable_presidio=False)
+
+
 class TestClassificationResult:
     """Tests for ClassificationResult dataclass."""
 
@@ -76,11 +82,6 @@ class TestClassificationResult:
 class TestClassifierPipeline:
     """Tests for ClassifierPipeline."""
 
-    @pytest.fixture
-    def pipeline(self):
-        """Create pipeline without Presidio (faster tests)."""
-        return ClassifierPipeline(enable_presidio=False)
-
     def test_detects_ssn(self, pipeline):
         """Pipeline detects SSN via regex."""
         result = pipeline.classify("Employee SSN: 078-05-1120")
@@ -136,13 +137,131 @@ class TestClassifierPipeline:
         assert len(result.matches) >= 1
 
 
+class _FlagEverythingClassifier:
+    """TP/FP stand-in that records contexts and calls every match a FP."""
+
+    def __init__(self):
+        self.seen = []
+
+    def format_match_context(self, context, value, entity_type):
+        return context
+
+    def predict_batch(self, texts):
+        from scrubiq.training.model import FilterResult
+
+        self.seen.extend(texts)
+        return [FilterResult(False, 0.99) for _ in texts]
+
+
+class TestTPFPFilter:
+    """Tests for the TP/FP filter layer."""
+
+    def _match(self, context, validated=False):
+        from scrubiq.scanner.results import Match
+
+        return Match(
+            entity_type=EntityType.CREDIT_CARD,
+            value="4532015112830366",
+            start=0,
+            end=16,
+            confidence=0.70,
+            detector="regex",
+            context=context,
+            validated=validated,
+        )
+
+    def test_validated_matches_skip_model(self):
+        pipeline = ClassifierPipeline(enable_presidio=False)
+        pipeline.tpfp_classifier = _FlagEverythingClassifier()
+
+        sure = self._match("luhn valid", validated=True)
+        unsure = self._match("maybe")
+        pipeline._apply_tpfp_filter([sure, unsure])
+
+        assert pipeline.tpfp_classifier.seen == ["maybe"]
+        assert not sure.is_test_data
+        assert unsure.is_test_data
+
+    def test_confident_unvalidated_matches_still_filtered(self):
+        """A high detector score alone (e.g. email at 0.90) doesn't skip the model."""
+        pipeline = ClassifierPipeline(enable_presidio=False)
+        pipeline.tpfp_classifier = _FlagEverythingClassifier()
+
+        result = pipeline.classify("Contact: jane.doe@corp.com")
+        (email,) = result.matches
+
+        assert email.confidence >= 0.9
+        assert len(pipeline.tpfp_classifier.seen) == 1
+        assert email.is_test_data
+
+    def test_load_options_reach_classifier(self, monkeypatch):
+        import scrubiq.classifier.pipeline as pipeline_mod
+
+        calls = []
+
+        def fake_load(path, **kwargs):
+            calls.append((path, kwargs))
+            return _FlagEverythingClassifier()
+
+        monkeypatch.setattr(pipeline_mod, "HAS_TPFP", True)
+        monkeypatch.setattr(pipeline_mod.TPFPClassifier, "load", fake_load)
+
+        ClassifierPipeline(
+            enable_presidio=False,
+            tpfp_model_path="./models/tpfp-v1",
+            tpfp_backend="onnx",
+            tpfp_low_memory=True,
+        )
+
+        assert calls == [("./models/tpfp-v1", {"backend": "onnx", "low_memory": True})]
+
+
+class TestSaveCaches:
+    """Tests for persisting the TP/FP embedding cache after scoring."""
+
+    class _RecordingClassifier:
+        def __init__(self, model_path, unsaved_embeddings=3, error=None):
+            self.model_path = model_path
+            self.error = error
+            self.unsaved_embeddings = unsaved_embeddings
+            self.saved = 0
+
+        def save_embedding_cache(self):
+            if self.error:
+                raise self.error
+            self.saved += 1
+
+    def test_saves_loaded_classifier_cache(self):
+        pipeline = ClassifierPipeline(enable_presidio=False)
+        pipeline.tpfp_classifier = self._RecordingClassifier("./models/tpfp-v1")
+
+        pipeline.save_caches()
+
+        assert pipeline.tpfp_classifier.saved == 1
+
+    def test_skips_write_when_nothing_new_was_encoded(self):
+        pipeline = ClassifierPipeline(enable_presidio=False)
+        pipeline.tpfp_classifier = self._RecordingClassifier("./models/tpfp-v1", 0)
+
+        pipeline.save_caches()
+
+        assert pipeline.tpfp_classifier.saved == 0
+
+    def test_skips_unsaved_model_and_read_only_dir(self):
+        pipeline = ClassifierPipeline(enable_presidio=False)
+        pipeline.save_caches()  # No TP/FP filter at all
+
+        pipeline.tpfp_classifier = self._RecordingClassifier(None)
+        pipeline.save_caches()
+        assert pipeline.tpfp_classifier.saved == 0
+
+        pipeline.tpfp_classifier = self._RecordingClassifier("/opt/models", error=PermissionError())
+        pipeline.save_caches()  # Doesn't raise
+
+
 class TestPipelineDeduplication:
     """Tests for deduplication logic."""
 
-    @pytest.fixture
-    def pipeline(self):
-        return ClassifierPipeline(enable_presidio=False)
-
     def test_no_duplicate_matches(self, pipeline):
         """Same entity shouldn't appear twice."""
         # Text with a single SSN
@@ -165,10 +284,6 @@ class TestPipelineDeduplication:
 class TestPipelineLabelRecommendation:
     """Tests for label recommendation logic."""
 
-    @pytest.fixture
-    def pipeline(self):
-        return ClassifierPipeline(enable_presidio=False)
-
     def test_highly_confidential_for_high_confidence_ssn(self, pipeline):
         """High confidence SSN gets HIGHLY_CONFIDENTIAL."""
         result = pipeline.classify("Employee SSN: 078-05-1120")
@@ -1,8 +1,13 @@
 """Tests for regex detector."""
 
+import re
+
 import pytest
 
 from scrubiq.classifier.detectors.regex import (
+    ALL_PATTERNS,
+    Pattern,
+    SSN_PATTERN,
     RegexDetector,
     luhn_check,
     validate_ssn,
@@ -10,6 +15,12 @@ from scrubiq.classifier.detectors.regex import (
 from scrubiq.scanner.results import EntityType
 
 
+# Patterns are compiled at import and detect() keeps no state, so share one detector
+@pytest.fixture(scope="module")
+def detector():
+    return RegexDetector()
+
+
 class TestValidateSSN:
     def test_valid_ssn_with_dashes(self):
         assert validate_ssn("078-05-1120")
@@ -40,6 +51,15 @@ class TestValidateSSN:
         assert not validate_ssn("12-34-5678")
         assert not validate_ssn("1234-56-7890")
 
+    def test_ssn_regex_enforces_validator_rules(self):
+        # The SSN pattern has no validator: its lookaheads must reject the same values
+        assert SSN_PATTERN.validator is None
+        for area in ("000", "078", "666", "665", "899", "900", "999"):
+            for group in ("00", "05"):
+                for serial in ("0000", "1120"):
+                    value = f"{area}-{group}-{serial}"
+                    assert bool(SSN_PATTERN.regex.fullmatch(value)) == validate_ssn(value), value
+
 
 class TestLuhnCheck:
     def test_valid_visa_test_card(self):
@@ -66,12 +86,25 @@ class TestLuhnCheck:
     def test_invalid_too_long(self):
         assert not luhn_check("41111111111111111111")
 
+    def test_every_check_digit(self):
+        # Exactly one final digit makes each prefix valid
+        for prefix in ("411111111111111", "37828224631000", "601100000000000"):
+            valid = [d for d in "0123456789" if luhn_check(prefix + d)]
+            assert len(valid) == 1, prefix
 
-class TestRegexDetectorSSN:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
+    def test_matches_digit_by_digit_reference(self):
+        def reference(number):
+            total = 0
+            for i, d in enumerate(reversed(number)):
+                d = int(d) * (2 if i % 2 else 1)
+                total += d - 9 if d > 9 else d
+            return total % 10 == 0
+
+        for n in range(4111111111111000, 4111111111111200):
+            assert luhn_check(str(n)) == reference(str(n))
 
+
+class TestRegexDetectorSSN:
     def test_detect_ssn_with_dashes(self, detector):
         text = "Employee SSN: 078-05-1120"
         matches = detector.detect(text)
@@ -122,10 +155,6 @@ class TestRegexDetectorSSN:
 
 
 class TestRegexDetectorCreditCard:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
-
     def test_detect_visa(self, detector):
         # Using a valid Luhn number
         text = "Card: 4532015112830366"
@@ -135,6 +164,13 @@ class TestRegexDetectorCreditCard:
         assert len(cc_matches) == 1
         assert cc_matches[0].confidence == 0.70
 
+    def test_luhn_valid_card_marked_validated(self, detector):
+        """Only validator-backed patterns mark their matches validated."""
+        matches = detector.detect("Card: 4532015112830366, SSN: 078-05-1120")
+
+        validated = {m.entity_type: m.validated for m in matches}
+        assert validated == {EntityType.CREDIT_CARD: True, EntityType.SSN: False}
+
     def test_detect_test_card_flagged(self, detector):
         text = "Test card: 4111111111111111"
         matches = detector.detect(text)
@@ -152,10 +188,6 @@ class TestRegexDetectorCreditCard:
 
 
 class TestRegexDetectorEmail:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
-
     def test_detect_email(self, detector):
         text = "Contact: john.doe@company.com"
         matches = detector.detect(text)
@@ -181,12 +213,14 @@ class TestRegexDetectorEmail:
         assert len(email_matches) == 1
         assert email_matches[0].is_test_data is False
 
+    def test_tld_is_letters_only(self, detector):
+        matches = detector.detect("Email: jane@acmecorp.c|om")
 
-class TestRegexDetectorPhone:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
+        email_matches = [m for m in matches if m.entity_type == EntityType.EMAIL]
+        assert [m.value for m in email_matches] == []
 
+
+class TestRegexDetectorPhone:
     def test_detect_phone_with_dashes(self, detector):
         text = "Call: 212-555-1234"
         matches = detector.detect(text)
@@ -212,10 +246,6 @@ class TestRegexDetectorPhone:
 
 
 class TestRegexDetectorGeneral:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
-
     def test_no_matches_on_clean_text(self, detector):
         text = "This is a normal document with no sensitive data."
         matches = detector.detect(text)
@@ -256,12 +286,27 @@ class TestRegexDetectorGeneral:
         match = ssn_matches[0]
         assert text[match.start : match.end] == "078-05-1120"
 
+    @pytest.mark.parametrize("pattern", ALL_PATTERNS, ids=lambda p: p.name)
+    def test_prefilter_hits_whenever_regex_matches(self, pattern):
+        for sample in pattern.test_patterns:
+            if pattern.regex.search(sample):
+                assert pattern.prefilter.search(sample), sample
+
+    def test_prefilter_miss_skips_pattern(self):
+        pattern = Pattern(
+            name="any_word",
+            entity_type=EntityType.EMAIL,
+            regex=re.compile(r"\w+"),
+            confidence_base=0.5,
+            prefilter=re.compile("@"),
+        )
+        detector = RegexDetector(patterns=[pattern])
+
+        assert detector.detect("no at sign here") == []
+        assert len(detector.detect("user @ host")) == 2
 
-class TestMRNDetection:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
 
+class TestMRNDetection:
     def test_detect_mrn_standard_format(self, detector):
         text = "Patient MRN: MRN12345678"
         matches = detector.detect(text)
@@ -301,10 +346,6 @@ class TestMRNDetection:
 
 
 class TestHealthPlanIDDetection:
-    @pytest.fixture
-    def detector(self):
-        return RegexDetector()
-
     def test_detect_hp_standard_format(self, detector):
         text = "Health Plan ID: HP1234567890"
         matches = detector.detect(text)
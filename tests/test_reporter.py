@@ -174,6 +174,24 @@ class TestGenerateHtmlReport:
         assert "<body>" in content
         assert "</body>" in content
 
+    def test_html_title_is_escaped(self, sample_scan_result, tmp_path):
+        output_path = tmp_path / "report.html"
+        generate_html_report(sample_scan_result, output_path, title="</title><script>x</script>")
+
+        content = output_path.read_text()
+        assert "<title>&lt;/title&gt;&lt;script&gt;x&lt;/script&gt;</title>" in content
+        assert "<script>x</script>" not in content
+
+    def test_html_templates_fully_substituted(self, sample_scan_result, tmp_path):
+        """Test that no placeholders or doubled braces leak into output."""
+        output_path = tmp_path / "report.html"
+        generate_html_report(sample_scan_result, output_path)
+
+        content = output_path.read_text()
+        assert "${" not in content
+        assert "{{" not in content
+        assert "box-sizing: border-box;" in content
+
 
 class TestEmptyScanReport:
     """Test report generation for scans with no findings."""
@@ -282,6 +300,25 @@ class TestGenerateSummaryReport:
         content = output_path.read_text()
         assert "test123" in content
 
+    def test_summary_with_multiple_results(self, sample_scan_result, sample_file_result, tmp_path):
+        """Test summary report renders every scan with shared page chrome once."""
+        second = ScanResult(scan_id="second456", source_path="/other", source_type="filesystem")
+        second.add_file(sample_file_result)
+        second.complete()
+
+        output_path = tmp_path / "summary.html"
+        generate_summary_report([sample_scan_result, second], output_path, title="Q&A review")
+
+        content = output_path.read_text()
+        assert "test123" in content
+        assert "second456" in content
+        assert "<title>Q&amp;A review</title>" in content
+        assert content.count("<style>") == 1
+        assert content.count('id="search"') == 1
+        assert content.count('<section class="scan">') == 2
+        assert "matches-1-1" in content
+        assert "matches-2-1" in content
+
 
 class TestReportEncoding:
     """Test report handles various encodings properly."""
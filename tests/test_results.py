@@ -1,10 +1,12 @@
 """Tests for core data models."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
 
 from scrubiq.scanner.results import (
+    ENTITY_TYPE_BY_VALUE,
     Confidence,
     EntityType,
     FileResult,
@@ -33,6 +35,12 @@ class TestConfidence:
         assert Confidence.from_score(0.0) == Confidence.LOW
 
 
+class TestEntityType:
+    def test_by_value_covers_all_members(self):
+        for entity_type in EntityType:
+            assert ENTITY_TYPE_BY_VALUE[entity_type.value] is entity_type
+
+
 class TestMatch:
     def test_confidence_level(self):
         match = Match(
@@ -101,6 +109,10 @@ class TestMatch:
         )
         assert match.model_version == "v1.0.0+local.3"
 
+    def test_slots_no_instance_dict(self):
+        match = Match(EntityType.SSN, "078-05-1120", 0, 11, 0.9, "regex")
+        assert not hasattr(match, "__dict__")
+
 
 class TestFileResult:
     def test_has_sensitive_data_with_matches(self):
@@ -147,6 +159,24 @@ class TestFileResult:
         assert len(result.real_matches) == 1
         assert result.real_matches[0].value == "078-05-1120"
 
+    def test_real_matches_cached_until_matches_change(self):
+        result = FileResult(
+            path=Path("test.txt"),
+            source="filesystem",
+            size_bytes=100,
+            modified=datetime.now(),
+            matches=[Match(EntityType.SSN, "123-45-6789", 0, 11, 0.9, "regex", is_test_data=True)],
+        )
+        assert result.real_matches is result.real_matches
+        assert not result.has_sensitive_data
+
+        result.matches.append(Match(EntityType.SSN, "078-05-1120", 20, 31, 0.9, "regex"))
+        assert result.has_sensitive_data
+        assert len(result.real_matches) == 1
+
+        result.matches = []
+        assert result.real_matches == []
+
     def test_highest_confidence(self):
         result = FileResult(
             path=Path("test.txt"),
@@ -183,6 +213,26 @@ class TestFileResult:
         )
         assert result.entity_types_found == {EntityType.SSN, EntityType.EMAIL}
 
+    def test_summarize_matches_properties(self):
+        result = FileResult(
+            path=Path("test.txt"),
+            source="filesystem",
+            size_bytes=100,
+            modified=datetime.now(),
+            matches=[
+                Match(EntityType.SSN, "078-05-1120", 0, 11, 0.9, "regex"),
+                Match(
+                    EntityType.EMAIL, "test@example.com", 20, 36, 0.97, "regex", is_test_data=True
+                ),
+            ],
+        )
+
+        summary = result._summarize()
+
+        assert summary.has_sensitive_data == result.has_sensitive_data
+        assert summary.real_match_count == len(result.real_matches)
+        assert [m["confidence_level"] for m in summary.match_dicts] == ["high", "very_high"]
+
 
 class TestScanResult:
     def test_stats_empty(self):
@@ -227,6 +277,16 @@ class TestScanResult:
         assert scan.files_errored == 1
         assert scan.total_matches == 1
 
+    def test_slots_no_instance_dict(self):
+        scan = ScanResult()
+        scan.add_file(
+            FileResult(
+                path=Path("a.txt"), source="filesystem", size_bytes=0, modified=datetime.now()
+            )
+        )
+        assert not hasattr(scan, "__dict__")
+        assert not hasattr(scan.files[0], "__dict__")
+
     def test_complete_sets_timestamp(self):
         scan = ScanResult()
         assert scan.completed_at is None
@@ -294,3 +354,18 @@ class TestScanResult:
 
         d = scan.to_dict()
         assert d["files"][0]["matches"][0]["model_version"] == "v1.0.0"
+
+    def test_to_json_matches_to_dict(self):
+        scan = ScanResult(source_path="./test", source_type="filesystem")
+        scan.add_file(
+            FileResult(
+                path=Path("a.txt"),
+                source="filesystem",
+                size_bytes=100,
+                modified=datetime.now(),
+                matches=[Match(EntityType.SSN, "078-05-1120", 0, 11, 0.9, "regex")],
+            )
+        )
+        scan.complete()
+
+        assert json.loads(scan.to_json()) == scan.to_dict()
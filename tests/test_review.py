@@ -1,5 +1,7 @@
 """Tests for human review system."""
 
+import json
+
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -87,6 +89,24 @@ class TestReviewSample:
     def test_initial_reviewed_at_is_none(self, sample):
         assert sample.reviewed_at is None
 
+    def test_slots_no_instance_dict(self, sample):
+        assert not hasattr(sample, "__dict__")
+
+    def test_from_row(self, sample):
+        row = (
+            1,
+            "test123",
+            "ssn",
+            "123-45-6789",
+            "12*-**-*789",
+            0.72,
+            "regex",
+            "Employee SSN: 123-45-6789 on file",
+            "/test/hr/employees.txt",
+            ".txt",
+        )
+        assert ReviewSample.from_row(row) == sample
+
 
 class TestReviewStorage:
     """Test ReviewStorage class."""
@@ -230,11 +250,98 @@ class TestReviewStorage:
 
         assert count == 1
         assert not storage.path.exists()
+        assert not storage.index_path.exists()
+        assert not storage.stats_path.exists()
 
     def test_clear_empty_returns_zero(self, storage):
         count = storage.clear()
         assert count == 0
 
+    def test_context_manager_batches_writes(self, storage, sample):
+        sample.verdict = Verdict.CORRECT
+        sample.reviewed_at = datetime.now()
+
+        with storage:
+            storage.save_verdict(sample)
+            storage.save_verdict(sample)
+            assert len(list(storage.load_all())) == 2
+
+        assert storage._fh is None
+        assert len(list(storage.load_all())) == 2
+
+    def test_get_stats_reads_sidecar(self, storage, sample):
+        sample.verdict = Verdict.WRONG
+        sample.reviewed_at = datetime.now()
+        storage.save_verdict(sample)
+
+        assert storage.stats_path.exists()
+        assert ReviewStorage(path=storage.path).get_stats()["false_positives"] == 1
+
+    def test_get_stats_rebuilds_missing_sidecar(self, storage, sample):
+        sample.verdict = Verdict.CORRECT
+        sample.reviewed_at = datetime.now()
+        storage.save_verdict(sample)
+        storage.save_verdict(sample)
+        storage.stats_path.unlink()
+        storage.index_path.unlink()
+
+        assert storage.get_stats()["total"] == 2
+        assert storage.index_path.stat().st_size == 16
+
+    def test_sidecars_catch_up_with_unindexed_appends(self, storage, sample):
+        """Records appended without sidecar updates are folded in on read."""
+        sample.verdict = Verdict.CORRECT
+        sample.reviewed_at = datetime.now()
+        storage.save_verdict(sample)
+
+        # An older scrubiq (or a crash after the JSONL write) adds a record
+        # the index and counters never saw
+        sample.verdict = Verdict.WRONG
+        with open(storage.path, "ab") as f:
+            f.write((json.dumps(sample.to_training_dict()) + "\n").encode("utf-8"))
+
+        fresh = ReviewStorage(path=storage.path)
+        stats = fresh.get_stats()
+        assert (stats["total"], stats["false_positives"]) == (2, 1)
+        assert [r["verdict"] for r in fresh.load_range(1)] == ["FP"]
+
+    def test_sidecars_rebuilt_when_index_disagrees(self, storage, sample):
+        """A crash between the index and stats writes triggers a rebuild."""
+        sample.verdict = Verdict.CORRECT
+        sample.reviewed_at = datetime.now()
+        storage.save_verdict(sample)
+        stale_stats = storage.stats_path.read_bytes()
+        storage.save_verdict(sample)
+        storage.stats_path.write_bytes(stale_stats)
+
+        assert ReviewStorage(path=storage.path).get_stats()["total"] == 2
+        assert storage.index_path.stat().st_size == 16
+
+    def test_sidecars_rebuilt_after_truncation(self, storage, sample):
+        sample.verdict = Verdict.CORRECT
+        sample.reviewed_at = datetime.now()
+        storage.save_verdict(sample)
+        storage.save_verdict(sample)
+
+        first_line = storage.path.read_bytes().split(b"\n")[0] + b"\n"
+        storage.path.write_bytes(first_line)
+
+        assert storage.get_stats()["total"] == 1
+        assert len(list(storage.load_range(0))) == 1
+
+    def test_load_range(self, storage, sample):
+        sample.reviewed_at = datetime.now()
+        for i, verdict in enumerate([Verdict.CORRECT, Verdict.WRONG, Verdict.CORRECT]):
+            sample.verdict = verdict
+            sample.confidence = i / 10
+            storage.save_verdict(sample)
+
+        loaded = list(storage.load_range(1, 3))
+
+        assert [r["confidence"] for r in loaded] == [0.1, 0.2]
+        assert len(list(storage.load_range(0))) == 3
+        assert list(storage.load_range(5)) == []
+
 
 class TestReviewSampleAnonymization:
     """Test various anonymization scenarios."""
@@ -312,6 +419,26 @@ class TestReviewSampleAnonymization:
         assert "[SSN]" in anonymized or "Some context" in anonymized
 
 
+class TestReviewTUIHighlight:
+    """Test value highlighting in the review panel."""
+
+    @pytest.fixture
+    def tui(self, tmp_path):
+        from scrubiq.review.tui import ReviewTUI
+
+        return ReviewTUI([], ReviewStorage(path=tmp_path / "reviews.jsonl"))
+
+    def test_highlights_value(self, tui):
+        result = tui._highlight_value("SSN: 123-45-6789 on file", "123-45-6789")
+        assert result == "SSN: [bold red on white] 123-45-6789 [/bold red on white] on file"
+
+    def test_value_not_in_context_unchanged(self, tui):
+        assert tui._highlight_value("nothing here", "123-45-6789") == "nothing here"
+
+    def test_empty_value_unchanged(self, tui):
+        assert tui._highlight_value("some context", "") == "some context"
+
+
 class TestReviewSamplerIntegration:
     """Integration tests for ReviewSampler with database."""
 
@@ -79,6 +79,17 @@ class TestScannerBasics:
         assert result.has_sensitive_data
         assert result.label_recommendation is not None
 
+    def test_scan_time_recorded(self, scanner, test_dir, monkeypatch):
+        """scan_time_ms should come from the monotonic clock."""
+        ticks = iter([0, 42_000_000])
+        monkeypatch.setattr(
+            "scrubiq.scanner.scanner.time.perf_counter_ns", lambda: next(ticks, 42_000_000)
+        )
+
+        result = scanner.scan_file(test_dir / "with_ssn.txt")
+
+        assert result.scan_time_ms == 42
+
     def test_scan_result_stats(self, scanner, test_dir):
         """Should compute correct statistics."""
         result = scanner.scan(str(test_dir))
@@ -113,6 +124,17 @@ class TestScannerProgress:
         assert len(progress_calls) == 3
         assert progress_calls[-1][0] == progress_calls[-1][1]  # Last: current == total
 
+    def test_progress_without_precount(self, scanner, test_dir):
+        """Opting out of the count walk should report progress with no total."""
+        progress_calls = []
+
+        def on_progress(current, total, filename):
+            progress_calls.append((current, total))
+
+        scanner.scan(str(test_dir), on_progress=on_progress, precount=False)
+
+        assert progress_calls == [(1, None), (2, None), (3, None)]
+
     def test_file_callback(self, scanner, test_dir):
         """Should call file callback with FileResult."""
         file_results = []
@@ -201,6 +223,63 @@ class TestScannerFiltering:
         assert "app.log" not in paths
         assert "readme.txt" in paths
 
+    def test_walks_nested_directories(self, scanner, tmp_path):
+        """Should find files at any depth, skipping excluded subtrees."""
+        nested = tmp_path / "a" / "b" / "c"
+        nested.mkdir(parents=True)
+        (nested / "deep.txt").write_text("deep")
+        (tmp_path / "a" / "node_modules" / "x").mkdir(parents=True)
+        (tmp_path / "a" / "node_modules" / "x" / "dep.txt").write_text("dep")
+
+        paths = [p.name for p in scanner._iter_files(tmp_path)]
+
+        assert paths == ["deep.txt"]
+
+    def test_does_not_follow_directory_symlinks(self, scanner, tmp_path):
+        """Symlinked directories should not be descended into."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "doc.txt").write_text("doc")
+        try:
+            (tmp_path / "link").symlink_to(real, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        paths = list(scanner._iter_files(tmp_path))
+
+        assert paths == [real / "doc.txt"]
+
+    def test_count_files_matches_walk(self, scanner, tmp_path):
+        """count_files should agree with the files a scan visits."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.txt").write_text("a")
+        (tmp_path / "b.csv").write_text("b")
+        (tmp_path / "skip.xyz").write_text("c")
+
+        assert scanner.count_files(str(tmp_path)) == 2
+        assert scanner.count_files(str(tmp_path)) == len(list(scanner._iter_files(tmp_path)))
+        assert scanner.count_files(str(tmp_path / "b.csv")) == 1
+        assert scanner.count_files(str(tmp_path / "missing")) == 0
+
+    def test_walk_follows_extractor_registry(self, scanner, tmp_path):
+        """The registry alone decides which extensions are scanned."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.csv").write_text("b")
+
+        del scanner.extractor_registry._by_extension[".csv"]
+
+        assert [p.name for p in scanner._iter_files(tmp_path)] == ["a.txt"]
+        assert scanner.scan_file(tmp_path / "b.csv").error.startswith("Unsupported file type")
+
+    def test_exclude_suffix_pattern_is_anchored(self):
+        """Glob-style patterns should only match at the end of a name."""
+        scanner = Scanner(exclude_patterns=["secret", "*.log"])
+
+        assert scanner._should_exclude("app.log")
+        assert scanner._should_exclude("my_secret_dir")
+        assert not scanner._should_exclude("app.log.txt")
+        assert not scanner._should_exclude("applog")
+
 
 class TestScannerLabelRecommendation:
     """Test sensitivity label recommendations."""
@@ -268,6 +347,14 @@ class TestScannerErrors:
         assert result.error is not None
         assert "too large" in result.error
 
+    def test_single_unsupported_file(self, scanner, tmp_path):
+        """Scanning an unsupported file directly should report it."""
+        (tmp_path / "image.png").write_bytes(b"\x89PNG")
+
+        result = scanner.scan(str(tmp_path / "image.png"))
+
+        assert result.files[0].error == "Unsupported file type: .png"
+
 
 class TestScannerStreaming:
     """Test streaming/iterator interface."""
@@ -299,3 +386,83 @@ class TestScannerStreaming:
         # First next() should work
         first = next(gen)
         assert isinstance(first, FileResult)
+
+
+class TestScannerParallel:
+    """Test scanning across a worker pool."""
+
+    @pytest.fixture
+    def test_dir(self, tmp_path):
+        for i in range(6):
+            (tmp_path / f"file{i}.txt").write_text(f"Record {i}\nSSN: 078-05-1120\n")
+        (tmp_path / "clean.txt").write_text("Nothing sensitive here.")
+        return tmp_path
+
+    def _summarize(self, result):
+        return sorted((f.path.name, len(f.real_matches)) for f in result.files)
+
+    def test_thread_pool_matches_serial(self, test_dir):
+        """Parallel scan should find the same matches as a serial scan."""
+        serial = Scanner(enable_presidio=False).scan(str(test_dir))
+        parallel = Scanner(enable_presidio=False, workers=3).scan(str(test_dir))
+
+        assert self._summarize(parallel) == self._summarize(serial)
+
+    def test_process_pool_matches_serial(self, test_dir, monkeypatch):
+        """Worker processes should rebuild the scanner and return results."""
+        import scrubiq.scanner.scanner as scanner_mod
+
+        monkeypatch.setattr(scanner_mod, "HAS_PRESIDIO", True)
+
+        serial = Scanner(enable_presidio=False).scan(str(test_dir))
+        scanner = Scanner(enable_presidio=True, workers=2)
+        parallel = scanner.scan(str(test_dir))
+
+        assert self._summarize(parallel) == self._summarize(serial)
+        # Only the workers load detectors; the parent never scanned a file
+        assert scanner._classifier is None
+        assert scanner.has_presidio
+
+    def test_scan_saves_classifier_caches(self, test_dir, monkeypatch):
+        """Each finished scan persists the pipeline's warm caches once."""
+        from scrubiq.classifier.pipeline import ClassifierPipeline
+
+        calls = []
+        monkeypatch.setattr(ClassifierPipeline, "save_caches", lambda self: calls.append(self))
+
+        scanner = Scanner(enable_presidio=False)
+        scanner.scan(str(test_dir))
+        list(scanner.scan_iter(str(test_dir)))
+
+        assert calls == [scanner.classifier, scanner.classifier]
+
+    def test_workers_load_tpfp_model_in_low_memory_mode(self):
+        scanner = Scanner(enable_presidio=False, tpfp_backend="onnx")
+
+        assert scanner._worker_kwargs["tpfp_backend"] == "onnx"
+        assert scanner._worker_kwargs["tpfp_low_memory"] is True
+        assert scanner._tpfp_low_memory is False
+
+    def test_serial_scanner_builds_pipeline_up_front(self):
+        scanner = Scanner(enable_presidio=False)
+
+        assert scanner._classifier is not None
+        assert not scanner.has_presidio
+
+    def test_parallel_progress_reaches_total(self, test_dir):
+        """Progress should count completed files up to the total."""
+        progress_calls = []
+
+        def on_progress(current, total, filename):
+            progress_calls.append((current, total))
+
+        Scanner(enable_presidio=False, workers=2).scan(str(test_dir), on_progress=on_progress)
+
+        assert [c for c, _ in progress_calls] == list(range(1, 8))
+        assert progress_calls[-1] == (7, 7)
+
+    def test_parallel_scan_iter(self, test_dir):
+        """scan_iter should also use the worker pool."""
+        results = list(Scanner(enable_presidio=False, workers=2).scan_iter(str(test_dir)))
+
+        assert len(results) == 7
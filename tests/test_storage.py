@@ -2,11 +2,13 @@
 
 import pytest
 import json
+import os
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from scrubiq.storage.crypto import Encryptor, generate_key
-from scrubiq.storage.audit import AuditLog, AuditAction, AuditEntry
-from scrubiq.storage.database import FindingsDatabase
+from scrubiq.storage.audit import AuditLog, AuditAction, AuditEntry, _get_current_user
+from scrubiq.storage.database import FindingsDatabase, get_audit_path, get_default_db_path
 from scrubiq import Scanner
 
 
@@ -70,6 +72,51 @@ class TestEncryptor:
         with pytest.raises(InvalidToken):
             enc2.decrypt(ciphertext)
 
+    def test_ciphertext_is_raw_fernet_token(self):
+        """Ciphertext should be a Fernet token with no extra encoding."""
+        from cryptography.fernet import Fernet
+
+        key = generate_key()
+        ciphertext = Encryptor(key).encrypt("secret")
+
+        assert Fernet(key).decrypt(ciphertext.encode("ascii")) == b"secret"
+
+    def test_decrypts_legacy_double_encoded(self):
+        """Ciphertext from the old double base64 format should still decrypt."""
+        import base64
+        from cryptography.fernet import Fernet
+
+        key = generate_key()
+        legacy = base64.urlsafe_b64encode(Fernet(key).encrypt(b"secret")).decode("ascii")
+
+        assert Encryptor(key).decrypt(legacy) == "secret"
+
+    def test_encrypt_many_produces_fernet_tokens(self):
+        """Batch encryption should interoperate with Fernet and decrypt()."""
+        from cryptography.fernet import Fernet
+
+        key = generate_key()
+        encryptor = Encryptor(key)
+        plaintexts = ["078-05-1120", "", "日本語 🔒", "x" * 100]
+
+        tokens = encryptor.encrypt_many(plaintexts)
+
+        assert tokens[1] == ""
+        assert len(set(tokens)) == len(tokens)  # Fresh IV per item
+        assert [Fernet(key).decrypt(t.encode()).decode() for t in tokens if t] == [
+            "078-05-1120",
+            "日本語 🔒",
+            "x" * 100,
+        ]
+        assert encryptor.decrypt_many(tokens) == plaintexts
+
+    def test_encrypt_many_empty_batch(self):
+        """Empty batches should return empty lists."""
+        encryptor = Encryptor(generate_key())
+
+        assert encryptor.encrypt_many([]) == []
+        assert encryptor.decrypt_many([]) == []
+
     def test_unicode_roundtrip(self):
         """Unicode characters should work."""
         key = generate_key()
@@ -82,6 +129,43 @@ class TestEncryptor:
         assert decrypted == original
 
 
+class TestKeyCache:
+    """Test process-wide key caching."""
+
+    @pytest.fixture
+    def key_loads(self, monkeypatch):
+        from scrubiq.storage import crypto
+
+        calls = []
+
+        def fake_load():
+            calls.append(1)
+            return generate_key()
+
+        crypto.invalidate_key_cache()
+        monkeypatch.setattr(crypto, "_load_or_create_key", fake_load)
+        yield calls
+        crypto.invalidate_key_cache()
+
+    def test_key_loaded_once(self, key_loads):
+        from scrubiq.storage.crypto import get_or_create_key
+
+        first = get_or_create_key()
+        Encryptor()
+
+        assert get_or_create_key() == first
+        assert len(key_loads) == 1
+
+    def test_invalidate_forces_reload(self, key_loads):
+        from scrubiq.storage.crypto import get_or_create_key, invalidate_key_cache
+
+        get_or_create_key()
+        invalidate_key_cache()
+        get_or_create_key()
+
+        assert len(key_loads) == 2
+
+
 class TestAuditLog:
     """Test audit logging."""
 
@@ -108,6 +192,26 @@ class TestAuditLog:
         lines = log_file.read_text().strip().split("\n")
         assert len(lines) == 2
 
+    def test_log_reuses_file_handle(self, audit_log):
+        """Consecutive entries should share one open handle."""
+        audit_log.log(AuditAction.SCAN_START, {})
+        handle = audit_log._fh
+        audit_log.log(AuditAction.SCAN_COMPLETE, {})
+
+        assert audit_log._fh is handle
+
+    def test_close_and_reopen(self, audit_log, tmp_path):
+        """Logging after close should reopen and append."""
+        with audit_log:
+            audit_log.log(AuditAction.SCAN_START, {})
+        assert audit_log._fh is None
+
+        audit_log.log(AuditAction.SCAN_COMPLETE, {})
+        audit_log.flush()
+
+        lines = (tmp_path / "audit.jsonl").read_text().strip().split("\n")
+        assert len(lines) == 2
+
     def test_log_entry_format(self, audit_log, tmp_path):
         """Log entries should be valid JSON."""
         audit_log.log(AuditAction.FINDING_STORE, {"count": 5}, record_count=5)
@@ -121,6 +225,43 @@ class TestAuditLog:
         assert "timestamp" in data
         assert "user" in data
 
+    def test_to_json_matches_to_dict(self):
+        """Serialized entries should decode to the same fields as to_dict."""
+        entry = AuditEntry(
+            timestamp=datetime(2024, 1, 2, 3, 4, 5, 678),
+            action=AuditAction.FINDING_STORE,
+            user="alice",
+            details={"path": "/docs", "nested": {"count": 2}},
+            record_count=2,
+            scan_id="scan-1",
+        )
+
+        assert json.loads(entry.to_json()) == entry.to_dict()
+
+    def test_entry_has_no_instance_dict(self, audit_log):
+        """Entries should be slotted dataclasses."""
+        entry = audit_log.log(AuditAction.SCAN_START, {})
+        assert not hasattr(entry, "__dict__")
+
+    def test_user_resolved_once(self, tmp_path, monkeypatch):
+        """The OS user lookup should be shared across AuditLog instances."""
+        calls = []
+
+        def fake_getuser():
+            calls.append(1)
+            return "alice"
+
+        monkeypatch.setattr("scrubiq.storage.audit.getpass.getuser", fake_getuser)
+        _get_current_user.cache_clear()
+        try:
+            first = AuditLog(str(tmp_path / "a.jsonl"))
+            second = AuditLog(str(tmp_path / "b.jsonl"))
+        finally:
+            _get_current_user.cache_clear()
+
+        assert first._user == second._user == "alice"
+        assert len(calls) == 1
+
     def test_get_entries_returns_all(self, audit_log):
         """Should retrieve all entries."""
         for i in range(5):
@@ -150,6 +291,17 @@ class TestAuditLog:
         entries = audit_log.get_entries(since=past)
         assert len(entries) == 1
 
+    def test_get_entries_skips_unknown_action(self, audit_log, tmp_path):
+        """Lines with an unrecognized action should be skipped."""
+        audit_log.log(AuditAction.SCAN_START, {})
+        audit_log.close()
+        bogus = {"timestamp": datetime.now().isoformat(), "action": "bogus", "user": "u"}
+        with open(tmp_path / "audit.jsonl", "a") as f:
+            f.write(json.dumps({**bogus, "details": {}}) + "\n")
+
+        entries = audit_log.get_entries()
+        assert [e.action for e in entries] == [AuditAction.SCAN_START]
+
     def test_get_stats(self, audit_log):
         """Should compute statistics."""
         audit_log.log(AuditAction.SCAN_START, {})
@@ -162,6 +314,92 @@ class TestAuditLog:
         assert stats["errors"] == 1
         assert "scan_start" in stats["by_action"]
 
+    def test_get_stats_is_incremental(self, audit_log, tmp_path):
+        """Stats should persist a snapshot and pick up later entries."""
+        audit_log.log(AuditAction.SCAN_START, {})
+        assert audit_log.get_stats()["total_entries"] == 1
+        assert (tmp_path / "audit.jsonl.stats.json").exists()
+
+        # A second writer on the same file is folded in on the next read
+        other = AuditLog(str(tmp_path / "audit.jsonl"))
+        other.log(AuditAction.SCAN_COMPLETE, {})
+        other.close()
+
+        stats = audit_log.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["by_action"] == {"scan_start": 1, "scan_complete": 1}
+
+    def test_get_stats_after_truncation(self, audit_log, tmp_path):
+        """A truncated log should rebuild stats from scratch."""
+        for _ in range(3):
+            audit_log.log(AuditAction.SCAN_START, {})
+        assert audit_log.get_stats()["total_entries"] == 3
+
+        audit_log.close()
+        (tmp_path / "audit.jsonl").write_text("")
+        audit_log.log(AuditAction.SCAN_COMPLETE, {})
+
+        stats = audit_log.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["by_action"] == {"scan_complete": 1}
+
+    def test_get_stats_after_replacement_larger_than_snapshot(
+        self, audit_log, tmp_path, monkeypatch
+    ):
+        """A replaced log that already grew past the old offset is rescanned."""
+        monkeypatch.setattr("scrubiq.storage.audit.INDEX_INTERVAL", 2)
+        for _ in range(2):
+            audit_log.log(AuditAction.SCAN_START, {})
+        assert audit_log.get_stats()["total_entries"] == 2
+        audit_log.close()
+
+        replacement = AuditLog(str(tmp_path / "new.jsonl"))
+        for i in range(5):
+            replacement.log(AuditAction.SCAN_COMPLETE, {"num": i})
+        replacement.close()
+        os.replace(tmp_path / "new.jsonl", tmp_path / "audit.jsonl")
+
+        stats = audit_log.get_stats()
+        assert stats["total_entries"] == 5
+        assert stats["by_action"] == {"scan_complete": 5}
+
+        cutoff = audit_log.get_entries()[3].timestamp
+        assert [e.details["num"] for e in audit_log.get_entries(since=cutoff)][-2:] == [3, 4]
+
+    def test_read_only_sidecars_fall_back_to_memory(self, audit_log, tmp_path, monkeypatch):
+        """Readers that can't write sidecars still get stats and entries."""
+        audit_log.log(AuditAction.SCAN_START, {})
+        audit_log.close()
+
+        def deny(*args, **kwargs):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr("scrubiq.storage.audit.tempfile.mkstemp", deny)
+
+        assert audit_log.get_stats()["total_entries"] == 1
+        assert len(audit_log.get_entries(since=datetime(2000, 1, 1))) == 1
+        assert not (tmp_path / "audit.jsonl.stats.json").exists()
+
+    def test_stats_snapshot_leaves_no_temp_files(self, audit_log, tmp_path):
+        audit_log.log(AuditAction.SCAN_START, {})
+        audit_log.get_stats()
+
+        assert (tmp_path / "audit.jsonl.stats.json").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_get_entries_since_uses_index(self, audit_log, tmp_path, monkeypatch):
+        """Entries before `since` should be skipped via index checkpoints."""
+        monkeypatch.setattr("scrubiq.storage.audit.INDEX_INTERVAL", 2)
+        for i in range(6):
+            audit_log.log(AuditAction.SCAN_START, {"num": i})
+
+        cutoff = audit_log.get_entries()[4].timestamp
+        entries = audit_log.get_entries(since=cutoff)
+
+        assert [e.details["num"] for e in entries][-2:] == [4, 5]
+        assert all(e.timestamp >= cutoff for e in entries)
+        assert len((tmp_path / "audit.jsonl.idx").read_text().splitlines()) == 3
+
 
 class TestFindingsDatabase:
     """Test encrypted database storage."""
@@ -192,6 +430,71 @@ class TestFindingsDatabase:
         assert scan["scan_id"] == scan_id
         assert scan["total_files"] == sample_scan_result.total_files
 
+    def test_store_scan_rolls_back_on_error(self, db, sample_scan_result, monkeypatch):
+        """A failure mid-store should leave no partial scan behind."""
+
+        def fail(values):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(db.encryptor, "encrypt_many", fail)
+
+        with pytest.raises(RuntimeError):
+            db.store_scan(sample_scan_result)
+
+        assert db.get_scan(sample_scan_result.scan_id) is None
+        assert db.get_stats()["files"] == 0
+
+        # Connection is usable afterwards
+        monkeypatch.undo()
+        db.store_scan(sample_scan_result)
+        assert db.get_scan(sample_scan_result.scan_id) is not None
+
+    def test_matches_linked_to_their_files(self, db, tmp_path):
+        """Batched inserts should attach each match to the right file."""
+        (tmp_path / "a.txt").write_text("SSN: 078-05-1120")
+        (tmp_path / "b.txt").write_text("nothing here")
+        (tmp_path / "c.txt").write_text("Email: jane.doe@acme-corp.com")
+        scan_id = db.store_scan(Scanner(enable_presidio=False).scan(str(tmp_path)))
+
+        by_file = {}
+        for finding in db.get_findings(scan_id=scan_id):
+            by_file.setdefault(Path(finding["file_path"]).name, set()).add(finding["value"])
+
+        assert "078-05-1120" in by_file["a.txt"]
+        assert "b.txt" not in by_file
+        assert "jane.doe@acme-corp.com" in by_file["c.txt"]
+
+    def test_store_scan_encrypts_in_one_batch(self, db, tmp_path, monkeypatch):
+        """Values and contexts for the whole scan go through one encrypt_many call."""
+        for i in range(3):
+            (tmp_path / f"f{i}.txt").write_text("SSN: 078-05-1120")
+        result = Scanner(enable_presidio=False).scan(str(tmp_path))
+
+        calls = []
+        encrypt_many = db.encryptor.encrypt_many
+
+        def counting(values):
+            calls.append(len(values))
+            return encrypt_many(values)
+
+        monkeypatch.setattr(db.encryptor, "encrypt_many", counting)
+        db.store_scan(result)
+
+        assert calls == [2 * sum(len(f.matches) for f in result.files)]
+
+    def test_get_findings_across_fetch_batches(self, db, tmp_path, monkeypatch):
+        """Findings should stream correctly when split over several fetches."""
+        monkeypatch.setattr("scrubiq.storage.database.FETCH_BATCH_SIZE", 2)
+        for i in range(5):
+            (tmp_path / f"f{i}.txt").write_text("SSN: 078-05-1120")
+        scan_id = db.store_scan(Scanner(enable_presidio=False).scan(str(tmp_path)))
+
+        findings = list(db.get_findings(scan_id=scan_id))
+
+        assert len(findings) >= 5
+        assert all(f["value"] == "078-05-1120" for f in findings if f["entity_type"] == "ssn")
+        assert all("value_encrypted" not in f for f in findings)
+
     def test_findings_encrypted_on_disk(self, db, sample_scan_result, tmp_path):
         """Sensitive values should be encrypted in database."""
         db.store_scan(sample_scan_result)
@@ -233,6 +536,18 @@ class TestFindingsDatabase:
         for f in findings:
             assert "value" not in f or f.get("value") != "078-05-1120"
 
+    def test_finding_fields(self, db, sample_scan_result, tmp_path):
+        """Findings expose match columns plus file info, never ciphertext."""
+        db.store_scan(sample_scan_result)
+
+        finding = next(iter(db.get_findings(entity_type="ssn")))
+
+        assert finding["file_path"] == str(tmp_path / "test.txt")
+        assert finding["value_redacted"] and finding["detector"]
+        assert finding["value"] == "078-05-1120"
+        assert "value_encrypted" not in finding
+        assert "context_encrypted" not in finding
+
     def test_filter_by_entity_type(self, db, sample_scan_result):
         """Should filter findings by entity type."""
         db.store_scan(sample_scan_result)
@@ -272,6 +587,56 @@ class TestFindingsDatabase:
         assert db.get_scan(scan_id) is None
         assert deleted_count >= 0
 
+    def test_delete_and_purge_report_match_counts(self, db, sample_scan_result):
+        """Deleted counts should equal the number of stored matches."""
+        stored = sum(len(f.matches) for f in sample_scan_result.files)
+        scan_id = db.store_scan(sample_scan_result)
+
+        assert db.delete_scan(scan_id) == stored
+        assert db.delete_scan(scan_id) == 0
+
+        db.store_scan(sample_scan_result)
+        assert db.purge_all() == stored
+        assert db.get_stats()["matches"] == 0
+
+    def test_delete_scan_cascades_to_files(self, db, sample_scan_result):
+        """Deleting a scan should remove its file rows too."""
+        scan_id = db.store_scan(sample_scan_result)
+        db.delete_scan(scan_id)
+
+        assert db.get_files(scan_id) == []
+        assert db.get_stats()["files"] == 0
+
+    def test_purge_all_recreates_schema(self, db, sample_scan_result, tmp_path):
+        """Purge should leave an empty, working database and shrink the file."""
+        for i in range(50):
+            (tmp_path / f"bulk{i}.txt").write_text("SSN: 078-05-1120\n" * 20)
+        db.store_scan(Scanner(enable_presidio=False).scan(str(tmp_path)))
+        db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size_before = (tmp_path / "findings.db").stat().st_size
+
+        assert db.purge_all() > 0
+
+        stats = db.get_stats()
+        assert (stats["scans"], stats["files"], stats["matches"]) == (0, 0, 0)
+        assert (tmp_path / "findings.db").stat().st_size < size_before
+
+        index_rows = db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        assert "idx_matches_filter" in {row[0] for row in index_rows}
+        assert db.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+        scan_id = db.store_scan(sample_scan_result)
+        assert db.get_scan(scan_id) is not None
+
+    def test_get_confidences_sorted(self, db, sample_scan_result):
+        """Should return real-match confidences in ascending order."""
+        scan_id = db.store_scan(sample_scan_result)
+
+        confidences = db.get_confidences(scan_id)
+
+        assert len(confidences) == len(list(db.get_findings(scan_id=scan_id)))
+        assert list(confidences) == sorted(confidences)
+
     def test_list_scans(self, db, sample_scan_result):
         """Should list recent scans."""
         db.store_scan(sample_scan_result)
@@ -281,6 +646,21 @@ class TestFindingsDatabase:
         assert len(scans) == 1
         assert scans[0]["scan_id"] == sample_scan_result.scan_id
 
+    def test_streaming_variants_match_lists(self, db, sample_scan_result, monkeypatch):
+        """The *_iter methods should be lazy and agree with the list versions."""
+        monkeypatch.setattr("scrubiq.storage.database.STREAM_BATCH_SIZE", 1)
+        scan_id = db.store_scan(sample_scan_result)
+
+        scans = db.list_scans_iter()
+        files = db.get_files_iter(scan_id)
+        assert not isinstance(scans, list) and not isinstance(files, list)
+
+        assert list(scans) == db.list_scans()
+        assert list(files) == db.get_files(scan_id)
+        assert [f["file_path"] for f in db.get_files_iter(scan_id, only_with_matches=True)] == [
+            str(f.path) for f in sample_scan_result.files if f.has_sensitive_data
+        ]
+
     def test_get_stats(self, db, sample_scan_result):
         """Should return database statistics."""
         db.store_scan(sample_scan_result)
@@ -291,6 +671,25 @@ class TestFindingsDatabase:
         assert stats["files"] == sample_scan_result.total_files
         assert "by_entity_type" in stats
 
+    def test_get_stats_match_counts(self, db, tmp_path):
+        """Grouped match counts should agree with direct per-filter queries."""
+        (tmp_path / "real.txt").write_text("SSN: 078-05-1120, email: jane.doe@acme.com")
+        (tmp_path / "test.txt").write_text("Example: 123-45-6789")
+        db.store_scan(Scanner().scan(str(tmp_path)))
+
+        stats = db.get_stats()
+
+        def count(where):
+            return db.conn.execute(f"SELECT COUNT(*) FROM matches WHERE {where}").fetchone()[0]
+
+        assert stats["matches"] == count("1")
+        assert stats["real_matches"] == count("is_test_data = 0")
+        assert stats["test_data_matches"] == count("is_test_data = 1") > 0
+        assert sum(stats["by_entity_type"].values()) == stats["real_matches"]
+        assert list(stats["by_entity_type"].values()) == sorted(
+            stats["by_entity_type"].values(), reverse=True
+        )
+
     def test_context_manager(self, tmp_path):
         """Should work as context manager."""
         with FindingsDatabase(str(tmp_path / "test.db")) as db:
@@ -300,6 +699,152 @@ class TestFindingsDatabase:
         # Should be closed (accessing conn would fail)
 
 
+class TestDatabaseConnection:
+    """Test connection tuning."""
+
+    def test_default_path_follows_env(self, tmp_path, monkeypatch):
+        """Default path is cached per data dir but still follows the env var."""
+        for var in ("XDG_DATA_HOME", "LOCALAPPDATA"):
+            monkeypatch.setenv(var, str(tmp_path / "a"))
+        first = get_default_db_path()
+        assert first == str(tmp_path / "a" / "scrubiq" / "findings.db")
+        assert get_default_db_path() == first
+        assert (tmp_path / "a" / "scrubiq").is_dir()
+
+        for var in ("XDG_DATA_HOME", "LOCALAPPDATA"):
+            monkeypatch.setenv(var, str(tmp_path / "b"))
+        assert get_default_db_path() == str(tmp_path / "b" / "scrubiq" / "findings.db")
+
+    def test_audit_path_next_to_db(self, tmp_path):
+        """Audit log sits beside the database."""
+        db_path = str(tmp_path / "findings.db")
+        assert get_audit_path(db_path) == str(tmp_path / "findings.audit.jsonl")
+        with FindingsDatabase(db_path) as db:
+            assert str(db.audit.log_path) == get_audit_path(db_path)
+
+    def test_uses_wal(self, tmp_path):
+        """Database should run in WAL mode with relaxed sync."""
+        with FindingsDatabase(str(tmp_path / "findings.db")) as db:
+            assert db.journal_mode == "wal"
+            assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert db.conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_findings_query_uses_composite_index(self, tmp_path):
+        """Filtered findings queries should be served by idx_matches_filter."""
+        with FindingsDatabase(str(tmp_path / "findings.db")) as db:
+            plan = db.conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT * FROM matches m
+                WHERE m.confidence >= ? AND m.scan_id = ? AND m.entity_type = ?
+                AND m.is_test_data = 0
+            """,
+                (0.5, "abc", "ssn"),
+            ).fetchall()
+            index_rows = db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            indexes = {row[0] for row in index_rows}
+
+        assert "idx_matches_filter" in " ".join(row[-1] for row in plan)
+        assert "idx_matches_scan" not in indexes
+
+    def test_close_runs_optimize(self, tmp_path):
+        """Closing should let SQLite refresh planner statistics."""
+        db = FindingsDatabase(str(tmp_path / "findings.db"))
+        statements = []
+        db.conn.set_trace_callback(statements.append)
+
+        db.close()
+
+        assert "PRAGMA optimize" in statements
+
+    def test_migrates_tables_without_cascade(self, tmp_path):
+        """Databases from before ON DELETE CASCADE should be rebuilt in place."""
+        import sqlite3
+
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE scans (scan_id TEXT PRIMARY KEY, started_at TEXT NOT NULL,
+                completed_at TEXT, source_path TEXT NOT NULL, source_type TEXT NOT NULL,
+                total_files INTEGER DEFAULT 0, files_with_matches INTEGER DEFAULT 0,
+                files_errored INTEGER DEFAULT 0, total_matches INTEGER DEFAULT 0, metadata TEXT);
+            CREATE TABLE files (id INTEGER PRIMARY KEY AUTOINCREMENT, scan_id TEXT NOT NULL,
+                path TEXT NOT NULL, source TEXT NOT NULL, size_bytes INTEGER NOT NULL,
+                modified TEXT NOT NULL, has_sensitive_data INTEGER NOT NULL,
+                label_recommendation TEXT, current_label TEXT, error TEXT,
+                scan_time_ms INTEGER DEFAULT 0,
+                FOREIGN KEY (scan_id) REFERENCES scans(scan_id));
+            CREATE TABLE matches (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_id INTEGER NOT NULL, scan_id TEXT NOT NULL, entity_type TEXT NOT NULL,
+                value_encrypted TEXT NOT NULL, value_redacted TEXT NOT NULL,
+                start_pos INTEGER NOT NULL, end_pos INTEGER NOT NULL, confidence REAL NOT NULL,
+                confidence_level TEXT NOT NULL, detector TEXT NOT NULL, context_encrypted TEXT,
+                is_test_data INTEGER NOT NULL, model_version TEXT,
+                FOREIGN KEY (file_id) REFERENCES files(id),
+                FOREIGN KEY (scan_id) REFERENCES scans(scan_id));
+            INSERT INTO scans (scan_id, started_at, source_path, source_type)
+                VALUES ('old1', '2024-01-01', '/docs', 'filesystem');
+            INSERT INTO files (scan_id, path, source, size_bytes, modified, has_sensitive_data)
+                VALUES ('old1', '/docs/a.txt', 'filesystem', 10, '2024-01-01', 1);
+            INSERT INTO matches (file_id, scan_id, entity_type, value_encrypted, value_redacted,
+                start_pos, end_pos, confidence, confidence_level, detector, is_test_data)
+                VALUES (1, 'old1', 'ssn', 'x', '07*******20', 0, 11, 0.9, 'high', 'regex', 0);
+        """
+        )
+        conn.close()
+
+        with FindingsDatabase(db_path) as db:
+            fks = db.conn.execute("PRAGMA foreign_key_list(matches)").fetchall()
+            assert {row[6] for row in fks} == {"CASCADE"}
+            assert db.get_stats()["matches"] == 1
+            assert len(db.get_files("old1")) == 1
+
+            assert db.delete_scan("old1") == 1
+            assert db.get_stats()["files"] == 0
+
+    def test_failed_commit_rolls_back(self, tmp_path):
+        """A COMMIT refused by a reader (rollback journal) shouldn't leave a transaction open."""
+        import sqlite3
+
+        db_path = str(tmp_path / "findings.db")
+        with FindingsDatabase(db_path) as db:
+            db.conn.execute("PRAGMA journal_mode=DELETE")
+            db.conn.execute("PRAGMA busy_timeout=0")
+
+            reader = sqlite3.connect(db_path, isolation_level=None)
+            try:
+                reader.execute("BEGIN")
+                reader.execute("SELECT COUNT(*) FROM scans").fetchone()  # Holds SHARED
+
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    with db._transaction() as cursor:
+                        cursor.execute(
+                            "INSERT INTO scans (scan_id, started_at, source_path, source_type)"
+                            " VALUES ('s1', '2024-01-01', '/docs', 'filesystem')"
+                        )
+                assert not db.conn.in_transaction
+            finally:
+                reader.close()
+
+            with db._transaction() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM scans")
+            assert db.get_stats()["scans"] == 0
+
+    def test_wal_persists_for_other_connections(self, tmp_path):
+        """WAL is a property of the database file, visible to new connections."""
+        import sqlite3
+
+        FindingsDatabase(str(tmp_path / "findings.db")).close()
+
+        conn = sqlite3.connect(str(tmp_path / "findings.db"))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+
 class TestAuditIntegration:
     """Test audit logging is triggered correctly."""
 
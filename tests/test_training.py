@@ -1,5 +1,9 @@
 """Tests for training pipeline."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from scrubiq.training.data import (
@@ -7,6 +11,7 @@ from scrubiq.training.data import (
     Label,
     generate_false_positives,
     FP_TEMPLATES,
+    write_training_dataset,
 )
 
 
@@ -58,6 +63,13 @@ class TestTrainingExample:
         assert restored.label == original.label
         assert restored.entity_type == original.entity_type
 
+    def test_jsonl_bytes_unicode(self):
+        ex = TrainingExample(text="Café [NAME] ✓", label=0, entity_type="name")
+        line = ex.to_jsonl_bytes()
+        assert b"\n" not in line
+        assert json.loads(line) == ex.to_dict()
+        assert TrainingExample.from_jsonl(ex.to_jsonl()) == ex
+
 
 class TestFalsePositiveGeneration:
     """Test synthetic FP generation."""
@@ -87,6 +99,11 @@ class TestFalsePositiveGeneration:
         for ex in fps:
             assert ex.source == "synthetic_fp"
 
+    def test_fp_count_per_type(self):
+        fps = list(generate_false_positives(n_per_type=7, entity_types=["ssn", "email"]))
+        assert [ex.entity_type for ex in fps] == ["ssn"] * 7 + ["email"] * 7
+        assert all(ex.text in FP_TEMPLATES[ex.entity_type] for ex in fps)
+
 
 class TestLabel:
     """Test Label enum."""
@@ -129,6 +146,309 @@ class TestTPFPClassifier:
         assert "[SSN]" in formatted
         assert "078-05-1120" not in formatted
 
+    def test_loaded_model_predicts(self, tpfp_model):
+        texts = ["Employee [SSN] enrolled in benefits", "Example SSN: [SSN]"]
+        results = tpfp_model.predict_batch(texts)
+
+        assert len(results) == 2
+        assert all(0.0 <= r.confidence <= 1.0 for r in results)
+        assert tpfp_model.predict(texts[0]) == results[0]
+
+
+class TestClassifierBackend:
+    """Test inference backend selection (no model needed)."""
+
+    def test_default_backend_is_torch(self):
+        assert TPFPClassifier().backend == "torch"
+
+    def test_onnx_backend_accepted(self):
+        assert TPFPClassifier(backend="onnx").backend == "onnx"
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="backend"):
+            TPFPClassifier(backend="tensorrt")
+
+    def test_precision_defaults_to_fp32(self):
+        assert TPFPClassifier().precision == "fp32"
+        assert TPFPClassifier(precision="fp16").precision == "fp16"
+
+    def test_unknown_precision_rejected(self):
+        with pytest.raises(ValueError, match="precision"):
+            TPFPClassifier(precision="int4")
+
+    def test_format_context_replaces_every_occurrence(self):
+        formatted = TPFPClassifier().format_match_context(
+            context="SSN 078-05-1120 (confirm 078-05-1120)",
+            value="078-05-1120",
+            entity_type="ssn",
+        )
+        assert formatted == "SSN [SSN] (confirm [SSN])"
+
+    def test_format_context_empty_value(self):
+        classifier = TPFPClassifier()
+        assert classifier.format_match_context("SSN on file", "", "ssn") == "SSN on file"
+
+    def test_training_examples_deduplicated(self):
+        from scrubiq.training.model import _dedupe_examples
+
+        examples = [
+            TrainingExample(text="Test SSN: [SSN]", label=0, entity_type="ssn"),
+            TrainingExample(text="[SSN] on payroll", label=1, entity_type="ssn"),
+            TrainingExample(text="Test SSN: [SSN]", label=0, entity_type="ssn"),
+            TrainingExample(text="[SSN] on payroll", label=0, entity_type="ssn"),
+        ]
+        texts, labels = _dedupe_examples(examples)
+        assert texts == ["Test SSN: [SSN]", "[SSN] on payroll"]
+        assert labels == [0, 1]  # First label wins
+
+    def test_train_rejects_unknown_precision(self):
+        with pytest.raises(ValueError, match="precision"):
+            TPFPClassifier().train([], precision="bf16")
+
+
+class _FakeHead:
+    """Logistic-head stand-in: label 1 when the first feature is odd."""
+
+    classes_ = [0, 1]
+
+    def predict(self, embeddings):
+        raise AssertionError("labels should come from predict_proba")
+
+    def predict_proba(self, embeddings):
+        return [[0.2, 0.8] if emb[0] % 2 else [0.9, 0.1] for emb in embeddings]
+
+
+class _FakeSetFitModel:
+    """SetFitModel stand-in that records which texts were encoded."""
+
+    def __init__(self):
+        self.model_head = _FakeHead()
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32):
+        self.encoded.append(list(texts))
+        return [[len(text)] for text in texts]
+
+    def save_pretrained(self, path):
+        pass
+
+    @property
+    def model_body(self):
+        return self
+
+    def eval(self):
+        return self
+
+
+class TestEmbeddingCache:
+    """Test embedding reuse in predict_batch (no real model needed)."""
+
+    @pytest.fixture
+    def classifier(self):
+        classifier = TPFPClassifier()
+        classifier.model = _FakeSetFitModel()
+        return classifier
+
+    def test_repeated_texts_encoded_once(self, classifier):
+        results = classifier.predict_batch(["[SSN] in test", "[SSN] in test", "[SSN] xy"])
+        assert classifier.model.encoded == [["[SSN] in test", "[SSN] xy"]]
+
+        assert [r.is_true_positive for r in results] == [True, True, False]
+        assert [r.confidence for r in results] == [0.8, 0.8, 0.9]
+        assert all(type(r.is_true_positive) is bool for r in results)
+
+        # Second call is served from cache
+        assert classifier.predict("[SSN] xy").confidence == 0.9
+        assert len(classifier.model.encoded) == 1
+
+    def test_concurrent_batches_share_small_cache(self, classifier, monkeypatch):
+        """Evictions by other threads must not break a batch mid-lookup."""
+        monkeypatch.setattr(TPFPClassifier, "EMBEDDING_CACHE_SIZE", 8)
+        texts = [f"[SSN] context {i}" + "x" * (i % 7) for i in range(40)]
+
+        # A real forward pass releases the GIL; let other threads evict meanwhile
+        encode = classifier.model.encode
+
+        def slow_encode(batch, batch_size=32):
+            time.sleep(0.001)
+            return encode(batch, batch_size)
+
+        monkeypatch.setattr(classifier.model, "encode", slow_encode)
+
+        def run(offset):
+            for start in range(0, 400, 3):
+                batch = [texts[(offset + start + j) % 40] for j in range(5)]
+                results = classifier.predict_batch(batch)
+                assert len(results) == 5
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(run, offset) for offset in range(8)]:
+                future.result()  # Re-raises any KeyError from a worker
+
+        assert len(classifier._emb_cache) <= 8
+
+    def test_near_duplicates_share_entry(self, classifier):
+        classifier.predict_batch(["SSN: [SSN] in test", "  ssn:  [SSN]\tin TEST "])
+        assert classifier.model.encoded == [["SSN: [SSN] in test"]]
+
+    def test_exact_keys_when_canonicalization_off(self, classifier, monkeypatch):
+        monkeypatch.setattr(TPFPClassifier, "CANONICAL_CACHE_KEYS", False)
+        classifier.predict_batch(["SSN: [SSN]", "ssn: [SSN]"])
+        assert classifier.model.encoded == [["SSN: [SSN]", "ssn: [SSN]"]]
+
+    def test_head_without_proba_falls_back_to_predict(self, classifier):
+        class LabelOnlyHead:
+            def predict(self, embeddings):
+                return [emb[0] % 2 for emb in embeddings]
+
+        classifier.model.model_head = LabelOnlyHead()
+        results = classifier.predict_batch(["odd", "even"])
+        assert [(r.is_true_positive, r.confidence) for r in results] == [
+            (True, 1.0),
+            (False, 1.0),
+        ]
+
+    def test_cache_persists_across_sessions(self, classifier, tmp_path):
+        pytest.importorskip("numpy")
+
+        classifier.predict_batch(["[SSN] in test", "[EMAIL] demo"])
+        assert classifier.save_embedding_cache(tmp_path) == 2
+
+        warm = TPFPClassifier()
+        warm.model = _FakeSetFitModel()
+        warm._load_embedding_cache(tmp_path)
+        results = warm.predict_batch(["[SSN] in test", "[EMAIL] demo"])
+        assert warm.model.encoded == []
+        assert [r.is_true_positive for r in results] == [True, False]
+
+    def test_unsaved_embeddings_counts_new_encodings(self, classifier, tmp_path):
+        pytest.importorskip("numpy")
+
+        classifier.predict_batch(["[SSN] in test", "[EMAIL] demo", "[SSN] in test"])
+        assert classifier.unsaved_embeddings == 2
+
+        classifier.save_embedding_cache(tmp_path)
+        assert classifier.unsaved_embeddings == 0
+
+        classifier.predict("[SSN] in test")  # Cache hit
+        assert classifier.unsaved_embeddings == 0
+
+    def test_persisted_cache_ignored_for_other_setup(self, classifier, tmp_path):
+        pytest.importorskip("numpy")
+
+        classifier.predict("[SSN] in test")
+        classifier.save_embedding_cache(tmp_path)
+
+        other = TPFPClassifier(precision="fp16")
+        other._load_embedding_cache(tmp_path)
+        assert len(other._emb_cache) == 0
+
+    def test_save_load_round_trip_restores_cache(self, classifier, tmp_path, monkeypatch):
+        """load() reads the cache save() wrote, keyed to the saved base model."""
+        pytest.importorskip("numpy")
+        import scrubiq.training.model as model_mod
+
+        monkeypatch.setattr(model_mod, "HAS_SETFIT", True)
+        from_pretrained = staticmethod(lambda path: _FakeSetFitModel())
+        monkeypatch.setattr(
+            model_mod, "SetFitModel", type("SetFitModel", (), {"from_pretrained": from_pretrained})
+        )
+
+        classifier.base_model = "sentence-transformers/all-mpnet-base-v2"
+        classifier.predict_batch(["[SSN] in test", "[EMAIL] demo"])
+        classifier.save(tmp_path)
+
+        warm = TPFPClassifier.load(tmp_path)
+        assert warm.base_model == classifier.base_model
+        results = warm.predict_batch(["[SSN] in test", "[EMAIL] demo"])
+        assert warm.model.encoded == []
+        assert [r.is_true_positive for r in results] == [True, False]
+
+    def test_empty_cache_removes_stale_file(self, classifier, tmp_path):
+        pytest.importorskip("numpy")
+
+        classifier.predict("[SSN] in test")
+        classifier.save_embedding_cache(tmp_path)
+        assert (tmp_path / TPFPClassifier.EMBEDDING_CACHE_FILE).exists()
+
+        classifier._emb_cache.clear()
+        assert classifier.save_embedding_cache(tmp_path) == 0
+        assert not (tmp_path / TPFPClassifier.EMBEDDING_CACHE_FILE).exists()
+
+    def test_predict_deferred_batches(self, classifier, monkeypatch):
+        monkeypatch.setattr(TPFPClassifier, "DEFER_BATCH_SIZE", 2)
+
+        first = classifier.predict_deferred("[SSN] in test")
+        assert not first.done()
+        second = classifier.predict_deferred("[SSN] xy")
+        assert first.done() and second.done()
+        assert classifier.model.encoded == [["[SSN] in test", "[SSN] xy"]]
+
+        # A partial batch runs as soon as a result is needed
+        third = classifier.predict_deferred("[EMAIL] ok")
+        assert not third.done()
+        assert third.result().is_true_positive is False
+        assert classifier.model.encoded[-1] == ["[EMAIL] ok"]
+
+        assert first.result().is_true_positive is True
+        assert second.result().confidence == 0.9
+
+    def test_predict_deferred_resolves_from_another_thread(self, classifier):
+        """result() flushes the owning thread's queue, not the caller's."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(classifier.predict_deferred, "[SSN] xy").result()
+
+        assert not future.done()
+        assert future.result(timeout=5).confidence == 0.9
+        assert classifier.model.encoded == [["[SSN] xy"]]
+
+    def test_predict_deferred_propagates_errors(self):
+        classifier = TPFPClassifier()  # No model loaded
+        future = classifier.predict_deferred("[SSN] in test")
+        classifier.flush_deferred()
+        with pytest.raises(ValueError, match="No model loaded"):
+            future.result()
+
+    def test_save_writes_metadata(self, classifier, tmp_path):
+        classifier.save(tmp_path)
+        meta = json.loads((tmp_path / "scrubiq_meta.json").read_text())
+        assert meta == {"base_model": TPFPClassifier.DEFAULT_MODEL, "version": "1.0.0"}
+        assert classifier.model_path == str(tmp_path)
+
+    def test_logistic_head_fast_path_matches_sklearn(self, classifier):
+        np = pytest.importorskip("numpy")
+        linear_model = pytest.importorskip("sklearn.linear_model")
+
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(40, 4)).astype(np.float32)
+        y = (X[:, 0] > 0).astype(int)
+        head = linear_model.LogisticRegression().fit(X, y)
+
+        texts = [f"text {i}" for i in range(len(X))]
+        classifier.model.model_head = head
+        classifier.model.encode = lambda batch, batch_size=32: [X[int(t.split()[1])] for t in batch]
+
+        results = classifier.predict_batch(texts)
+        expected = head.predict_proba(X)
+
+        assert classifier._head_weights[1] is not None  # fast path taken
+        assert [r.is_true_positive for r in results] == (head.predict(X) == 1).tolist()
+        assert [r.confidence for r in results] == pytest.approx(
+            expected.max(axis=1).tolist(), abs=1e-6
+        )
+        assert classifier._head_weights[1][0].dtype == np.float32
+
+    def test_cache_is_bounded(self, classifier, monkeypatch):
+        monkeypatch.setattr(TPFPClassifier, "EMBEDDING_CACHE_SIZE", 2)
+
+        results = classifier.predict_batch(["a", "bb", "ccc"])
+        assert len(results) == 3
+        assert len(classifier._emb_cache) == 2
+
+        # Oldest entry was evicted and must be re-encoded
+        classifier.predict("a")
+        assert classifier.model.encoded[-1] == ["a"]
+
 
 class TestFilterResult:
     """Test FilterResult dataclass."""
@@ -145,6 +465,14 @@ class TestFilterResult:
         assert result.is_false_positive
         assert result.confidence == 0.88
 
+    def test_slotted_and_frozen(self):
+        import dataclasses
+
+        result = FilterResult(is_true_positive=True, confidence=0.5)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.confidence = 0.9
+
 
 # Integration test with mock data
 class TestDataPipeline:
@@ -158,6 +486,23 @@ class TestDataPipeline:
         examples = list(load_user_feedback("/nonexistent/path.jsonl"))
         assert examples == []  # Empty list, no error
 
+    def test_load_user_feedback(self, tmp_path):
+        """Should map TP/FP verdicts to labels and skip everything else."""
+        from scrubiq.training.data import load_user_feedback
+
+        records = [
+            {"verdict": "TP", "context": "SSN [SSN] on file", "entity_type": "ssn"},
+            {"verdict": "SKIP", "context": "ignored", "entity_type": "ssn"},
+            {"verdict": "FP", "context": "Café [EMAIL] example", "entity_type": "email"},
+        ]
+        path = tmp_path / "reviews.jsonl"
+        path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n", encoding="utf-8")
+
+        examples = list(load_user_feedback(str(path)))
+        assert [(ex.label, ex.entity_type) for ex in examples] == [(1, "ssn"), (0, "email")]
+        assert examples[1].text == "Café [EMAIL] example"
+        assert all(ex.source == "user_feedback" for ex in examples)
+
     def test_entity_map_coverage(self):
         """Nemotron entity map should cover common types."""
         from scrubiq.training.data import NEMOTRON_ENTITY_MAP
@@ -168,3 +513,74 @@ class TestDataPipeline:
         assert NEMOTRON_ENTITY_MAP.get("EMAIL") == "email"
         assert NEMOTRON_ENTITY_MAP.get("PHONE") == "phone"
         assert NEMOTRON_ENTITY_MAP.get("CREDIT_CARD") == "credit_card"
+
+    def test_load_nemotron_jsonl(self, tmp_path):
+        """Should read a raw JSONL export without the datasets library."""
+        from scrubiq.training.data import load_nemotron_pii
+
+        text = "Employee SSN 078-05-1120 on file, email bob@corp.com"
+        records = [
+            {
+                "text": text,
+                "entities": [
+                    {"type": "SSN", "start": 13, "end": 24},
+                    {"type": "EMAIL", "start": 40, "end": 52},
+                ],
+            },
+            {"text": "nothing here", "entities": []},
+        ]
+        path = tmp_path / "nemotron.jsonl"
+        path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+
+        examples = list(load_nemotron_pii(path=str(path)))
+        assert [ex.entity_type for ex in examples] == ["ssn", "email"]
+        assert examples[0].text == "Employee SSN [SSN] on file, email bob@corp.com"
+        assert all(ex.label == 1 and ex.source == "nemotron" for ex in examples)
+
+        assert len(list(load_nemotron_pii(max_examples=1, path=str(path)))) == 1
+        emails = list(load_nemotron_pii(entity_types=["email"], path=str(path)))
+        assert [ex.text for ex in emails] == ["Employee SSN 078-05-1120 on file, email [EMAIL]"]
+
+    def test_nemotron_context_window(self, tmp_path):
+        """Context should keep at most 50 chars either side of the entity."""
+        from scrubiq.training.data import load_nemotron_pii
+
+        text = "a" * 80 + "078-05-1120" + "b" * 80
+        record = {"text": text, "entities": [{"type": "SSN", "start": 80, "end": 91}]}
+        path = tmp_path / "nemotron.jsonl"
+        path.write_text(json.dumps(record) + "\n")
+
+        (example,) = load_nemotron_pii(path=str(path))
+        assert example.text == "a" * 50 + "[SSN]" + "b" * 50
+
+
+class TestWriteTrainingDataset:
+    """Test streaming dataset output."""
+
+    def test_writes_shuffled_jsonl(self, tmp_path):
+        out = tmp_path / "train.jsonl"
+        count = write_training_dataset(
+            str(out),
+            nemotron_examples=0,
+            fp_per_type=4,
+            include_user_feedback=False,
+        )
+
+        lines = out.read_bytes().splitlines()
+        assert count == len(lines) == 4 * len(FP_TEMPLATES)
+
+        examples = [TrainingExample.from_jsonl(line) for line in lines]
+        assert all(ex.label == 0 for ex in examples)
+        by_type = {t: sum(ex.entity_type == t for ex in examples) for t in FP_TEMPLATES}
+        assert set(by_type.values()) == {4}
+
+    def test_empty_dataset(self, tmp_path):
+        out = tmp_path / "train.jsonl"
+        count = write_training_dataset(
+            str(out),
+            nemotron_examples=0,
+            fp_per_type=0,
+            include_user_feedback=False,
+        )
+        assert count == 0
+        assert out.read_bytes() == b""
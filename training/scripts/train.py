@@ -14,6 +14,9 @@ Usage:
         --nemotron-examples 10000 \
         --fp-per-type 200 \
         --output ./models/tpfp-v1
+
+    # Read a raw JSONL export instead of going through datasets
+    python -m scrubiq.training.scripts.train --nemotron-path ./nemotron_pii.jsonl
 """
 
 import argparse
@@ -31,6 +34,12 @@ def main():
         default=5000,
         help="Max examples from Nemotron-PII (default: 5000)"
     )
+    parser.add_argument(
+        "--nemotron-path",
+        type=str,
+        default=None,
+        help="Nemotron-PII JSONL export to read directly (default: load via datasets)"
+    )
     parser.add_argument(
         "--fp-per-type",
         type=int,
@@ -70,7 +79,7 @@ def main():
     
     # Import here to catch missing dependencies early
     try:
-        from scrubiq.training.data import prepare_training_dataset
+        from scrubiq.training.data import prepare_training_dataset, write_training_dataset
         from scrubiq.training.model import TPFPClassifier, is_available
     except ImportError as e:
         print(f"Error importing training modules: {e}")
@@ -93,18 +102,27 @@ def main():
     
     include_feedback = args.include_feedback and not args.no_feedback
     
+    if args.data_only:
+        # Stream straight to disk; nothing needs to stay in memory
+        count = write_training_dataset(
+            str(data_path),
+            nemotron_examples=args.nemotron_examples,
+            fp_per_type=args.fp_per_type,
+            include_user_feedback=include_feedback,
+            nemotron_path=args.nemotron_path,
+        )
+        print(f"\nWrote {count} examples to: {data_path}")
+        print("Run without --data-only to train.")
+        sys.exit(0)
+    
     examples = prepare_training_dataset(
         nemotron_examples=args.nemotron_examples,
         fp_per_type=args.fp_per_type,
         include_user_feedback=include_feedback,
         output_path=str(data_path),
+        nemotron_path=args.nemotron_path,
     )
     
-    if args.data_only:
-        print(f"\nData prepared at: {data_path}")
-        print("Run without --data-only to train.")
-        sys.exit(0)
-    
     # Train
     print("\n" + "=" * 60)
     print("STEP 2: Training TP/FP Classifier")